@@ -0,0 +1,5 @@
+"""Performance benchmarks for the Trello application.
+
+Each module is a standalone script, run from the `src` directory, e.g.:
+    python -m benchmarks.query_plans --boards 100000
+"""
@@ -0,0 +1,69 @@
+"""Size and latency of the JSON API against the HTML board pages.
+
+Seeds a throwaway database and requests the same data through the HTML pages
+and the JSON endpoints with Django's test client, printing the body size
+(raw, gzip and, when the `brotli` package is installed, brotli) and the
+median response time of each.
+
+Usage:
+    python -m benchmarks.api_vs_html --boards 5000
+"""
+
+import argparse
+import gzip
+
+from benchmarks.common import (
+    benchmark_database,
+    measure,
+    seed_boards,
+    setup_django,
+)
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+PATHS = {
+    "html listing": "/boards/",
+    "json listing": "/api/boards/",
+    "json listing (title only)": "/api/boards/?fields=title",
+    "html board": "/boards/Board%201/",
+    "json board": "/api/boards/by-title/Board%201/",
+}
+
+
+def report(label: str, path: str) -> None:
+    """
+    Request `path` and print its sizes and median latency.
+
+    Args:
+        label (str): The name of the page.
+        path (str): The URL to request.
+    """
+    from django.test import Client  # pylint: disable=C0415
+
+    client = Client()
+    body = client.get(path).content
+    sizes = f"{len(body):>8,} B raw {len(gzip.compress(body)):>7,} B gzip"
+    if brotli is not None:
+        sizes += f" {len(brotli.compress(body)):>7,} B br"
+    latency = measure(lambda: client.get(path))
+    print(f"{label:>26}: {sizes} {latency:8.2f} ms")
+
+
+def main() -> None:
+    """Parse the command line and compare the HTML and JSON responses."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        seed_boards(args.boards)
+        for label, path in PATHS.items():
+            report(label, path)
+
+
+if __name__ == "__main__":
+    main()
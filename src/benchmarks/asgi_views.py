@@ -0,0 +1,149 @@
+"""Load test of the sync and async board views under uvicorn.
+
+Seeds a throwaway SQLite database, then starts uvicorn twice on the project's
+ASGI application: once with the sync views (run through Django's thread-pool
+adapter) and once with `ASYNC_VIEWS=1`. Each server is loaded with keep-alive
+clients alternating between the boards listing and a board page, and the
+throughput and latency percentiles are printed side by side.
+
+Requires uvicorn (see requirements-dev.txt).
+
+Usage:
+    python -m benchmarks.asgi_views --boards 10000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from benchmarks.common import seed_boards, setup_django
+from benchmarks.loadgen import run_load
+
+HOST = "127.0.0.1"
+PATHS = ["/boards/", "/boards/Board%201/"]
+
+
+def free_port() -> int:
+    """
+    Return a TCP port that is currently free on the loopback interface.
+
+    Returns:
+        int: The port number.
+    """
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 20.0) -> None:
+    """
+    Block until a server accepts connections on `port`.
+
+    Args:
+        port (int): The port to poll.
+        timeout (float): The maximum time to wait, in seconds.
+
+    Raises:
+        TimeoutError: If nothing listens on the port in time.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex((HOST, port)) == 0:
+                return
+        time.sleep(0.1)
+    raise TimeoutError(f"Server did not start on port {port}")
+
+
+def prepare_database(path: Path, count: int) -> None:
+    """
+    Create, migrate and seed the benchmark database.
+
+    Args:
+        path (Path): The SQLite file to create.
+        count (int): The number of boards to seed.
+    """
+    os.environ["DATABASE_NAME"] = str(path)
+    setup_django()
+    from django.core.management import call_command  # pylint: disable=C0415
+
+    call_command("migrate", verbosity=0)
+    seed_boards(count)
+
+
+@contextmanager
+def serve(env: dict[str, str]) -> Iterator[int]:
+    """
+    Run uvicorn with `env` for the duration of the block.
+
+    Args:
+        env (dict[str, str]): The environment of the server process.
+
+    Yields:
+        int: The port the server listens on.
+    """
+    port = free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "trello.asgi:application",
+        "--host", HOST, "--port", str(port),
+        "--no-access-log", "--log-level", "warning",
+    ]  # fmt: skip
+    with subprocess.Popen(command, env=env) as server:
+        try:
+            wait_for_port(port)
+            yield port
+        finally:
+            server.terminate()
+
+
+def run_server(env: dict[str, str], args: argparse.Namespace) -> dict:
+    """
+    Start uvicorn with `env`, load it and stop it.
+
+    Args:
+        env (dict[str, str]): The environment of the server process.
+        args (argparse.Namespace): The command line options.
+
+    Returns:
+        dict: The summary of the load run.
+    """
+    with serve(env) as port:
+        result = asyncio.run(
+            run_load(HOST, port, PATHS, args.concurrency, args.duration)
+        )
+    return result.summary()
+
+
+def main() -> None:
+    """Parse the command line and compare the sync and async views."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.sqlite3"
+        prepare_database(database, args.boards)
+        env = {**os.environ, "DATABASE_NAME": str(database)}
+        env["DJANGO_DEBUG"] = "false"
+        env["STATIC_MANIFEST"] = "false"
+        results = {
+            "sync": run_server({**env, "ASYNC_VIEWS": "false"}, args),
+            "async": run_server({**env, "ASYNC_VIEWS": "true"}, args),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Latency of title autocomplete lookups.
+
+Seeds a throwaway database, builds the in-memory title index once, then
+times prefix suggestions and existence checks and prints their median
+latency in microseconds.
+
+Usage:
+    python -m benchmarks.autocomplete --boards 1000000
+"""
+
+import time
+
+from functools import partial
+from typing import Callable
+
+from benchmarks.common import (
+    measure,
+    run_with_boards,
+    seed_boards,
+)
+
+
+def run(boards: int) -> None:
+    """
+    Seed the boards and print the lookup latencies.
+
+    Args:
+        boards (int): The number of boards.
+    """
+    from trello.autocomplete import title_index  # pylint: disable=C0415
+
+    seed_boards(boards)
+    start = time.perf_counter()
+    title_index.exists("")
+    print(f"index built in {time.perf_counter() - start:.2f} s")
+    lookups: dict[str, Callable[[], object]] = {
+        "suggest 'b'": partial(title_index.suggest, "b"),
+        "suggest 'board 12'": partial(title_index.suggest, "board 12"),
+        "suggest miss": partial(title_index.suggest, "zzz"),
+        "exists hit": partial(title_index.exists, f"Board {boards // 2}"),
+        "exists miss": partial(title_index.exists, "Nope"),
+    }
+    for label, lookup in lookups.items():
+        print(f"{label:>20}: {measure(lookup, repeat=1000) * 1000:8.1f} us")
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    run_with_boards(__doc__, run, default=1_000_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Cost of idle board event streams, and how fast an event reaches them.
+
+Starts uvicorn on the project's ASGI application with a throwaway SQLite
+database, opens `--connections` event streams at `/api/boards/events/`, and
+prints how much memory the server process grew by per open stream. Then it
+creates boards through the boards page, one at a time, and prints how long
+each creation took to reach every stream (p50, p99 and the last stream).
+
+Requires uvicorn (see requirements-dev.txt).
+
+Usage:
+    python -m benchmarks.board_events --connections 5000 --events 10
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from pathlib import Path
+
+from benchmarks.asgi_views import HOST, prepare_database, serve
+
+EVENTS_PATH = "/api/boards/events/"
+# Any well-formed token is accepted when the cookie and header agree.
+CSRF_TOKEN = "b" * 32
+
+
+def server_rss_kib() -> int:
+    """
+    Return the resident memory of the server, the child of this process.
+
+    Returns:
+        int: The resident set size in KiB, or 0 when it is not found.
+    """
+    for entry in Path("/proc").iterdir():
+        try:
+            status = (entry / "status").read_text()
+        except (OSError, ValueError):
+            continue
+        fields = dict(
+            line.split(":", 1) for line in status.splitlines() if ":" in line
+        )
+        if int(fields.get("PPid", "0")) == os.getpid():
+            return int(fields["VmRSS"].split()[0])
+    return 0
+
+
+async def open_stream(
+    port: int,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Open an event stream and wait for its first part.
+
+    Args:
+        port (int): The port of the server.
+
+    Returns:
+        tuple: The reader and writer of the connection.
+    """
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(
+        f"GET {EVENTS_PATH} HTTP/1.1\r\nHost: {HOST}\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await reader.readuntil(b"retry:")
+    return reader, writer
+
+
+async def create_board(port: int, title: str) -> None:
+    """
+    Create a board through the boards page.
+
+    Args:
+        port (int): The port of the server.
+        title (str): The title of the board.
+    """
+    body = f"board_title={title}".encode()
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(
+        f"POST /boards/ HTTP/1.1\r\nHost: {HOST}\r\n"
+        f"Cookie: csrftoken={CSRF_TOKEN}\r\nX-CSRFToken: {CSRF_TOKEN}\r\n"
+        "Content-Type: application/x-www-form-urlencoded\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+        + body
+    )
+    status = await reader.readline()
+    writer.close()
+    if b" 302 " not in status:
+        raise RuntimeError(f"Creating {title} failed: {status!r}")
+
+
+async def measure(port: int, connections: int, events: int) -> None:
+    """
+    Open the streams, then time the delivery of each event to all of them.
+
+    Args:
+        port (int): The port of the server.
+        connections (int): The number of streams to open.
+        events (int): The number of boards to create.
+    """
+    before = server_rss_kib()
+    streams = []
+    for start in range(0, connections, 500):
+        batch = min(500, connections - start)
+        streams += await asyncio.gather(
+            *(open_stream(port) for _ in range(batch))
+        )
+    after = server_rss_kib()
+    print(
+        f"{connections} streams: server RSS {before / 1024:.1f} -> "
+        f"{after / 1024:.1f} MiB, "
+        f"{(after - before) / max(connections, 1):.1f} KiB per stream"
+    )
+
+    for number in range(events):
+        started = time.perf_counter()
+        await create_board(port, f"Live {number}")
+        latencies = await asyncio.gather(
+            *(receive(reader, started) for reader, _ in streams)
+        )
+        latencies.sort()
+        print(
+            f"event {number}: p50 {statistics.median(latencies):7.1f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99) - 1]:7.1f} ms, "
+            f"last {latencies[-1]:7.1f} ms"
+        )
+    for _, writer in streams:
+        writer.close()
+
+
+async def receive(reader: asyncio.StreamReader, started: float) -> float:
+    """
+    Wait for the next board creation on a stream.
+
+    Args:
+        reader (asyncio.StreamReader): The stream.
+        started (float): The `perf_counter` value when the board was sent.
+
+    Returns:
+        float: The delay before the event arrived, in milliseconds.
+    """
+    await reader.readuntil(b"event: created")
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_DEBUG", "false")
+    # Streams stay open much longer than any request should.
+    os.environ.setdefault("SLOW_REQUEST_MS", "3600000")
+    with tempfile.TemporaryDirectory() as directory:
+        prepare_database(Path(directory) / "bench.sqlite3", 100)
+        with serve(dict(os.environ)) as port:
+            asyncio.run(measure(port, args.connections, args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Cost of dragging boards into a new order.
+
+Seeds a throwaway database with evenly ranked boards, then moves random
+boards next to random other boards with `trello.services.move_board` and
+prints the moves/sec, the number of queries and rows written per move, and
+how long the ranks grew before and after `rebalance_ranks`.
+
+Usage:
+    python -m benchmarks.board_moves --boards 5000 --moves 10000
+"""
+
+import argparse
+import random
+import time
+
+from collections import Counter
+
+from benchmarks.common import benchmark_database, seed_boards, setup_django
+
+
+class StatementCounter:
+    """A database execute wrapper counting statements by kind."""
+
+    def __init__(self) -> None:
+        """Start with no statements counted."""
+        self.counts: Counter[str] = Counter()
+
+    def __call__(  # pylint: disable=R0913,R0917
+        self, execute, sql, params, many, context
+    ):
+        """
+        Count `sql` by its first keyword and run it.
+
+        Args:
+            execute (Callable): The next wrapper or the actual execution.
+            sql (str): The statement.
+            params: The parameters of the statement.
+            many (bool): Whether this is an `executemany` call.
+            context (dict): The connection and cursor.
+
+        Returns:
+            The result of `execute`.
+        """
+        self.counts[sql.split(None, 1)[0].upper()] += 1
+        return execute(sql, params, many, context)
+
+
+def time_moves(moves: int, seed: int) -> tuple[float, StatementCounter]:
+    """
+    Move random boards right after random other boards.
+
+    Args:
+        moves (int): The number of moves.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        tuple[float, StatementCounter]: The elapsed seconds and the
+            statements run by `move_board`.
+    """
+    # pylint: disable=C0415
+    from django.db import connection
+
+    from trello.models import Board
+    from trello.services import move_board
+
+    everything = list(Board.objects.all())
+    generator = random.Random(seed)
+    counter = StatementCounter()
+    elapsed = 0.0
+    for _ in range(moves):
+        board, anchor = generator.sample(everything, 2)
+        # A request would load the anchor by title; not part of the move.
+        anchor.refresh_from_db(fields=["rank"])
+        with connection.execute_wrapper(counter):
+            start = time.perf_counter()
+            move_board(board, after=anchor)
+            elapsed += time.perf_counter() - start
+    return elapsed, counter
+
+
+def run(boards: int, moves: int, seed: int) -> None:
+    """
+    Move boards at random and print the cost per move.
+
+    Args:
+        boards (int): The number of boards to seed.
+        moves (int): The number of moves.
+        seed (int): The seed of the random generator.
+    """
+    # pylint: disable=C0415
+    from trello.management.commands.rebalance_ranks import longest_rank
+    from trello.services import rebalance_ranks
+
+    seed_boards(boards)
+    elapsed, counter = time_moves(moves, seed)
+    print(f"{moves:,} moves over {boards:,} boards")
+    print(f"  moves/sec:           {moves / elapsed:12,.0f}")
+    for kind in ("SELECT", "UPDATE"):
+        print(f"  {kind}s per move:    {counter.counts[kind] / moves:12.2f}")
+    print(f"  longest rank:        {longest_rank():12d}")
+    start = time.perf_counter()
+    rebalance_ranks()
+    elapsed = time.perf_counter() - start
+    print(f"  after rebalancing:   {longest_rank():12d} ({elapsed:.2f} s)")
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=5000)
+    parser.add_argument("--moves", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.boards, args.moves, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Throughput of bulk board imports against one-by-one creation.
+
+Imports the same list of titles (with a share of duplicates) once through a
+`get_or_create` per board, as `CreateBoardView.post` used to, and once through
+`trello.services.import_boards`, and prints boards/sec for both.
+
+Usage:
+    python -m benchmarks.bulk_import --boards 20000
+"""
+
+import argparse
+import time
+
+from typing import Callable
+
+from benchmarks.common import benchmark_database, setup_django
+
+
+def one_by_one(titles: list[str]) -> None:
+    """
+    Create boards with one `get_or_create` per title.
+
+    Args:
+        titles (list[str]): The titles to import.
+    """
+    from trello.models import Board, normalize_title  # pylint: disable=C0415
+
+    for title in titles:
+        Board.objects.get_or_create(
+            normalized_title=normalize_title(title), defaults={"title": title}
+        )
+
+
+def bulk(titles: list[str]) -> None:
+    """
+    Create boards with `import_boards`.
+
+    Args:
+        titles (list[str]): The titles to import.
+    """
+    from trello.services import import_boards  # pylint: disable=C0415
+
+    import_boards(titles)
+
+
+def run(label: str, importer: Callable[[list[str]], None], count: int) -> None:
+    """
+    Import `count` titles on an empty table and print the throughput.
+
+    Args:
+        label (str): The name of the import strategy.
+        importer (Callable): The function importing the titles.
+        count (int): The number of titles to import.
+    """
+    from trello.models import Board  # pylint: disable=C0415
+
+    Board.objects.all().delete()
+    # Every tenth title repeats an earlier one with different casing.
+    titles = [
+        f"board {i - 1}".upper() if i % 10 == 9 else f"Board {i}"
+        for i in range(count)
+    ]
+    start = time.perf_counter()
+    importer(titles)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>12}: {count / elapsed:12,.0f} boards/sec ({elapsed:.2f} s)")
+
+
+def main() -> None:
+    """Parse the command line and run both import strategies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=20_000)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run("one-by-one", one_by_one, args.boards)
+        run("bulk", bulk, args.boards)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Shared helpers for the benchmark scripts."""
+
+import argparse
+import os
+import statistics
+import time
+
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import django
+
+
+def setup_django() -> None:
+    """Configure Django with the project settings."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "trello.settings")
+    django.setup()
+
+
+@contextmanager
+def benchmark_database() -> Iterator[None]:
+    """
+    Run the enclosed block against a throwaway, fully migrated database.
+
+    Yields:
+        None: Control while the temporary database is active.
+    """
+    from django.db import connection  # pylint: disable=C0415
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def seed_boards(count: int) -> None:
+    """
+    Insert `count` boards titled "Board 0" to "Board <count - 1>".
+
+    Args:
+        count (int): The number of boards to create.
+    """
+    from trello.seeding import seed_boards as load  # pylint: disable=C0415
+
+    load(count)
+
+
+def measure(func: Callable[[], object], repeat: int = 50) -> float:
+    """
+    Time `func` and return its median duration.
+
+    Args:
+        func (Callable): The function to time.
+        repeat (int): The number of calls to time.
+
+    Returns:
+        float: The median duration in milliseconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def run_with_boards(
+    description: Optional[str], run: Callable[[int], None], default: int
+) -> None:
+    """
+    Parse `--boards` and call `run` with it on a throwaway database.
+
+    Args:
+        description (str | None): The help text of the script.
+        run (Callable[[int], None]): The benchmark, given the board count.
+        default (int): The default number of boards.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--boards", type=int, default=default)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.boards)
@@ -0,0 +1,145 @@
+"""Concurrent board creation with `get_or_create` against the upsert.
+
+Creates a migrated SQLite database in a temporary file and has a pool of
+threads create boards as fast as they can, every title being submitted
+twice in random order, so that requests for the same title race each other.
+This runs three times: with `get_or_create`, as the boards page used to,
+with `trello.services.create_board`, and with POSTs to the boards page
+through Django's test client. For each run the creates/sec, the failed
+requests (exceptions or 5xx responses, the 500s users would see) and
+the boards sharing a title are printed.
+
+Usage:
+    python -m benchmarks.concurrent_creates --titles 2500 --threads 16
+"""
+
+import argparse
+import io
+import random
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.asgi_views import prepare_database
+
+
+def get_or_create(title: str) -> None:
+    """
+    Create a board with `get_or_create`.
+
+    Args:
+        title (str): The title of the board.
+    """
+    from trello.models import Board, normalize_title  # pylint: disable=C0415
+
+    Board.objects.get_or_create(
+        normalized_title=normalize_title(title), defaults={"title": title}
+    )
+
+
+def upsert(title: str) -> None:
+    """
+    Create a board with `create_board`.
+
+    Args:
+        title (str): The title of the board.
+    """
+    from trello.services import create_board  # pylint: disable=C0415
+
+    create_board(title)
+
+
+def post(title: str) -> None:
+    """
+    Create a board by posting the title form of the boards page.
+
+    Args:
+        title (str): The title of the board.
+
+    Raises:
+        RuntimeError: If the page answers with a server error.
+    """
+    from django.test import Client  # pylint: disable=C0415
+
+    client = Client(raise_request_exception=False)
+    response = client.post("/boards/", {"board_title": title})
+    if response.status_code >= 500:
+        raise RuntimeError(f"HTTP {response.status_code}")
+
+
+def attempt(create: Callable[[str], None], title: str) -> bool:
+    """
+    Create a board from a worker thread, which keeps its connection.
+
+    Args:
+        create (Callable[[str], None]): The creation strategy.
+        title (str): The title of the board.
+
+    Returns:
+        bool: Whether the creation failed.
+    """
+    try:
+        create(title)
+    except Exception:  # pylint: disable=W0718
+        return True
+    return False
+
+
+def run(label: str, create: Callable[[str], None], args: argparse.Namespace):
+    """
+    Race `create` over every title on an empty table and print the outcome.
+
+    Args:
+        label (str): The name of the creation strategy.
+        create (Callable[[str], None]): The creation strategy.
+        args (argparse.Namespace): The command line options.
+    """
+    # pylint: disable=C0415
+    from django.core.management import call_command
+    from django.db.models import Count
+
+    from trello.models import Board
+
+    Board.objects.all().delete()
+    call_command("rebuild_search_index", stdout=io.StringIO())
+    titles = [f"Board {i}" for i in range(args.titles)] * 2
+    random.Random(0).shuffle(titles)
+    tasks = [create] * len(titles)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        failures = sum(pool.map(attempt, tasks, titles))
+    elapsed = time.perf_counter() - start
+
+    duplicates = (
+        Board.objects.values("normalized_title")
+        .annotate(copies=Count("pk"))
+        .filter(copies__gt=1)
+        .count()
+    )
+    print(
+        f"{label:>14}: {len(titles) / elapsed:8,.0f} creates/sec "
+        f"{failures:>5} failed {duplicates:>3} duplicated "
+        f"{Board.objects.count():>6} boards"
+    )
+
+
+def main() -> None:
+    """Parse the command line and race every creation strategy."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--titles", type=int, default=2500)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        prepare_database(Path(directory) / "bench.sqlite3", 0)
+        run("get_or_create", get_or_create, args)
+        run("create_board", upsert, args)
+        run("POST /boards/", post, args)
+
+
+if __name__ == "__main__":
+    main()
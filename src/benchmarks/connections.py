@@ -0,0 +1,146 @@
+"""Requests per second with and without reused database connections.
+
+Seeds a database, then sends requests for the boards listing and for
+uncached board pages straight to Django's WSGI handler, one after another,
+so that connections are opened and closed exactly as under a WSGI server:
+
+* "per request": `CONN_MAX_AGE = 0`, a new connection for every request;
+* "persistent": the connection is kept between requests;
+* "pool": on PostgreSQL only, connections come from a psycopg pool.
+
+SQLite is used by default, in a throwaway file. Set `DATABASE_ENGINE=
+postgresql` and the `DATABASE_*` variables (see `trello.env`) to load a
+PostgreSQL database instead; its boards table is filled with missing seed
+boards, so use a scratch database. Pooling needs `psycopg[pool]`.
+
+Usage:
+    python -m benchmarks.connections --boards 10000 --duration 5
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from itertools import count
+from pathlib import Path
+
+from benchmarks.common import seed_boards, setup_django
+from benchmarks.loadgen import LoadResult
+
+PERSISTENT_MAX_AGE = 600
+POOL = {"min_size": 1, "max_size": 4}
+
+
+def load(boards: int, duration: float) -> LoadResult:
+    """
+    Send requests to the WSGI handler for `duration` seconds.
+
+    Every other request loads the page of the next board, which is not
+    cached yet.
+
+    Args:
+        boards (int): The number of seeded boards.
+        duration (float): The length of the run in seconds.
+
+    Returns:
+        LoadResult: The latencies and errors of the run.
+    """
+    # pylint: disable=C0415
+    from django.core.handlers.wsgi import WSGIHandler
+
+    handler = WSGIHandler()
+    result = LoadResult(duration=duration)
+    statuses: list[str] = []
+    deadline = time.perf_counter() + duration
+    for number in count():
+        if time.perf_counter() >= deadline:
+            break
+        path = (
+            f"/boards/Board {number // 2 % boards}/"
+            if number % 2
+            else "/boards/"
+        )
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.url_scheme": "http",
+        }
+        start = time.perf_counter()
+        response = handler(
+            environ,
+            lambda status, headers: statuses.append(status),  # type: ignore
+        )
+        b"".join(response)
+        response.close()
+        result.latencies.append((time.perf_counter() - start) * 1000)
+        result.errors += not statuses[-1].startswith("200")
+    return result
+
+
+def run(
+    label: str, boards: int, duration: float, max_age: int, pool: dict
+) -> None:
+    """
+    Configure the connections, load the handler and print the results.
+
+    Args:
+        label (str): The name of the configuration.
+        boards (int): The number of seeded boards.
+        duration (float): The length of the run in seconds.
+        max_age (int): The `CONN_MAX_AGE` of the connection.
+        pool (dict): The pool options, or an empty dict for no pool.
+    """
+    # pylint: disable=C0415
+    from django.core.cache import cache
+    from django.db import connection
+
+    connection.close()
+    connection.settings_dict["CONN_MAX_AGE"] = max_age
+    if pool:
+        connection.settings_dict["OPTIONS"]["pool"] = pool
+    else:
+        connection.settings_dict["OPTIONS"].pop("pool", None)
+    cache.clear()
+    summary = load(boards, duration).summary()
+    connection.close()
+    print(
+        f"{label:>12}: {summary['rps']:8.1f} req/s, "
+        f"p50 {summary['p50_ms']:6.2f} ms, p99 {summary['p99_ms']:6.2f} ms, "
+        f"{summary['errors']} errors"
+    )
+
+
+def main() -> None:
+    """Parse the command line and compare the configurations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=10_000)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_DEBUG", "false")
+    os.environ.setdefault("SLOW_REQUEST_MS", "3600000")
+    os.environ.setdefault("STATIC_MANIFEST", "false")
+    with tempfile.TemporaryDirectory() as directory:
+        if os.environ.get("DATABASE_ENGINE", "sqlite") == "sqlite":
+            os.environ["DATABASE_NAME"] = str(Path(directory) / "bench.sqlite3")
+        setup_django()
+        # pylint: disable=C0415
+        from django.core.management import call_command
+        from django.db import connection
+
+        call_command("migrate", verbosity=0)
+        seed_boards(args.boards)
+        run("per request", args.boards, args.duration, 0, {})
+        run("persistent", args.boards, args.duration, PERSISTENT_MAX_AGE, {})
+        if connection.vendor == "postgresql":
+            run("pool", args.boards, args.duration, 0, POOL)
+            connection.close_pool()  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Bytes and queries spent on the board creation form of the header.
+
+Seeds a throwaway database and replays the interactions of the header form
+with Django's test client, once as a browser without JavaScript (full pages,
+Post/Redirect/Get on errors) and once as the page script does (the form
+opens client-side, submissions ask for the header form fragment). For each
+interaction the number of requests, the response bytes and the database
+queries are printed.
+
+Usage:
+    python -m benchmarks.interactions --boards 5000
+"""
+
+from typing import Optional
+
+from benchmarks.common import run_with_boards, seed_boards
+
+FRAGMENT = {"x-fragment": "header-form"}
+
+# Each interaction is a list of POSTs to the boards page; the script opens
+# the form without any request.
+INTERACTIONS: dict[str, dict[str, list[dict]]] = {
+    "open form": {
+        "no script": [{"show_input": "true"}],
+        "script": [],
+    },
+    "duplicate title": {
+        "no script": [{"board_title": "board 1"}],
+        "script": [{"board_title": "board 1"}],
+    },
+    "empty title": {
+        "no script": [{"board_title": ""}],
+        "script": [{"board_title": ""}],
+    },
+}
+
+
+def replay(posts: list[dict], headers: Optional[dict]) -> tuple[int, int, int]:
+    """
+    Send the POSTs of an interaction, following redirects to the listing.
+
+    Args:
+        posts (list[dict]): The form data of each POST.
+        headers (dict | None): Extra request headers.
+
+    Returns:
+        tuple[int, int, int]: The requests, response bytes and queries.
+    """
+    # pylint: disable=C0415
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    client = Client()
+    requests = size = 0
+    with CaptureQueriesContext(connection) as queries:
+        for data in posts:
+            response = client.post("/boards/", data, headers=headers)
+            requests, size = requests + 1, size + len(response.content)
+            if response.status_code == 302:
+                response = client.get(response["Location"])
+                requests, size = requests + 1, size + len(response.content)
+    return requests, size, len(queries)
+
+
+def run(count: int) -> None:
+    """
+    Seed `count` boards and print the cost of every interaction.
+
+    Args:
+        count (int): The number of boards to seed.
+    """
+    seed_boards(count)
+    for name, modes in INTERACTIONS.items():
+        for mode, posts in modes.items():
+            headers = FRAGMENT if mode == "script" else None
+            requests, size, queries = replay(posts, headers)
+            print(
+                f"{name:>16} ({mode:>9}): {requests} requests "
+                f"{size:>8,} B {queries:>3} queries"
+            )
+
+
+if __name__ == "__main__":
+    run_with_boards(__doc__, run, 5000)
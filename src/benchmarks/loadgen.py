@@ -0,0 +1,160 @@
+"""A minimal HTTP/1.1 load generator built on asyncio streams.
+
+Each virtual client holds one keep-alive connection and sends requests back
+to back for the duration of the run. Only responses with a Content-Length
+are supported, which is what Django produces for the board pages.
+"""
+
+import asyncio
+import statistics
+import time
+
+from dataclasses import dataclass, field
+from itertools import cycle
+from typing import Iterable
+
+
+@dataclass
+class LoadResult:
+    """
+    Aggregated outcome of a load run.
+
+    Attributes:
+        latencies (list[float]): Per-request latencies in milliseconds.
+        errors (int): Responses with a 5xx status or failed connections.
+        duration (float): Wall-clock length of the run in seconds.
+    """
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    duration: float = 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        """Return the throughput of the run."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def percentile(self, percent: int) -> float:
+        """
+        Return a latency percentile in milliseconds.
+
+        Args:
+            percent (int): The percentile, between 1 and 99.
+
+        Returns:
+            float: The latency below which `percent`% of requests finished.
+        """
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1]
+
+    def summary(self) -> dict[str, float]:
+        """
+        Return the headline numbers of the run.
+
+        Returns:
+            dict[str, float]: Throughput, error count and latency percentiles.
+        """
+        return {
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "rps": round(self.requests_per_second, 1),
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+        }
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    host: str,
+    path: str,
+) -> int:
+    """
+    Send one GET request and read the full response.
+
+    Args:
+        reader (asyncio.StreamReader): The connection's reader.
+        writer (asyncio.StreamWriter): The connection's writer.
+        host (str): The value of the Host header.
+        path (str): The request path.
+
+    Returns:
+        int: The response status code.
+    """
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(lines[0].split()[1])
+
+
+async def _client(
+    host: str, port: int, paths: Iterable[str], deadline: float
+) -> LoadResult:
+    """
+    Run one keep-alive client until the deadline.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        paths (Iterable[str]): The paths to request, in turn.
+        deadline (float): The `time.perf_counter()` value to stop at.
+
+    Returns:
+        LoadResult: The latencies and errors seen by this client.
+    """
+    result = LoadResult()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for path in cycle(paths):
+            if time.perf_counter() >= deadline:
+                break
+            start = time.perf_counter()
+            status = await _request(reader, writer, f"{host}:{port}", path)
+            result.latencies.append((time.perf_counter() - start) * 1000)
+            result.errors += status >= 500
+    except (OSError, asyncio.IncompleteReadError):
+        result.errors += 1
+    finally:
+        writer.close()
+    return result
+
+
+async def run_load(
+    host: str,
+    port: int,
+    paths: list[str],
+    concurrency: int = 50,
+    duration: float = 10.0,
+) -> LoadResult:
+    """
+    Load a server with `concurrency` keep-alive clients.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        paths (list[str]): The paths to request, in turn.
+        concurrency (int): The number of concurrent connections.
+        duration (float): The length of the run in seconds.
+
+    Returns:
+        LoadResult: The aggregated outcome of the run.
+    """
+    start = time.perf_counter()
+    deadline = start + duration
+    results = await asyncio.gather(
+        *(_client(host, port, paths, deadline) for _ in range(concurrency))
+    )
+    total = LoadResult(duration=time.perf_counter() - start)
+    for result in results:
+        total.latencies.extend(result.latencies)
+        total.errors += result.errors
+    return total
@@ -0,0 +1,74 @@
+"""Query plans of the board lookups before and after the Board indexes.
+
+Seeds a throwaway database and prints, for each lookup, the plan chosen by
+the database and the median query time, first without the `created_at`
+index and the normalized title column (the old schema), then with them.
+
+Usage:
+    python -m benchmarks.query_plans --boards 100000
+"""
+
+from django.db.models import QuerySet
+
+from benchmarks.common import measure, run_with_boards, seed_boards
+
+
+def report(label: str, queryset: QuerySet) -> None:
+    """
+    Print the plan and the median duration of a query.
+
+    Args:
+        label (str): A description of the query.
+        queryset (QuerySet): The query to explain and time.
+    """
+    duration = measure(lambda: list(queryset.all()))
+    print(f"--- {label}: {duration:.3f} ms")
+    print(queryset.explain())
+
+
+def run(count: int) -> None:
+    """
+    Seed `count` boards and compare the plans of the board lookups.
+
+    Args:
+        count (int): The number of boards to seed.
+    """
+    from django.db import connection  # pylint: disable=C0415
+
+    from trello.models import Board  # pylint: disable=C0415
+
+    seed_boards(count)
+    probe = f"BOARD {count // 2}"
+    (index,) = [
+        index
+        for index in Board._meta.indexes  # pylint: disable=W0212,E1101
+        if index.name == "board_created_at_id_idx"
+    ]
+    recent = Board.objects.order_by("created_at", "id")[:51]
+
+    with connection.schema_editor() as editor:
+        editor.remove_index(Board, index)
+    print("=== Before: no created_at index, no normalized title")
+    report(
+        "case-insensitive detail lookup",
+        Board.objects.filter(title__iexact=probe),
+    )
+    report("recency listing", recent)
+
+    with connection.schema_editor() as editor:
+        editor.add_index(Board, index)
+    print("=== After: created_at index and normalized title")
+    report(
+        "case-insensitive detail lookup",
+        Board.objects.filter(normalized_title=probe.casefold()),
+    )
+    report("recency listing", recent)
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    run_with_boards(__doc__, run, default=100_000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Overhead of `RequestTimingMiddleware` on the board pages.
+
+Seeds a throwaway database and times the same pages with Django's test
+client, with the middleware in `MIDDLEWARE` and without it, printing the
+median latency of each and the difference.
+
+Usage:
+    python -m benchmarks.request_timing --boards 5000
+"""
+
+from functools import partial
+
+from benchmarks.common import measure, run_with_boards, seed_boards
+
+PATHS = {
+    "listing": "/boards/",
+    "board (cached)": "/boards/Board%201/",
+    "json listing": "/api/boards/",
+}
+MIDDLEWARE = "trello.middleware.RequestTimingMiddleware"
+ROUNDS = 10
+
+
+def run(count: int) -> None:
+    """
+    Seed `count` boards and compare the latencies.
+
+    Args:
+        count (int): The number of boards to seed.
+    """
+    # pylint: disable=C0415
+    from django.conf import settings
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    seed_boards(count)
+    without = [name for name in settings.MIDDLEWARE if name != MIDDLEWARE]
+    for label, path in PATHS.items():
+        # Alternate short rounds and keep the best median of each, so that
+        # drift in the machine's speed affects both sides alike.
+        best = {"with": float("inf"), "without": float("inf")}
+        for _ in range(ROUNDS):
+            for side, middleware in (
+                ("with", settings.MIDDLEWARE),
+                ("without", without),
+            ):
+                with override_settings(MIDDLEWARE=middleware):
+                    client = Client()
+                    client.get(path)
+                    latency = measure(partial(client.get, path), 100)
+                best[side] = min(best[side], latency)
+        print(
+            f"{label:>16}: {best['with']:7.3f} ms with, "
+            f"{best['without']:7.3f} ms without "
+            f"({(best['with'] - best['without']) * 1000:+5.0f} µs)"
+        )
+
+
+if __name__ == "__main__":
+    run_with_boards(__doc__, run, 5000)
@@ -0,0 +1,153 @@
+"""Latency of the board search against `title__icontains` scans.
+
+Seeds a throwaway database with boards titled from a random vocabulary,
+builds the search index and times `trello.search.search_boards` and the
+equivalent `title__icontains` query for common, rare and missing words and
+for prefixes, printing the median latency of each. Exits with status 1 when
+a search is slower than `--max-ms`, so the bound on the work per search is
+checked at a million boards.
+
+Usage:
+    python -m benchmarks.search --boards 1000000 --max-ms 20
+"""
+
+import argparse
+import random
+import sys
+
+from functools import partial
+
+from benchmarks.common import (
+    benchmark_database,
+    measure,
+    seed_boards,
+    setup_django,
+)
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "zu", "pe"]
+
+
+def vocabulary(size: int, generator: random.Random) -> list[str]:
+    """
+    Build pseudo-words of three syllables.
+
+    Args:
+        size (int): The number of words.
+        generator (random.Random): The random generator.
+
+    Returns:
+        list[str]: The words.
+    """
+    words: set[str] = set()
+    while len(words) < size:
+        words.add("".join(generator.choices(SYLLABLES, k=3)))
+    return sorted(words)
+
+
+def retitle_boards(words: list[str], generator: random.Random) -> None:
+    """
+    Give every seeded board a title of three random words.
+
+    Word frequencies follow a power law, so some words are common and
+    others rare. The id keeps titles unique.
+
+    Args:
+        words (list[str]): The vocabulary.
+        generator (random.Random): The random generator.
+    """
+    # pylint: disable=C0415
+    from django.db import connection, transaction
+
+    from trello.models import Board, normalize_title
+
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    rows = []
+    for pk in Board.objects.values_list("pk", flat=True).iterator(5000):
+        title = " ".join(generator.choices(words, weights, k=3)) + f" {pk}"
+        rows.append((title, normalize_title(title), pk))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            "UPDATE trello_board SET title = %s, normalized_title = %s "
+            "WHERE id = %s",
+            rows,
+        )
+
+
+def icontains(query: str) -> list:
+    """
+    Find boards by scanning their titles, as a search without index would.
+
+    Args:
+        query (str): The text to look for.
+
+    Returns:
+        list: The first matching boards in listing order.
+    """
+    from trello.models import Board  # pylint: disable=C0415
+
+    boards = Board.objects.filter(title__icontains=query)
+    return list(boards.order_by("rank", "id")[:20])
+
+
+def run(boards: int, seed: int) -> dict[str, float]:
+    """
+    Seed the boards and print the latency of both searches.
+
+    Args:
+        boards (int): The number of boards.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict[str, float]: The median latency of each search, in ms.
+    """
+    # pylint: disable=C0415
+    from trello.search import rebuild_index, search_boards
+
+    generator = random.Random(seed)
+    words = vocabulary(1000, generator)
+    seed_boards(boards)
+    retitle_boards(words, generator)
+    rebuild_index()
+
+    latencies = {}
+    print(f"{'query':>16} {'search (ms)':>12} {'icontains (ms)':>15}")
+    for label, query in [
+        ("common word", words[0]),
+        ("rare word", words[-1]),
+        ("two words", f"{words[0]} {words[1]}"),
+        ("prefix", words[5][:4]),
+        ("long prefix", words[0][:5]),
+        ("one letter", words[0][:1]),
+        ("no match", "xyzzy"),
+    ]:
+        latencies[label] = measure(partial(search_boards, query), repeat=20)
+        scan = measure(partial(icontains, query), repeat=5)
+        print(f"{label:>16} {latencies[label]:12.2f} {scan:15.2f}")
+    return latencies
+
+
+def main() -> None:
+    """Parse the command line and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=20.0,
+        help="Fail when a search takes longer than this, in ms.",
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        latencies = run(args.boards, args.seed)
+    slow = [label for label, ms in latencies.items() if ms > args.max_ms]
+    for label in slow:
+        print(f"Too slow: {label} over {args.max_ms} ms", file=sys.stderr)
+    if slow:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
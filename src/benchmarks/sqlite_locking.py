@@ -0,0 +1,163 @@
+"""Readers and writers sharing one SQLite file, before and after the tuning.
+
+Seeds a throwaway database, then runs reader processes loading the boards
+listing and writer processes alternately creating and moving boards through
+the views, all at the same time, twice:
+
+* "defaults": the rollback journal, synchronous=FULL and deferred
+  transactions that SQLite and Django use out of the box;
+* "tuned": the `SQLITE_*` settings of the project (WAL, synchronous=NORMAL,
+  mmap, a larger cache and `BEGIN IMMEDIATE`).
+
+For each run and role it prints the throughput, the requests that failed
+with "database is locked", and the latency percentiles and maximum. A move
+reads the ranks of its neighbours before writing, so with deferred
+transactions two concurrent moves can deadlock on the lock upgrade, which
+SQLite reports at once instead of waiting for the busy timeout.
+
+Usage:
+    python -m benchmarks.sqlite_locking --boards 10000 --readers 4 --writers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from functools import partial
+from pathlib import Path
+
+from django.test import Client
+
+from benchmarks.loadgen import LoadResult
+from trello.env import sqlite_pragmas
+
+# Connection options and journal mode of an untuned SQLite database.
+DEFAULT_OPTIONS = {"timeout": 5}
+DEFAULT_JOURNAL_MODE = "DELETE"
+
+
+def send(client: Client, role: str, number: int, boards: int) -> None:
+    """
+    Send the next request of a worker.
+
+    Args:
+        client (Client): The worker's test client.
+        role (str): "reader" or "writer".
+        number (int): The number of requests the worker sent so far.
+        boards (int): The number of seeded boards.
+    """
+    if role == "reader":
+        client.get("/boards/")
+    elif number % 2:
+        client.post("/boards/", {"board_title": f"{os.getpid()} {number}"})
+    else:
+        board, after = random.sample(range(boards), 2)
+        client.post(
+            f"/boards/Board%20{board}/move/", {"after": f"Board {after}"}
+        )
+
+
+def work(boards: int, deadline: float, role: str) -> tuple[list[float], int]:
+    """
+    Load the board views until the deadline, in a worker process.
+
+    Args:
+        boards (int): The number of seeded boards.
+        deadline (float): The `time.time()` value to stop at.
+        role (str): "reader" or "writer".
+
+    Returns:
+        tuple[list[float], int]: The latencies of the successful requests in
+            milliseconds, and the number of "database is locked" errors.
+    """
+    from django.db import OperationalError, connections  # pylint: disable=C0415
+
+    connections.close_all()
+    random.seed(os.getpid())
+    client = Client()
+    latencies, errors = [], 0
+    number = 0
+    while time.time() < deadline:
+        number += 1
+        start = time.perf_counter()
+        try:
+            send(client, role, number, boards)
+        except OperationalError as error:
+            if "locked" not in str(error):
+                raise
+            errors += 1
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+    connections.close_all()
+    return latencies, errors
+
+
+def run(args: argparse.Namespace, options: dict, journal_mode: str) -> None:
+    """
+    Run the readers and writers with one set of connection options.
+
+    Args:
+        args (argparse.Namespace): The command line options.
+        options (dict): The `OPTIONS` of the database connections.
+        journal_mode (str): The journal mode of the database file.
+    """
+    # pylint: disable=C0415
+    from django.db import connection
+
+    connection.settings_dict["OPTIONS"] = options
+    connection.close()
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+    connection.close()
+
+    roles = ["reader"] * args.readers + ["writer"] * args.writers
+    deadline = time.time() + args.duration
+    with multiprocessing.get_context("fork").Pool(len(roles)) as pool:
+        outcomes = pool.map(partial(work, args.boards, deadline), roles)
+    for role in ("reader", "writer"):
+        result = LoadResult(duration=args.duration)
+        for (latencies, errors), worker in zip(outcomes, roles):
+            if worker == role:
+                result.latencies.extend(latencies)
+                result.errors += errors
+        summary = result.summary()
+        print(
+            f"  {role}s: {summary['rps']:8.1f} req/s, "
+            f"{summary['errors']:5} locked, p50 {summary['p50_ms']:7.2f} ms, "
+            f"p99 {summary['p99_ms']:7.2f} ms, "
+            f"max {max(result.latencies, default=0):8.2f} ms"
+        )
+
+
+def main() -> None:
+    """Parse the command line and compare the two configurations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boards", type=int, default=10_000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_DEBUG", "false")
+    os.environ.setdefault("STATIC_MANIFEST", "false")
+    # Stalled requests are what is measured; do not log each one.
+    os.environ.setdefault("SLOW_REQUEST_MS", "3600000")
+    with tempfile.TemporaryDirectory() as directory:
+        # pylint: disable=C0415
+        from benchmarks.asgi_views import prepare_database
+
+        prepare_database(Path(directory) / "bench.sqlite3", args.boards)
+        from django.conf import settings
+
+        tuned = dict(settings.DATABASES["default"]["OPTIONS"])
+        print("defaults:")
+        run(args, DEFAULT_OPTIONS, DEFAULT_JOURNAL_MODE)
+        print("tuned:")
+        run(args, tuned, str(sqlite_pragmas()["journal_mode"]))
+
+
+if __name__ == "__main__":
+    main()
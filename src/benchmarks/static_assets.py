@@ -0,0 +1,84 @@
+"""Bytes sent for the board pages and their stylesheet, first and repeat visit.
+
+Collects the static files into a temporary `STATIC_ROOT` with the manifest
+storage, seeds a throwaway database, and requests the boards listing and a
+board page with Django's test client. Prints the size of each page (raw and
+gzip), the size of its stylesheet in each encoding served, with its
+`Cache-Control` header, and the gzip bytes of a first visit (page and
+stylesheet) and of a repeat visit, when the immutable stylesheet comes from
+the browser cache.
+
+Usage:
+    python -m benchmarks.static_assets --boards 1000
+"""
+
+import gzip
+import os
+import re
+import tempfile
+
+from benchmarks.common import run_with_boards, seed_boards
+
+PAGES = {"listing": "/boards/", "board": "/boards/Board%201/"}
+STYLESHEET = re.compile(r'<link rel="stylesheet" href="([^"]+)">')
+
+
+def report(label: str, path: str) -> None:
+    """
+    Request a page and its stylesheet and print what was sent.
+
+    Args:
+        label (str): The name of the page.
+        path (str): The URL of the page.
+    """
+    from django.test import Client  # pylint: disable=C0415
+
+    client = Client()
+    page = client.get(path).content
+    page_gzip = len(gzip.compress(page))
+    stylesheet = STYLESHEET.search(page.decode())
+    assert stylesheet is not None, "The page links to no stylesheet"
+    sizes = {}
+    for encoding in ("identity", "gzip", "br"):
+        response = client.get(stylesheet[1], HTTP_ACCEPT_ENCODING=encoding)
+        sizes[response.get("Content-Encoding", "identity")] = len(
+            response.getvalue()
+        )
+    print(
+        f"{label:>8}: page {len(page):>7,} B raw {page_gzip:>6,} B gzip; "
+        f"{stylesheet[1]} "
+        + " ".join(f"{size:,} B {name}" for name, size in sizes.items())
+        + f" ({response['Cache-Control']})"
+    )
+    print(
+        f"{'':>8}  first visit {page_gzip + sizes['gzip']:,} B gzip, "
+        f"repeat visit {page_gzip:,} B gzip"
+    )
+
+
+def run(boards: int) -> None:
+    """
+    Collect the static files, then report on each page.
+
+    Args:
+        boards (int): The number of boards to seed.
+    """
+    from django.core.management import call_command  # pylint: disable=C0415
+
+    call_command("collectstatic", interactive=False, verbosity=0)
+    seed_boards(boards)
+    for label, path in PAGES.items():
+        report(label, path)
+
+
+def main() -> None:
+    """Collect into a temporary directory and run the benchmark."""
+    os.environ.setdefault("DJANGO_DEBUG", "false")
+    os.environ["STATIC_MANIFEST"] = "true"
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["STATIC_ROOT"] = directory
+        run_with_boards(__doc__, run, 1000)
+
+
+if __name__ == "__main__":
+    main()
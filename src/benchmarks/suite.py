@@ -0,0 +1,223 @@
+"""Benchmark and load-test suite of the board endpoints.
+
+Seeds a throwaway SQLite database with the `seed_boards` command, then:
+
+* times the boards listing, a board page (cached and rendered) and board
+  creation in-process with Django's test client;
+* starts uvicorn on the project's ASGI application and loads the listing
+  and a board page over HTTP with keep-alive clients.
+
+Every benchmark reports its throughput and latency percentiles. The results
+can be written to a JSON file, and compared with the file of an earlier run:
+the script exits with status 1 when a latency grows, or a throughput drops,
+by more than the threshold, or when a request fails.
+
+The HTTP load only sends GET requests, since the load generator does not
+handle CSRF tokens; creation is timed in-process only. The HTTP part needs
+uvicorn (see requirements-dev.txt) and can be skipped with `--no-http`.
+
+Usage:
+    python -m benchmarks.suite --boards 10000 --output baseline.json
+    python -m benchmarks.suite --boards 10000 --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from itertools import count
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.asgi_views import HOST, serve
+from benchmarks.common import setup_django
+from benchmarks.loadgen import LoadResult, run_load
+
+BOARD_PATH = "/boards/Board%201/"
+LIST_PATH = "/boards/"
+HTTP_PATHS = {"http_list": LIST_PATH, "http_detail": BOARD_PATH}
+
+
+def time_calls(func: Callable[[], object], repeat: int) -> dict:
+    """
+    Call `func` `repeat` times and summarize the latencies.
+
+    Args:
+        func (Callable): The function to time.
+        repeat (int): The number of calls to time.
+
+    Returns:
+        dict: Throughput, error count and latency percentiles, as reported
+              by the load generator.
+    """
+    func()
+    result = LoadResult()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        call_start = time.perf_counter()
+        func()
+        result.latencies.append((time.perf_counter() - call_start) * 1000)
+    result.duration = time.perf_counter() - start
+    return result.summary()
+
+
+def in_process(repeat: int) -> dict[str, dict]:
+    """
+    Time the board endpoints with Django's test client.
+
+    Args:
+        repeat (int): The number of requests per benchmark.
+
+    Returns:
+        dict[str, dict]: The summary of each benchmark, by name.
+    """
+    # pylint: disable=C0415
+    from django.test import Client
+
+    from trello.cache import discard_board_page
+    from trello.models import Board
+
+    client = Client()
+    board_id = Board.objects.get(title="Board 1").pk
+    titles = (f"Suite {time.time_ns()} {i}" for i in count())
+
+    def uncached_detail() -> None:
+        discard_board_page(board_id)
+        client.get(BOARD_PATH)
+
+    def create() -> None:
+        client.post(LIST_PATH, {"board_title": next(titles)})
+
+    return {
+        "list": time_calls(lambda: client.get(LIST_PATH), repeat),
+        "detail_cached": time_calls(lambda: client.get(BOARD_PATH), repeat),
+        "detail_uncached": time_calls(uncached_detail, repeat),
+        "create": time_calls(create, repeat),
+    }
+
+
+def over_http(
+    database: Path, concurrency: int, duration: float
+) -> dict[str, dict]:
+    """
+    Load the board endpoints of a local uvicorn server.
+
+    Args:
+        database (Path): The SQLite file the server uses.
+        concurrency (int): The number of concurrent connections.
+        duration (float): The length of each load run, in seconds.
+
+    Returns:
+        dict[str, dict]: The summary of each load run, by name.
+    """
+    env = {**os.environ, "DATABASE_NAME": str(database)}
+    env["DJANGO_DEBUG"] = "false"
+    env["STATIC_MANIFEST"] = "false"
+    results = {}
+    with serve(env) as port:
+        for name, path in HTTP_PATHS.items():
+            result = asyncio.run(
+                run_load(HOST, port, [path], concurrency, duration)
+            )
+            results[name] = result.summary()
+    return results
+
+
+def regressions(
+    baseline: dict[str, dict], results: dict[str, dict], threshold: float
+) -> list[str]:
+    """
+    List the numbers of a run that are worse than the baseline's.
+
+    Latencies (`*_ms`) may grow, and throughputs (`rps`) drop, by at most
+    `threshold` times the baseline value. Any failed request is a regression.
+    Benchmarks missing from either run are not compared.
+
+    Args:
+        baseline (dict[str, dict]): The results of the reference run.
+        results (dict[str, dict]): The results of the current run.
+        threshold (float): The allowed relative change, e.g. 0.2 for 20%.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+    found = []
+    for name, summary in results.items():
+        if summary["errors"]:
+            found.append(f"{name}: {summary['errors']} failed requests")
+        before = baseline.get(name, {})
+        for key, value in summary.items():
+            if key not in before or not before[key]:
+                continue
+            change = value / before[key] - 1
+            if (key.endswith("_ms") and change > threshold) or (
+                key == "rps" and change < -threshold
+            ):
+                found.append(
+                    f"{name}: {key} {before[key]} -> {value} ({change:+.0%})"
+                )
+    return found
+
+
+def main() -> None:
+    """Parse the command line, run the suite and check for regressions."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--boards", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--no-http", action="store_true")
+    parser.add_argument("--output", type=Path, help="Write the results here.")
+    parser.add_argument("--baseline", type=Path, help="Compare with this run.")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.sqlite3"
+        os.environ["DATABASE_NAME"] = str(database)
+        setup_django()
+        # pylint: disable=C0415
+        import django
+
+        from django.core.management import call_command
+
+        call_command("migrate", verbosity=0)
+        call_command("seed_boards", args.boards, stdout=sys.stderr)
+        results = in_process(args.repeat)
+        if not args.no_http:
+            results.update(over_http(database, args.concurrency, args.duration))
+
+    run = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "machine": platform.machine(),
+            "boards": args.boards,
+            "repeat": args.repeat,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+        },
+        "results": results,
+    }
+    print(json.dumps(run, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(run, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        found = regressions(baseline, results, args.threshold)
+        for regression in found:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
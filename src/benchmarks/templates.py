@@ -0,0 +1,126 @@
+"""Render time and size of the board pages with each template loading mode.
+
+Seeds a throwaway database, then renders the boards listing and a board
+with 10 lists of 20 cards with three template engines: the loaders used in
+development, which read and compile the template on every render; the
+cached loaders alone; and the production loaders, which also minify the
+templates. Prints the median render time and the raw and gzip sizes of
+each page.
+
+Usage:
+    python -m benchmarks.templates --boards 1000
+"""
+
+import gzip
+
+from typing import Callable
+
+from benchmarks.common import measure, run_with_boards, seed_boards
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+
+def build_engines() -> dict:
+    """
+    Build a template engine for each loading mode, like the project's.
+
+    Returns:
+        dict: The engines, by mode.
+    """
+    # pylint: disable=C0415
+    from django.conf import settings
+    from django.template import Engine
+    from django.template.backends.django import get_installed_libraries
+
+    from trello.templating import PRODUCTION_LOADERS
+
+    config = settings.TEMPLATES[0]
+    modes: dict[str, list] = {
+        "uncached": LOADERS,
+        "cached": [("django.template.loaders.cached.Loader", LOADERS)],
+        "cached+minified": PRODUCTION_LOADERS,
+    }
+    return {
+        mode: Engine(
+            dirs=[str(directory) for directory in config["DIRS"]],
+            context_processors=config["OPTIONS"]["context_processors"],
+            libraries=get_installed_libraries(),
+            loaders=loaders,
+        )
+        for mode, loaders in modes.items()
+    }
+
+
+def pages() -> dict[str, tuple[str, dict]]:
+    """
+    Load the template contexts of the pages to render.
+
+    Returns:
+        dict: The template name and context of each page, by page.
+    """
+    # pylint: disable=C0415
+    from trello.models import Board
+    from trello.seeding import add_lists
+    from trello.services import board_detail_queryset
+    from trello.views import boards_context, listing_paginator
+
+    board_id = Board.objects.get(title="Board 1").pk
+    add_lists(board_id, 10, 20)
+    board = board_detail_queryset().get(pk=board_id)
+    listing = boards_context(listing_paginator().get_page(), True, None)
+    return {
+        "listing": ("boards.html", listing),
+        "board": ("board_detail.html", {"board": board}),
+    }
+
+
+def renderer(engine, name: str, context: dict) -> Callable[[], str]:
+    """
+    Return a function rendering a template like a view would.
+
+    Args:
+        engine (Engine): The template engine.
+        name (str): The template name.
+        context (dict): The template context.
+
+    Returns:
+        Callable[[], str]: Loads and renders the template.
+    """
+    # pylint: disable=C0415
+    from django.template import RequestContext
+    from django.test import RequestFactory
+
+    request = RequestFactory().get("/boards/")
+
+    def render() -> str:
+        template = engine.get_template(name)
+        return template.render(RequestContext(request, context))
+
+    return render
+
+
+def run(boards: int) -> None:
+    """
+    Render each page with each engine and print the results.
+
+    Args:
+        boards (int): The number of boards to seed.
+    """
+    seed_boards(boards)
+    contexts = pages()
+    for mode, engine in build_engines().items():
+        for page, (name, context) in contexts.items():
+            render = renderer(engine, name, context)
+            body = render().encode()
+            latency = measure(render, 200)
+            print(
+                f"{mode:>16} {page:>8}: {latency:7.3f} ms "
+                f"{len(body):>8,} B raw {len(gzip.compress(body)):>7,} B gzip"
+            )
+
+
+if __name__ == "__main__":
+    run_with_boards(__doc__, run, 1000)
@@ -0,0 +1,427 @@
+"""HTTP endpoints for working with boards programmatically."""
+
+import hashlib
+import hmac
+import json
+
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
+
+from trello.autocomplete import SUGGESTION_LIMIT, title_index
+from trello.cache import listing_etag, listing_version
+from trello.export import CONTENT_TYPES, export_boards, parse_bound
+from trello.models import Board, normalize_title
+from trello.pagination import KeysetPaginator
+from trello.search import SEARCH_LIMIT, search_boards
+from trello.services import import_boards
+
+API_FIELDS = ("id", "title", "created_at", "updated_at")
+
+
+def parse_titles(request: HttpRequest) -> list[str]:
+    """
+    Extract board titles from the body of a request.
+
+    `application/json` bodies hold a list of titles (or an object with a
+    `titles` list), `application/x-ndjson` bodies one JSON string per line,
+    and any other body one plain title per line.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        list[str]: The titles, in input order.
+
+    Raises:
+        ValueError: If the body is not valid for its content type.
+    """
+    body = request.body.decode(request.encoding or "utf-8")
+    if request.content_type == "application/json":
+        titles = json.loads(body)
+        if isinstance(titles, dict):
+            titles = titles.get("titles")
+    elif request.content_type == "application/x-ndjson":
+        titles = [json.loads(line) for line in body.splitlines() if line]
+    else:
+        titles = body.splitlines()
+    if not isinstance(titles, list) or not all(
+        isinstance(title, str) for title in titles
+    ):
+        raise ValueError("Expected a list of board titles.")
+    return titles
+
+
+def has_import_token(request: HttpRequest) -> bool:
+    """
+    Check the bearer token of a request against `API_IMPORT_TOKEN`.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        bool: Whether the request carries the token.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(
+        token.strip().encode(), settings.API_IMPORT_TOKEN.encode()
+    )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class BoardImportView(View):
+    """
+    Creates many boards from a single request.
+
+    Clients authenticate with the `API_IMPORT_TOKEN` bearer token instead
+    of a CSRF token, which scripts have no page to read from.
+    """
+
+    http_method_names = ["post"]
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        """
+        Handles POST requests importing a list of board titles.
+
+        Args:
+            request (HttpRequest): The HTTP request object whose body holds
+                                   the titles.
+
+        Returns:
+            JsonResponse: The created and skipped titles, with status 201
+                          when at least one board was created, or an error.
+        """
+        if not settings.API_IMPORT_TOKEN:
+            return JsonResponse(
+                {"error": "Board import is disabled."}, status=403
+            )
+        if not has_import_token(request):
+            response = JsonResponse(
+                {"error": "A valid bearer token is required."}, status=401
+            )
+            response.headers["WWW-Authenticate"] = "Bearer"
+            return response
+        try:
+            titles = parse_titles(request)
+        except ValueError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+
+        result = import_boards(titles)
+        return JsonResponse(
+            {
+                "created": result.created,
+                "skipped": result.skipped,
+                "created_count": len(result.created),
+                "skipped_count": len(result.skipped),
+            },
+            status=201 if result.created else 200,
+        )
+
+
+class BoardExportView(View):
+    """Streams every board as NDJSON or CSV."""
+
+    http_method_names = ["get"]
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse | JsonResponse:
+        """
+        Handles GET requests exporting the boards.
+
+        The `format` query parameter selects "ndjson" (the default) or
+        "csv"; `since` and `until` limit the export to boards created in
+        that range, so incremental exports only read new rows.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            StreamingHttpResponse | JsonResponse: The streamed export, or a
+                                                  400 error for bad input.
+        """
+        export_format = request.GET.get("format", "ndjson")
+        try:
+            blocks = export_boards(
+                export_format,
+                since=parse_bound(request.GET.get("since")),
+                until=parse_bound(request.GET.get("until")),
+            )
+        except ValueError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+
+        response = StreamingHttpResponse(
+            blocks, content_type=CONTENT_TYPES[export_format]
+        )
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="boards.{export_format}"'
+        )
+        return response
+
+
+def parse_fields(request: HttpRequest) -> list[str]:
+    """
+    Read the sparse fieldset requested with `?fields=a,b`.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        list[str]: The requested fields, or all of `API_FIELDS`.
+
+    Raises:
+        ValueError: If an unknown field is requested.
+    """
+    raw = request.GET.get("fields", "")
+    fields = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = [name for name in fields if name not in API_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}.")
+    return fields or list(API_FIELDS)
+
+
+def parse_limit(request: HttpRequest) -> int:
+    """
+    Read the page size requested with `?limit=n`.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        int: The page size, `BOARDS_PAGE_SIZE` by default.
+
+    Raises:
+        ValueError: If the limit is not between 1 and `API_MAX_PAGE_SIZE`.
+    """
+    raw = request.GET.get("limit")
+    if not raw:
+        return settings.BOARDS_PAGE_SIZE
+    limit = int(raw)
+    if not 1 <= limit <= settings.API_MAX_PAGE_SIZE:
+        raise ValueError(
+            f"limit must be between 1 and {settings.API_MAX_PAGE_SIZE}."
+        )
+    return limit
+
+
+def cacheable(response: HttpResponseBase, etag: str) -> HttpResponseBase:
+    """
+    Mark an API response as cacheable by any cache, subject to revalidation.
+
+    Args:
+        response (HttpResponseBase): The response to update.
+        etag (str): The entity tag of the representation.
+
+    Returns:
+        HttpResponseBase: The updated response.
+    """
+    response.headers["ETag"] = etag
+    patch_cache_control(
+        response, public=True, max_age=settings.API_CACHE_MAX_AGE
+    )
+    return response
+
+
+def json_response(
+    request: HttpRequest, payload: Any, etag: Optional[str] = None
+) -> HttpResponseBase:
+    """
+    Serialize a payload compactly and answer conditional requests.
+
+    Keys are emitted in a stable order without insignificant whitespace,
+    which keeps bodies small and compressing well. Without an explicit
+    `etag` the digest of the body is used.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        payload (Any): The data to serialize.
+        etag (str | None): The entity tag, if known before serializing.
+
+    Returns:
+        HttpResponseBase: The JSON response, or a 304 response.
+    """
+    body = json.dumps(
+        payload,
+        cls=DjangoJSONEncoder,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    if etag is None:
+        digest = hashlib.sha1(body.encode(), usedforsecurity=False)
+        etag = f'"{digest.hexdigest()[:20]}"'
+    response = get_conditional_response(request, etag=etag) or HttpResponse(
+        body, content_type="application/json"
+    )
+    return cacheable(response, etag)
+
+
+def bad_request(error: Exception) -> JsonResponse:
+    """
+    Build the 400 response for invalid query parameters.
+
+    Args:
+        error (Exception): The validation error.
+
+    Returns:
+        JsonResponse: The error response.
+    """
+    return JsonResponse({"error": str(error)}, status=400)
+
+
+@method_decorator(gzip_page, name="dispatch")
+class BoardListAPIView(View):
+    """Lists boards as JSON, one keyset-paginated page at a time."""
+
+    http_method_names = ["get"]
+
+    def get(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Handles GET requests listing the boards.
+
+        Supports `fields`, `limit`, and the `after`/`before` cursors
+        returned in `next` and `previous`. Rows are read with `.values()`,
+        so no model instances are built, and unchanged listings are
+        answered with a 304 without any query.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase: The page of boards as JSON.
+        """
+        try:
+            fields, limit = parse_fields(request), parse_limit(request)
+        except ValueError as error:
+            return bad_request(error)
+
+        etag = listing_etag(listing_version(), request.get_full_path())
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return cacheable(not_modified, etag)
+
+        columns = dict.fromkeys([*fields, "created_at", "id"])
+        paginator = KeysetPaginator(
+            Board.objects.values(*columns), page_size=limit
+        )
+        page = paginator.get_page(
+            after=request.GET.get("after"), before=request.GET.get("before")
+        )
+        payload = {
+            "results": [{name: row[name] for name in fields} for row in page],
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+        }
+        return json_response(request, payload, etag)
+
+
+@method_decorator(gzip_page, name="dispatch")
+class BoardDetailAPIView(View):
+    """Returns a single board as JSON, looked up by id or title."""
+
+    http_method_names = ["get"]
+
+    def get(
+        self,
+        request: HttpRequest,
+        board_id: Optional[int] = None,
+        board_title: Optional[str] = None,
+    ) -> HttpResponseBase:
+        """
+        Handles GET requests for one board.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            board_id (int | None): The primary key of the board.
+            board_title (str | None): The title of the board, matched
+                                      case-insensitively.
+
+        Returns:
+            HttpResponseBase: The board as JSON, or a 404 error.
+        """
+        try:
+            fields = parse_fields(request)
+        except ValueError as error:
+            return bad_request(error)
+
+        if board_id is not None:
+            boards = Board.objects.filter(pk=board_id)
+        else:
+            boards = Board.objects.filter(
+                normalized_title=normalize_title(board_title or "")
+            )
+        row = next(iter(boards.values(*fields)[:1]), None)
+        if row is None:
+            return JsonResponse({"error": "Board not found."}, status=404)
+        return json_response(request, row)
+
+
+class BoardSearchAPIView(View):
+    """Returns the boards best matching a query, as JSON."""
+
+    http_method_names = ["get"]
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        """
+        Handles GET requests searching boards.
+
+        `q` holds the query; every word of it matches as a prefix. `limit`
+        caps the number of results.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            JsonResponse: The matching boards, best match first.
+        """
+        try:
+            limit = int(request.GET.get("limit", SEARCH_LIMIT))
+            if not 1 <= limit <= settings.API_MAX_PAGE_SIZE:
+                raise ValueError(
+                    f"limit must be between 1 and {settings.API_MAX_PAGE_SIZE}."
+                )
+        except ValueError as error:
+            return bad_request(error)
+
+        boards = search_boards(request.GET.get("q", ""), limit)
+        return JsonResponse(
+            {"results": [{"id": b.pk, "title": b.title} for b in boards]}
+        )
+
+
+class BoardAutocompleteView(View):
+    """Suggests board titles while a title is being typed."""
+
+    http_method_names = ["get"]
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        """
+        Handles GET requests for the titles starting with `q`.
+
+        Answered from the in-memory title index, without a database query
+        once the index is built.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            JsonResponse: Up to `SUGGESTION_LIMIT` titles starting with `q`,
+                          and whether `q` itself is taken.
+        """
+        query = request.GET.get("q", "")
+        return JsonResponse(
+            {
+                "suggestions": title_index.suggest(query, SUGGESTION_LIMIT),
+                "exists": title_index.exists(query),
+            }
+        )
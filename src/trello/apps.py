@@ -0,0 +1,21 @@
+"""Application configuration for the Trello app."""
+
+from django.apps import AppConfig
+
+
+class TrelloConfig(AppConfig):
+    """
+    Configuration of the `trello` application.
+
+    Attributes:
+        name (str): The dotted path of the application.
+        default_auto_field (str): The primary key field type of the models.
+    """
+
+    name = "trello"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Connect the model signal handlers and the query timing hook."""
+        # pylint: disable=C0415,W0611
+        from trello import signals, timing  # noqa: F401
@@ -11,6 +11,9 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from trello.templating import warm_templates
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "trello.settings")
 
 application = get_asgi_application()
+warm_templates()
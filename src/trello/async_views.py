@@ -0,0 +1,214 @@
+"""ASGI-native versions of the board views.
+
+The views behave exactly like those in `trello.views` and render the same
+templates, but query the database with the async ORM, so under an ASGI server
+they run on the event loop instead of a thread-pool adapter. They replace the
+sync views in the URLconf when `settings.ASYNC_VIEWS` is enabled.
+"""
+
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import aget_object_or_404, render
+from django.template.loader import render_to_string
+from django.views import View
+
+from trello.cache import (
+    CSRF_PLACEHOLDER,
+    CachedPage,
+    aget_board_page,
+    alisting_version,
+    aset_board_page,
+    board_etag,
+    board_last_modified,
+    listing_etag,
+)
+from trello.http import aconditional_response
+from trello.models import Board, normalize_title
+from trello.services import board_detail_queryset, create_board
+from trello.views import (
+    BoardDetailView,
+    boards_context,
+    creation_failed,
+    creation_succeeded,
+    header_form_response,
+    listing_paginator,
+    pending_message,
+    wants_fragment,
+)
+
+
+class AsyncCreateBoardView(View):
+    """Handles board-related operations with the async ORM."""
+
+    template_name = "boards.html"
+
+    async def get_context_data(
+        self,
+        show_input: bool = False,
+        message: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> dict:
+        """
+        Constructs the context for rendering the template.
+
+        Args:
+            show_input (bool): Whether to show the input field.
+            message (str): The message to display on the page.
+            after (str): Cursor of the page preceding the one to display.
+            before (str): Cursor of the page following the one to display.
+
+        Returns:
+            dict: The context dictionary for the template.
+        """
+        page = await listing_paginator().aget_page(after=after, before=before)
+        return boards_context(page, show_input, message)
+
+    async def render_page(self, request: HttpRequest, **kwargs) -> HttpResponse:
+        """
+        Renders the boards page.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            **kwargs: Arguments for `get_context_data`.
+
+        Returns:
+            HttpResponse: A response rendering the 'boards.html' template.
+        """
+        context = await self.get_context_data(**kwargs)
+        return render(request, self.template_name, context)
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        """
+        Handles GET requests to render the board creation page.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: A response rendering the 'boards.html' template
+                          with default context.
+        """
+        message = pending_message(request)
+        if message is not None:
+            return await self.render_page(
+                request, show_input=True, message=message
+            )
+
+        # No Last-Modified: deletions leave the latest update time as it
+        # was, so only the ETag, renewed by every write, sees every change.
+        return await aconditional_response(
+            request,
+            etag=listing_etag(
+                await alisting_version(), request.get_full_path()
+            ),
+            last_modified=None,
+            render=lambda: self.render_page(
+                request,
+                after=request.GET.get("after"),
+                before=request.GET.get("before"),
+            ),
+        )
+
+    async def post(self, request: HttpRequest) -> HttpResponse:
+        """
+        Handles POST requests to create a new board.
+
+        Args:
+            request (HttpRequest): The HTTP request object containing
+                                   POST data.
+
+        Returns:
+            HttpResponse: A response rendering the header form or the
+                          'boards.html' template, or redirecting to a newly
+                          created board's page or back to the listing.
+        """
+        if "show_input" in request.POST:
+            if wants_fragment(request):
+                return header_form_response(request, show_input=True)
+            return await self.render_page(request, show_input=True)
+
+        if "board_title" in request.POST:
+            board_title = request.POST.get("board_title", "").strip()
+            if not board_title:
+                return creation_failed(request, board_title)
+            board = await sync_to_async(create_board)(board_title)
+            if board is None:
+                return creation_failed(request, board_title)
+            return creation_succeeded(request, board)
+
+        return await self.render_page(request)
+
+
+class AsyncBoardDetailView(View):
+    """Handles the display of a specific board with the async ORM."""
+
+    template_name = "board_detail.html"
+
+    async def get(self, request: HttpRequest, board_title: str) -> HttpResponse:
+        """
+        Handles GET requests to display a specific board.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            board_title (str): The title of the board to display.
+
+        Returns:
+            HttpResponse: A response rendering the 'board_detail.html' template.
+        """
+        normalized_title = normalize_title(board_title)
+        page = await aget_board_page(normalized_title)
+        if page is not None:
+            return await aconditional_response(
+                request,
+                etag=page.etag,
+                last_modified=page.last_modified,
+                render=lambda: self.cached_response(request, page),
+            )
+
+        board = await aget_object_or_404(
+            board_detail_queryset(), normalized_title=normalized_title
+        )
+        return await aconditional_response(
+            request,
+            etag=board_etag(board),
+            last_modified=board_last_modified(board),
+            render=lambda: self.fresh_response(request, board),
+        )
+
+    @staticmethod
+    async def cached_response(
+        request: HttpRequest, page: CachedPage
+    ) -> HttpResponse:
+        """
+        Builds the response for a cached page.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            page (CachedPage): The cached page.
+
+        Returns:
+            HttpResponse: The page with the visitor's CSRF token filled in.
+        """
+        return BoardDetailView.page_response(request, page)
+
+    async def fresh_response(
+        self, request: HttpRequest, board: Board
+    ) -> HttpResponse:
+        """
+        Renders the page of a board, caches it and builds the response.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            board (Board): The board to render.
+
+        Returns:
+            HttpResponse: The page with the visitor's CSRF token filled in.
+        """
+        context = {"board": board, "csrf_token": CSRF_PLACEHOLDER}
+        body = render_to_string(self.template_name, context, request)
+        page = await aset_board_page(board, body)
+        return BoardDetailView.page_response(request, page)
@@ -0,0 +1,250 @@
+"""In-process prefix index of board titles for autocomplete.
+
+Each worker keeps the normalized titles of all boards in a sorted list, so a
+prefix lookup is a binary search followed by a short scan and never touches
+the database. The index is built on first use, kept current by the `Board`
+signal handlers of the same process, and rebuilt after
+`AUTOCOMPLETE_REFRESH_SECONDS` to pick up boards written by other workers.
+Rebuilds read the database without holding the lock of the lookups, which
+keep answering from the previous index meanwhile.
+"""
+
+import bisect
+import threading
+import time
+
+from typing import Iterable, Optional, TypeAlias
+
+from django.conf import settings
+
+from trello.models import Board, normalize_title
+
+SUGGESTION_LIMIT = 10
+
+# A change made while the index is rebuilt: the board id, normalized title
+# and title of an added board, or None as title for a deleted one.
+Change: TypeAlias = tuple[Optional[int], str, Optional[str]]
+
+
+def read_titles() -> tuple[dict[str, str], dict[int, str]]:
+    """
+    Read the titles of every board from the database.
+
+    Returns:
+        tuple: The titles by normalized title, and the normalized titles by
+            board id.
+    """
+    rows = Board.objects.values_list("pk", "normalized_title", "title")
+    titles, keys_by_id = {}, {}
+    for pk, key, title in rows.iterator(chunk_size=5000):
+        titles[key] = title
+        keys_by_id[pk] = key
+    return titles, keys_by_id
+
+
+class TitleIndex:
+    """
+    A sorted, thread-safe index of board titles by normalized title.
+
+    Attributes:
+        built_at (float | None): The `time.monotonic()` of the last full
+            build, or None before the first one.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index, to be built on first use."""
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._changes: Optional[list[Change]] = None
+        self._keys: list[str] = []
+        self._titles: dict[str, str] = {}
+        self._keys_by_id: dict[int, str] = {}
+        self.built_at: Optional[float] = None
+
+    def reset(self) -> None:
+        """Forget every entry; the next lookup rebuilds the index."""
+        with self._lock:
+            self._keys, self._titles, self._keys_by_id = [], {}, {}
+            self.built_at = None
+
+    def _is_fresh(self) -> bool:
+        """
+        Return whether the index was built less than the refresh time ago.
+
+        Returns:
+            bool: True if the index needs no rebuild.
+        """
+        max_age = settings.AUTOCOMPLETE_REFRESH_SECONDS
+        return self.built_at is not None and (
+            time.monotonic() - self.built_at < max_age
+        )
+
+    def _ensure_built(self) -> None:
+        """
+        Build the index from the database if it is missing or stale.
+
+        One thread rebuilds at a time. Until the first build, lookups wait
+        for it; afterwards they go on with the stale index.
+        """
+        if self._is_fresh():
+            return
+        # A non-blocking acquire cannot be a `with` block.
+        acquired = self._build_lock.acquire(  # pylint: disable=R1732
+            blocking=self.built_at is None
+        )
+        if not acquired:
+            return
+        try:
+            if not self._is_fresh():
+                self._rebuild()
+        finally:
+            self._build_lock.release()
+
+    def _rebuild(self) -> None:
+        """Read every title, then swap them in with the changes made since."""
+        with self._lock:
+            self._changes = []
+        try:
+            titles, keys_by_id = read_titles()
+            keys = sorted(titles)
+        except Exception:
+            with self._lock:
+                self._changes = None
+            raise
+        with self._lock:
+            self._keys, self._titles = keys, titles
+            self._keys_by_id = keys_by_id
+            changes, self._changes = self._changes or [], None
+            for board_id, key, title in changes:
+                self._apply(board_id, key, title)
+            self.built_at = time.monotonic()
+
+    def suggest(self, query: str, limit: int = SUGGESTION_LIMIT) -> list[str]:
+        """
+        Return the titles starting with `query`, ignoring case.
+
+        Args:
+            query (str): The text typed so far.
+            limit (int): The maximum number of titles.
+
+        Returns:
+            list[str]: The matching titles, in normalized order.
+        """
+        prefix = normalize_title(query)
+        if not prefix:
+            return []
+        self._ensure_built()
+        with self._lock:
+            start = bisect.bisect_left(self._keys, prefix)
+            end = start + limit
+            matches = []
+            for key in self._keys[start:end]:
+                if not key.startswith(prefix):
+                    break
+                matches.append(self._titles[key])
+            return matches
+
+    def exists(self, title: str) -> bool:
+        """
+        Return whether a board with this normalized title exists.
+
+        Args:
+            title (str): The title to check.
+
+        Returns:
+            bool: True if the title is taken.
+        """
+        self._ensure_built()
+        with self._lock:
+            return normalize_title(title) in self._titles
+
+    def add(self, board_id: Optional[int], key: str, title: str) -> None:
+        """
+        Add or rename a board in a built index.
+
+        Args:
+            board_id (int | None): The primary key of the board, if known;
+                                   used to drop the key of a renamed board.
+            key (str): The normalized title.
+            title (str): The title.
+        """
+        self._record(board_id, key, title)
+
+    def add_many(self, entries: Iterable[tuple[str, str]]) -> None:
+        """
+        Add boards created in bulk to a built index.
+
+        Args:
+            entries (Iterable[tuple[str, str]]): Pairs of normalized title
+                                                 and title.
+        """
+        for key, title in entries:
+            self.add(None, key, title)
+
+    def discard(self, board_id: int, key: str) -> None:
+        """
+        Remove a deleted board from a built index.
+
+        Args:
+            board_id (int): The primary key of the board.
+            key (str): The normalized title of the board.
+        """
+        self._record(board_id, key, None)
+
+    def _record(
+        self, board_id: Optional[int], key: str, title: Optional[str]
+    ) -> None:
+        """
+        Apply a change to a built index, and keep it for a running rebuild.
+
+        Args:
+            board_id (int | None): The primary key of the board, if known.
+            key (str): The normalized title.
+            title (str | None): The title, or None for a deleted board.
+        """
+        with self._lock:
+            if self._changes is not None:
+                self._changes.append((board_id, key, title))
+            if self.built_at is not None:
+                self._apply(board_id, key, title)
+
+    def _apply(
+        self, board_id: Optional[int], key: str, title: Optional[str]
+    ) -> None:
+        """
+        Add, rename or remove a board; the caller holds the lock.
+
+        Args:
+            board_id (int | None): The primary key of the board, if known;
+                                   used to drop the key of a renamed board.
+            key (str): The normalized title.
+            title (str | None): The title, or None for a deleted board.
+        """
+        if title is None:
+            self._keys_by_id.pop(board_id or 0, None)
+            self._remove(key)
+            return
+        previous = self._keys_by_id.get(board_id) if board_id else None
+        if previous is not None and previous != key:
+            self._remove(previous)
+        if key not in self._titles:
+            bisect.insort(self._keys, key)
+        self._titles[key] = title
+        if board_id:
+            self._keys_by_id[board_id] = key
+
+    def _remove(self, key: str) -> None:
+        """
+        Remove a key; the caller holds the lock.
+
+        Args:
+            key (str): The normalized title to remove.
+        """
+        if self._titles.pop(key, None) is None:
+            return
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+
+title_index = TitleIndex()
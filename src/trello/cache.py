@@ -0,0 +1,360 @@
+"""Cache of rendered board detail pages.
+
+Pages are stored under the board id and a version of the template sources,
+so a deploy that changes any template never serves stale markup. A second
+entry maps the normalized title from the URL to the board id, which lets a
+cache hit skip the database entirely.
+
+The rendered body is shared between visitors, so the CSRF token is rendered
+as `CSRF_PLACEHOLDER` and substituted per request.
+
+The module also derives the HTTP validators (ETags) of the board pages.
+The listing is validated against a version kept in the cache, renewed by
+every write to the boards, so a conditional GET of the listing costs one
+cache read and no query, however many boards there are.
+"""
+
+import hashlib
+import uuid
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.db import transaction
+from django.template import engines
+
+from trello.models import Board
+
+CSRF_PLACEHOLDER = "csrftokenplaceholder0000"
+LISTING_VERSION_KEY = "boards-listing-version"
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """
+    A rendered board detail page.
+
+    Attributes:
+        body (str): The rendered HTML with `CSRF_PLACEHOLDER` in place of
+            the CSRF token.
+        etag (str): The entity tag of the page.
+        last_modified (int): The modification time as a Unix timestamp.
+        normalized_title (str): The normalized title the page was rendered
+            with.
+    """
+
+    body: str
+    etag: str
+    last_modified: int
+    normalized_title: str = ""
+
+
+@lru_cache(maxsize=1)
+def template_version() -> str:
+    """
+    Return a short digest of every template in the template directories,
+    of the template mode and of the static files manifest.
+
+    Returns:
+        str: The template version, computed once per process.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    # Minified pages differ from the others.
+    digest.update(str(settings.TEMPLATE_PRODUCTION).encode())
+    # Pages link to the fingerprinted static files of the deployment.
+    digest.update(getattr(staticfiles_storage, "manifest_hash", "").encode())
+    for engine in engines.all():
+        for directory in engine.dirs:
+            for path in sorted(Path(directory).rglob("*.html")):
+                digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _digest(value: str) -> str:
+    """
+    Return a fixed-length digest safe to use in any cache key.
+
+    Args:
+        value (str): The value to digest.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    return hashlib.sha1(value.encode(), usedforsecurity=False).hexdigest()
+
+
+def _page_key(board_id: int) -> str:
+    """
+    Return the cache key of a board's rendered page.
+
+    Args:
+        board_id (int): The primary key of the board.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"board-page:{template_version()}:{board_id}"
+
+
+def _alias_key(normalized_title: str) -> str:
+    """
+    Return the cache key mapping a normalized title to a board id.
+
+    Args:
+        normalized_title (str): The normalized title of the board.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"board-id:{_digest(normalized_title)}"
+
+
+def board_etag(board: Board) -> str:
+    """
+    Return the entity tag of a board's detail page.
+
+    Args:
+        board (Board): The board.
+
+    Returns:
+        str: A weak ETag; the body differs by CSRF token between visitors.
+    """
+    version = f"{board.pk}:{board.updated_at.isoformat()}:{template_version()}"
+    return f'W/"{_digest(version)[:20]}"'
+
+
+def board_last_modified(board: Board) -> int:
+    """
+    Return the modification time of a board's detail page.
+
+    Args:
+        board (Board): The board.
+
+    Returns:
+        int: The time of the last save as a Unix timestamp.
+    """
+    return int(board.updated_at.timestamp())
+
+
+def listing_etag(version: str, path: str) -> str:
+    """
+    Return the entity tag of a page of the boards listing.
+
+    Args:
+        version (str): The version of the listing (see `listing_version`).
+        path (str): The full path, including the page cursor.
+
+    Returns:
+        str: A weak ETag; the body differs by CSRF token between visitors.
+    """
+    return f'W/"{_digest(f"{version}:{path}:{template_version()}")[:20]}"'
+
+
+def listing_version() -> str:
+    """
+    Return the version of the boards listing.
+
+    A missing version (first use, eviction, restart of a local cache) is
+    replaced by a new random one, so validators issued before never match
+    again.
+
+    Returns:
+        str: The version.
+    """
+    version = cache.get(LISTING_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(LISTING_VERSION_KEY, version, None):
+            version = cache.get(LISTING_VERSION_KEY, version)
+    return version
+
+
+async def alisting_version() -> str:
+    """
+    Return the version of the boards listing without blocking.
+
+    Returns:
+        str: The version.
+    """
+    version = await cache.aget(LISTING_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not await cache.aadd(LISTING_VERSION_KEY, version, None):
+            version = await cache.aget(LISTING_VERSION_KEY, version)
+    return version
+
+
+def _renew_listing_version() -> None:
+    """Replace the version of the boards listing by a new random one."""
+    cache.set(LISTING_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def bump_listing_version() -> None:
+    """
+    Record that the boards listing is changing.
+
+    The version is renewed right away and once more after the commit, so
+    that a concurrent request cannot tag the old rows with the new version.
+    """
+    _renew_listing_version()
+    transaction.on_commit(_renew_listing_version)
+
+
+def get_board_page(normalized_title: str) -> Optional[CachedPage]:
+    """
+    Return the cached page of a board, if any.
+
+    The title alias is only trusted when the page it points to is still
+    cached and was rendered under that title: saving or deleting a board
+    drops the page entry, but the alias of a renamed board lives on, and
+    may be requested again once another board takes the old title.
+
+    Args:
+        normalized_title (str): The normalized title from the URL.
+
+    Returns:
+        CachedPage | None: The cached page, or None on a miss.
+    """
+    board_id = cache.get(_alias_key(normalized_title))
+    if board_id is None:
+        return None
+    return _matching(cache.get(_page_key(board_id)), normalized_title)
+
+
+async def aget_board_page(normalized_title: str) -> Optional[CachedPage]:
+    """
+    Return the cached page of a board, if any, without blocking.
+
+    Args:
+        normalized_title (str): The normalized title from the URL.
+
+    Returns:
+        CachedPage | None: The cached page, or None on a miss.
+    """
+    board_id = await cache.aget(_alias_key(normalized_title))
+    if board_id is None:
+        return None
+    page = await cache.aget(_page_key(board_id))
+    return _matching(page, normalized_title)
+
+
+def _matching(
+    page: Optional[CachedPage], normalized_title: str
+) -> Optional[CachedPage]:
+    """
+    Return a cached page if it was rendered under the requested title.
+
+    Args:
+        page (CachedPage | None): The page the title alias points to.
+        normalized_title (str): The normalized title from the URL.
+
+    Returns:
+        CachedPage | None: The page, or None when it belongs to another
+            title.
+    """
+    if page is None or page.normalized_title != normalized_title:
+        return None
+    return page
+
+
+def _page_entries(board: Board, body: str) -> tuple[CachedPage, dict]:
+    """
+    Build the page of a board and the cache entries storing it.
+
+    Args:
+        board (Board): The board that was rendered.
+        body (str): The rendered HTML, with `CSRF_PLACEHOLDER` as token.
+
+    Returns:
+        tuple: The page and the cache entries to set.
+    """
+    page = CachedPage(
+        body=body,
+        etag=board_etag(board),
+        last_modified=board_last_modified(board),
+        normalized_title=board.normalized_title,
+    )
+    return page, {
+        _alias_key(board.normalized_title): board.pk,
+        _page_key(board.pk): page,
+    }
+
+
+def _page_timeout(board: Board) -> int:
+    """
+    Return how long to cache the page of a board, in seconds.
+
+    A board read from a replica may predate a change whose invalidation
+    already happened, so its page only lives for the pin window, by the end
+    of which the replica is expected to have caught up.
+
+    Args:
+        board (Board): The board that was rendered.
+
+    Returns:
+        int: The cache timeout.
+    """
+    if board._state.db in settings.DATABASE_REPLICAS:  # pylint: disable=W0212
+        return settings.REPLICA_PIN_SECONDS
+    return settings.BOARD_PAGE_CACHE_TIMEOUT
+
+
+def set_board_page(board: Board, body: str) -> CachedPage:
+    """
+    Cache the rendered page of a board.
+
+    Args:
+        board (Board): The board that was rendered.
+        body (str): The rendered HTML, with `CSRF_PLACEHOLDER` as token.
+
+    Returns:
+        CachedPage: The cached page.
+    """
+    page, entries = _page_entries(board, body)
+    cache.set_many(entries, _page_timeout(board))
+    return page
+
+
+async def aset_board_page(board: Board, body: str) -> CachedPage:
+    """
+    Cache the rendered page of a board without blocking.
+
+    Args:
+        board (Board): The board that was rendered.
+        body (str): The rendered HTML, with `CSRF_PLACEHOLDER` as token.
+
+    Returns:
+        CachedPage: The cached page.
+    """
+    page, entries = _page_entries(board, body)
+    await cache.aset_many(entries, _page_timeout(board))
+    return page
+
+
+def invalidate_board_page(board_id: int) -> None:
+    """
+    Drop the cached page of a board.
+
+    Args:
+        board_id (int): The primary key of the board.
+    """
+    cache.delete(_page_key(board_id))
+
+
+def discard_board_page(board_id: int) -> None:
+    """
+    Drop the cached page of a board that is being changed.
+
+    The page is dropped right away and once more after the commit, so that
+    a concurrent request cannot re-cache the old row in between.
+
+    Args:
+        board_id (int): The primary key of the board.
+    """
+    invalidate_board_page(board_id)
+    transaction.on_commit(lambda: invalidate_board_page(board_id))
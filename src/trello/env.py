@@ -0,0 +1,194 @@
+"""Helpers for reading typed configuration values from the environment."""
+
+import os
+
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+
+DATABASE_ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgresql": "django.db.backends.postgresql",
+}
+SESSION_ENGINES = ("cached_db", "signed_cookies", "cache", "db")
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Read an integer from the environment.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (int): The value used when the variable is unset or empty.
+
+    Returns:
+        int: The parsed value or the default.
+    """
+    value = os.environ.get(name, "").strip()
+    return int(value) if value else default
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    The values "1", "true", "yes" and "on" (in any case) count as true.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (bool): The value used when the variable is unset or empty.
+
+    Returns:
+        bool: The parsed value or the default.
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    return value.lower() in {"1", "true", "yes", "on"}
+
+
+def sqlite_pragmas() -> dict[str, object]:
+    """
+    Read the pragmas every SQLite connection runs when it opens.
+
+    In WAL mode readers keep reading the last committed state while a write
+    is in progress, instead of waiting for it; with WAL, synchronous=NORMAL
+    only fsyncs at checkpoints and stays safe against application crashes.
+
+    Returns:
+        dict[str, object]: The pragma values, by name.
+    """
+    return {
+        "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "mmap_size": env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024),
+        # Negative values are in KiB: 64 MiB of page cache per connection.
+        "cache_size": env_int("SQLITE_CACHE_SIZE", -64 * 1024),
+    }
+
+
+def database_settings(sqlite_path: Path) -> dict:
+    """
+    Build the settings of the default database from the environment.
+
+    `DATABASE_ENGINE` picks "sqlite" (the default) or "postgresql", and
+    `DATABASE_NAME` the file or database. PostgreSQL also reads
+    `DATABASE_USER`, `DATABASE_PASSWORD`, `DATABASE_HOST` and
+    `DATABASE_PORT`.
+
+    Connections are opened for each request by default. Either keep them
+    for `DATABASE_CONN_MAX_AGE` seconds, which suits WSGI servers with a
+    fixed set of threads, or, on PostgreSQL, set `DATABASE_POOL` to share a
+    pool of `DATABASE_POOL_MIN_SIZE` to `DATABASE_POOL_MAX_SIZE` connections
+    between the threads of a worker, which also suits ASGI servers; the
+    pool replaces persistent connections. Reused connections are checked
+    before use unless `DATABASE_CONN_HEALTH_CHECKS` is off.
+
+    Args:
+        sqlite_path (Path): The SQLite file used when `DATABASE_NAME` is
+                            not set.
+
+    Returns:
+        dict: The entry of `DATABASES`.
+
+    Raises:
+        ImproperlyConfigured: If the engine is unknown, or pooling is
+                              requested on SQLite.
+    """
+    engine = os.environ.get("DATABASE_ENGINE", "sqlite").strip().lower()
+    pool = env_bool("DATABASE_POOL", False)
+    if engine not in DATABASE_ENGINES:
+        raise ImproperlyConfigured(
+            f"DATABASE_ENGINE must be one of {', '.join(DATABASE_ENGINES)}."
+        )
+    database: dict = {
+        "ENGINE": DATABASE_ENGINES[engine],
+        "CONN_MAX_AGE": 0 if pool else env_int("DATABASE_CONN_MAX_AGE", 0),
+        "CONN_HEALTH_CHECKS": env_bool("DATABASE_CONN_HEALTH_CHECKS", True),
+    }
+    if engine == "sqlite":
+        if pool:
+            raise ImproperlyConfigured("DATABASE_POOL requires PostgreSQL.")
+        database["NAME"] = os.environ.get("DATABASE_NAME", sqlite_path)
+        database["OPTIONS"] = {
+            "init_command": ";".join(
+                f"PRAGMA {name}={value}"
+                for name, value in sqlite_pragmas().items()
+            ),
+            # Take the write lock when a transaction starts. A deferred
+            # transaction that reads before writing fails at once with
+            # "database is locked" when another writer got there first,
+            # without waiting for the busy timeout.
+            "transaction_mode": os.environ.get(
+                "SQLITE_TRANSACTION_MODE", "IMMEDIATE"
+            ),
+            # How long to wait for a lock, in seconds.
+            "timeout": env_int("SQLITE_BUSY_TIMEOUT_MS", 5000) / 1000,
+        }
+        return database
+    for key in ("USER", "PASSWORD", "HOST", "PORT"):
+        database[key] = os.environ.get(f"DATABASE_{key}", "")
+    database["NAME"] = os.environ.get("DATABASE_NAME", "trello")
+    database["OPTIONS"] = {}
+    if pool:
+        database["OPTIONS"]["pool"] = {
+            "min_size": env_int("DATABASE_POOL_MIN_SIZE", 2),
+            "max_size": env_int("DATABASE_POOL_MAX_SIZE", 10),
+            # Seconds a request waits for a free connection.
+            "timeout": env_int("DATABASE_POOL_TIMEOUT", 10),
+        }
+    return database
+
+
+def replica_databases(primary: dict) -> dict[str, dict]:
+    """
+    Build the settings of the read replicas of the default database.
+
+    `DATABASE_REPLICAS` lists the replicas, separated by commas: SQLite
+    files, or PostgreSQL hosts, optionally with a port ("host:5433"). The
+    replicas share every other setting of the primary and are named
+    "replica_1", "replica_2", and so on. Tests read them from the test
+    database of the primary.
+
+    Args:
+        primary (dict): The settings of the default database.
+
+    Returns:
+        dict[str, dict]: The entries of `DATABASES`, by alias.
+    """
+    replicas = {}
+    names = os.environ.get("DATABASE_REPLICAS", "").split(",")
+    for number, name in enumerate(filter(None, map(str.strip, names)), 1):
+        replica = {**primary, "TEST": {"MIRROR": "default"}}
+        if primary["ENGINE"] == DATABASE_ENGINES["sqlite"]:
+            replica["NAME"] = name
+        else:
+            host, _, port = name.partition(":")
+            replica.update(HOST=host, PORT=port or primary["PORT"])
+        replicas[f"replica_{number}"] = replica
+    return replicas
+
+
+def session_engine() -> str:
+    """
+    Read the session store from `SESSION_STORE`.
+
+    "cached_db" (the default) reads sessions from the cache and falls back
+    to the database, where they are also written, so only cache misses and
+    logins touch `django_session`. "signed_cookies" keeps the session in a
+    cookie signed with `SECRET_KEY`, never touching the server, but readable
+    by the visitor and impossible to revoke before it expires. "cache" and
+    "db" use one store only.
+
+    Returns:
+        str: The dotted path of the session engine.
+
+    Raises:
+        ImproperlyConfigured: If the store is unknown.
+    """
+    store = os.environ.get("SESSION_STORE", "cached_db").strip().lower()
+    if store not in SESSION_ENGINES:
+        raise ImproperlyConfigured(
+            f"SESSION_STORE must be one of {', '.join(SESSION_ENGINES)}."
+        )
+    return f"django.contrib.sessions.backends.{store}"
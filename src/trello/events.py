@@ -0,0 +1,374 @@
+"""Live board list updates, streamed to browsers as server-sent events.
+
+The `Board` signal handlers publish an event when a board is created,
+renamed or deleted, once the change is committed. `import_boards`, whose
+bulk INSERT sends no signals, publishes its creations itself. The
+configured backend (`EVENTS_BACKEND`) delivers each event to the `hub` of
+every worker process:
+
+* `LocalBackend` hands it straight to the hub of the publishing process,
+  which is enough with a single worker;
+* `RedisBackend` sends it through a Redis channel that every worker
+  listens to, so visitors connected to any worker receive it.
+
+`BoardEventsView` streams the events of the hub to each open boards page.
+It only runs under the ASGI application: a connection is then an idle
+coroutine waiting on its queue, without a thread, so one worker holds
+thousands of them. Every event is encoded once, whatever the number of
+listeners, and handed to each event loop in a single callback.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncGenerator, Optional, Protocol
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.urls import reverse
+from django.utils.module_loading import import_string
+from django.views import View
+
+from trello.models import Board
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds browsers wait before reconnecting a dropped stream.
+RECONNECT_MS = 5000
+# Seconds the Redis listener waits before resubscribing after an error.
+REDIS_RETRY_SECONDS = 1
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    A listener of the hub: one open event stream.
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): The event loop serving the stream.
+        queue (asyncio.Queue): The encoded events waiting to be sent; None
+            closes the stream.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue[Optional[bytes]]
+
+    def push(self, message: bytes) -> None:
+        """
+        Queue an event, or close a stream that stopped reading.
+
+        Must be called from the loop of the subscription.
+
+        Args:
+            message (bytes): The encoded event.
+        """
+        if self.queue.full():
+            # The browser reconnects and reloads the list it fell behind on.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+        else:
+            self.queue.put_nowait(message)
+
+
+class EventHub:
+    """
+    Broadcast encoded events to the subscriptions of this process.
+
+    Subscriptions are grouped by event loop. `broadcast` may be called from
+    any thread, and wakes each loop once per event.
+    """
+
+    def __init__(self) -> None:
+        """Create a hub without subscriptions."""
+        self._lock = threading.Lock()
+        self._loops: dict[asyncio.AbstractEventLoop, set[Subscription]] = {}
+
+    def subscribe(self, max_pending: int) -> Subscription:
+        """
+        Subscribe the running event loop to the events.
+
+        Args:
+            max_pending (int): The number of unsent events after which the
+                               subscription is closed.
+
+        Returns:
+            Subscription: The new subscription.
+        """
+        subscription = Subscription(
+            asyncio.get_running_loop(), asyncio.Queue(max_pending)
+        )
+        with self._lock:
+            self._loops.setdefault(subscription.loop, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stop delivering events to a subscription.
+
+        Args:
+            subscription (Subscription): The subscription to drop.
+        """
+        with self._lock:
+            subscriptions = self._loops.get(subscription.loop, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._loops.pop(subscription.loop, None)
+
+    def count(self) -> int:
+        """
+        Return the number of subscriptions.
+
+        Returns:
+            int: The number of open event streams of this process.
+        """
+        with self._lock:
+            return sum(map(len, self._loops.values()))
+
+    def broadcast(self, message: bytes) -> None:
+        """
+        Deliver an encoded event to every subscription.
+
+        Args:
+            message (bytes): The encoded event.
+        """
+        with self._lock:
+            loops = list(self._loops)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._deliver, loop, message)
+            except RuntimeError:
+                # The loop was closed without unsubscribing its streams.
+                with self._lock:
+                    self._loops.pop(loop, None)
+
+    def _deliver(self, loop: asyncio.AbstractEventLoop, message: bytes) -> None:
+        """
+        Queue an event for the subscriptions of one loop, on that loop.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running loop.
+            message (bytes): The encoded event.
+        """
+        with self._lock:
+            subscriptions = list(self._loops.get(loop, ()))
+        for subscription in subscriptions:
+            subscription.push(message)
+
+
+hub = EventHub()
+
+
+class EventBackend(Protocol):
+    """Carries published events to the hubs of the worker processes."""
+
+    def publish(self, message: bytes) -> None:
+        """
+        Send an encoded event to every hub.
+
+        Args:
+            message (bytes): The encoded event.
+        """
+
+    def start(self) -> None:
+        """Start feeding the hub of this process, if not done yet."""
+
+
+class LocalBackend:
+    """Deliver events to the hub of the publishing process only."""
+
+    def __init__(self, event_hub: EventHub) -> None:
+        """
+        Feed a hub.
+
+        Args:
+            event_hub (EventHub): The hub of this process.
+        """
+        self.hub = event_hub
+
+    def publish(self, message: bytes) -> None:
+        """
+        Broadcast an encoded event to the hub.
+
+        Args:
+            message (bytes): The encoded event.
+        """
+        self.hub.broadcast(message)
+
+    def start(self) -> None:
+        """Do nothing: published events reach the hub directly."""
+
+
+class RedisBackend:
+    """
+    Fan events out to every worker through the Redis channel
+    `EVENTS_REDIS_CHANNEL` at `EVENTS_REDIS_URL`.
+
+    Each worker starts a daemon thread listening to the channel when its
+    first stream opens. Requires the `redis` package.
+    """
+
+    def __init__(self, event_hub: EventHub) -> None:
+        """
+        Connect to Redis.
+
+        Args:
+            event_hub (EventHub): The hub of this process.
+
+        Raises:
+            ImproperlyConfigured: If the `redis` package is not installed.
+        """
+        try:
+            # pylint: disable=C0415
+            import redis  # type: ignore[import-untyped]
+        except ImportError as error:
+            raise ImproperlyConfigured(
+                "RedisBackend requires the redis package."
+            ) from error
+        self.hub = event_hub
+        self.client = redis.Redis.from_url(settings.EVENTS_REDIS_URL)
+        self.channel = settings.EVENTS_REDIS_CHANNEL
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+
+    def publish(self, message: bytes) -> None:
+        """
+        Publish an encoded event to the channel.
+
+        Args:
+            message (bytes): The encoded event.
+        """
+        self.client.publish(self.channel, message)
+
+    def start(self) -> None:
+        """Start the thread feeding the hub from the channel, once."""
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self.listen, name="board-events", daemon=True
+                )
+                self._listener.start()
+
+    def listen(self) -> None:
+        """Broadcast the messages of the channel, resubscribing on errors."""
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for item in pubsub.listen():
+                    self.hub.broadcast(item["data"])
+            except Exception:  # pylint: disable=W0718
+                logger.exception("Lost the board events channel")
+                time.sleep(REDIS_RETRY_SECONDS)
+
+
+@lru_cache(maxsize=None)
+def get_backend() -> EventBackend:
+    """
+    Return the backend of `EVENTS_BACKEND`, created on first use.
+
+    Returns:
+        EventBackend: The backend feeding the hub of this process.
+    """
+    return import_string(settings.EVENTS_BACKEND)(hub)
+
+
+def board_event(kind: str, board: Board) -> bytes:
+    """
+    Encode an event about a board in the server-sent events format.
+
+    Args:
+        kind (str): "created", "renamed" or "deleted".
+        board (Board): The board concerned.
+
+    Returns:
+        bytes: The event, named after its kind, with the board as JSON.
+    """
+    data = {"id": board.pk, "title": board.title}
+    if kind != "deleted":
+        data["url"] = reverse("board_detail", args=[board.title])
+        data["move_url"] = reverse("move_board", args=[board.title])
+    return f"event: {kind}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def publish(message: bytes) -> None:
+    """
+    Publish an encoded event to every worker.
+
+    Errors are logged rather than raised: a lost live update must not fail
+    the request that changed the board.
+
+    Args:
+        message (bytes): The encoded event.
+    """
+    try:
+        get_backend().publish(message)
+    except Exception:  # pylint: disable=W0718
+        logger.exception("Could not publish a board event")
+
+
+async def stream_events() -> AsyncGenerator[bytes, None]:
+    """
+    Yield the events of the hub, with keepalive comments when idle.
+
+    The subscription is taken on the loop that sends the stream, and
+    dropped when the client disconnects.
+
+    Yields:
+        bytes: The parts of the event stream.
+    """
+    subscription = hub.subscribe(settings.EVENTS_MAX_PENDING)
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n".encode()
+        while True:
+            try:
+                async with asyncio.timeout(settings.EVENTS_KEEPALIVE_SECONDS):
+                    message = await subscription.queue.get()
+            except TimeoutError:
+                # Keeps proxies from closing the idle connection.
+                yield b": keepalive\n\n"
+                continue
+            if message is None:
+                return
+            yield message
+    finally:
+        hub.unsubscribe(subscription)
+
+
+class BoardEventsView(View):
+    """Streams board creations, renames and deletions to the boards page."""
+
+    http_method_names = ["get"]
+
+    async def get(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Handles GET requests opening an event stream.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase: The `text/event-stream` response, or a 501
+                              error outside the ASGI application, where a
+                              stream would hold a thread until it closes.
+        """
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse(
+                "Live updates need the ASGI application.", status=501
+            )
+        get_backend().start()
+        response = StreamingHttpResponse(
+            stream_events(), content_type="text/event-stream"
+        )
+        response.headers["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream.
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
@@ -0,0 +1,87 @@
+"""HTTP helpers shared by the board views."""
+
+from typing import Awaitable, Callable, Optional
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def conditional_response(
+    request: HttpRequest,
+    etag: str,
+    last_modified: Optional[int],
+    render: Callable[[], HttpResponse],
+) -> HttpResponse:
+    """
+    Answer a conditional GET before doing any rendering work.
+
+    `render` is only called when the client's validators do not match.
+    Pages embed a per-visitor CSRF token, so they may be stored by the
+    browser but must be revalidated on every use and never shared.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        etag (str): The entity tag of the current representation.
+        last_modified (int | None): The modification time as a Unix
+            timestamp, if known.
+        render (Callable[[], HttpResponse]): Builds the full response.
+
+    Returns:
+        HttpResponse: A 304/412 response, or the rendered page.
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is None:
+        response = render()
+    return _add_validators(response, etag, last_modified)
+
+
+async def aconditional_response(
+    request: HttpRequest,
+    etag: str,
+    last_modified: Optional[int],
+    render: Callable[[], Awaitable[HttpResponse]],
+) -> HttpResponse:
+    """
+    Async counterpart of `conditional_response` for async views.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        etag (str): The entity tag of the current representation.
+        last_modified (int | None): The modification time as a Unix
+            timestamp, if known.
+        render (Callable[[], Awaitable[HttpResponse]]): Builds the full
+            response.
+
+    Returns:
+        HttpResponse: A 304/412 response, or the rendered page.
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is None:
+        response = await render()
+    return _add_validators(response, etag, last_modified)
+
+
+def _add_validators(
+    response: HttpResponse, etag: str, last_modified: Optional[int]
+) -> HttpResponse:
+    """
+    Set the validator and caching headers of a page response.
+
+    Args:
+        response (HttpResponse): The response to update.
+        etag (str): The entity tag of the page.
+        last_modified (int | None): The modification time, if known.
+
+    Returns:
+        HttpResponse: The updated response.
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,69 @@
+"""Management command streaming all boards as NDJSON or CSV."""
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from trello.export import (
+    DEFAULT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    export_boards,
+    parse_bound,
+)
+
+
+class Command(BaseCommand):
+    """Export boards, optionally limited to a `created_at` range."""
+
+    help = "Stream boards as NDJSON or CSV to stdout or a file."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Declare the command line options.
+
+        Args:
+            parser (CommandParser): The argument parser of the command.
+        """
+        parser.add_argument(
+            "--format", choices=EXPORT_FORMATS, default="ndjson"
+        )
+        parser.add_argument(
+            "--since", help="Only boards created at or after this date-time."
+        )
+        parser.add_argument(
+            "--until", help="Only boards created before this date-time."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE
+        )
+        parser.add_argument(
+            "--output", help="Write to this file instead of stdout."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Run the export.
+
+        Args:
+            *args: Positional arguments (unused).
+            **options: The parsed command line options.
+
+        Raises:
+            CommandError: If a date bound is invalid.
+        """
+        try:
+            blocks = export_boards(
+                options["format"],
+                since=parse_bound(options["since"]),
+                until=parse_bound(options["until"]),
+                chunk_size=options["chunk_size"],
+            )
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+
+        if options["output"]:
+            with open(
+                options["output"], "w", encoding="utf-8", newline=""
+            ) as output:
+                output.writelines(blocks)
+        else:
+            for block in blocks:
+                self.stdout.write(block, ending="")
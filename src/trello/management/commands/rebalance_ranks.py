@@ -0,0 +1,65 @@
+"""Management command respacing the ranks of the boards."""
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Max
+from django.db.models.functions import Length
+
+from trello.models import Board
+from trello.ordering import RANK_REBALANCE_LENGTH
+from trello.services import IMPORT_BATCH_SIZE, rebalance_ranks
+
+
+class Command(BaseCommand):
+    """Compact the board ranks once repeated moves made them long."""
+
+    help = "Give every board a short rank, keeping the listing order."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Declare the command line options.
+
+        Args:
+            parser (CommandParser): The argument parser of the command.
+        """
+        parser.add_argument(
+            "--max-length",
+            type=int,
+            default=RANK_REBALANCE_LENGTH,
+            help="Only rebalance when a rank is longer than this.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebalance whatever the length of the ranks.",
+        )
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options) -> None:
+        """
+        Run the rebalancing.
+
+        Args:
+            *args: Positional arguments (unused).
+            **options: The parsed command line options.
+        """
+        longest = longest_rank()
+        if not options["force"] and longest <= options["max_length"]:
+            self.stdout.write(
+                f"Longest rank has {longest} characters; nothing to do."
+            )
+            return
+        count = rebalance_ranks(batch_size=options["batch_size"])
+        self.stdout.write(
+            f"Rebalanced {count} boards; longest rank went from {longest} "
+            f"to {longest_rank()} characters."
+        )
+
+
+def longest_rank() -> int:
+    """
+    Return the length of the longest board rank.
+
+    Returns:
+        int: The length, 0 when there are no boards.
+    """
+    return Board.objects.aggregate(longest=Max(Length("rank")))["longest"] or 0
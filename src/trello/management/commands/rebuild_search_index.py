@@ -0,0 +1,21 @@
+"""Management command rebuilding the board search index."""
+
+from django.core.management.base import BaseCommand
+
+from trello.search import rebuild_index
+
+
+class Command(BaseCommand):
+    """Re-index every board, e.g. after rows were written with raw SQL."""
+
+    help = "Rebuild the full-text search index of the boards."
+
+    def handle(self, *args, **options) -> None:
+        """
+        Run the rebuild.
+
+        Args:
+            *args: Positional arguments (unused).
+            **options: The parsed command line options (unused).
+        """
+        self.stdout.write(f"Indexed {rebuild_index()} boards.")
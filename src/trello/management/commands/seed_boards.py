@@ -0,0 +1,118 @@
+"""Management command generating boards for benchmarks and load tests."""
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from trello.models import Board
+from trello.seeding import (
+    SEED_BATCH_SIZE,
+    SEED_CHUNK_SIZE,
+    SeedSpec,
+    add_lists,
+    seed_boards,
+)
+
+
+class Command(BaseCommand):
+    """Fill the database with generated boards, lists and cards."""
+
+    help = (
+        "Create boards titled '<prefix> 0' to '<prefix> N-1', optionally "
+        "padded with random words, with lists and cards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Declare the command line options.
+
+        Args:
+            parser (CommandParser): The argument parser of the command.
+        """
+        parser.add_argument("boards", type=int, help="Number of boards.")
+        parser.add_argument("--prefix", default="Board")
+        parser.add_argument(
+            "--min-length", type=int, default=0, help="Shortest padded title."
+        )
+        parser.add_argument(
+            "--max-length",
+            type=int,
+            default=0,
+            help="Longest padded title; 0 leaves titles unpadded.",
+        )
+        parser.add_argument(
+            "--length-mode",
+            type=float,
+            help="Most common padded length; lengths are uniform without it.",
+        )
+        parser.add_argument(
+            "--unicode",
+            type=float,
+            default=0.0,
+            help="Share of titles padded with non-Latin words.",
+        )
+        parser.add_argument(
+            "--days",
+            type=float,
+            default=0.0,
+            help="Spread the creation times over this many days.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--lists", type=int, default=0, help="Lists per board."
+        )
+        parser.add_argument(
+            "--cards", type=int, default=0, help="Cards per list."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SEED_BATCH_SIZE,
+            help="Rows per INSERT call.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=SEED_CHUNK_SIZE,
+            help="Rows per transaction.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Run the seeding.
+
+        Titles that already exist are skipped, so the command can be run
+        again with the same options to grow the data set.
+
+        Args:
+            *args: Positional arguments (unused).
+            **options: The parsed command line options.
+
+        Raises:
+            CommandError: If an option is out of range.
+        """
+        spec = SeedSpec(
+            prefix=options["prefix"],
+            min_length=options["min_length"],
+            max_length=options["max_length"],
+            length_mode=options["length_mode"],
+            unicode_ratio=options["unicode"],
+            days=options["days"],
+            seed=options["seed"],
+        )
+        try:
+            result = seed_boards(
+                options["boards"],
+                spec,
+                batch_size=options["batch_size"],
+                chunk_size=options["chunk_size"],
+            )
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+        if options["lists"]:
+            boards = Board.objects.filter(pk__gt=result.previous_id)
+            for board_id in boards.values_list("pk", flat=True).iterator():
+                add_lists(board_id, options["lists"], options["cards"])
+        self.stdout.write(
+            f"Created {result.created} boards; skipped {result.skipped} "
+            f"existing titles in {result.seconds:.1f} s "
+            f"({result.rows_per_second:,.0f} rows/s)."
+        )
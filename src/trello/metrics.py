@@ -0,0 +1,163 @@
+"""Prometheus metrics of the Trello project.
+
+Request latencies and query counts are recorded per URL name by
+`RequestTimingMiddleware`, board creations by the views, and everything is
+exposed in the Prometheus text format by `MetricsView` at `/metrics`.
+
+With several worker processes, set the `PROMETHEUS_MULTIPROC_DIR`
+environment variable to an empty directory shared by the workers before
+they start. Each worker then keeps its values in memory-mapped files there,
+and `/metrics` aggregates the files of every worker, whichever worker
+answers the scrape. The directory must be emptied when the server restarts.
+"""
+
+import os
+
+from functools import lru_cache
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Used for requests that matched no URL pattern.
+UNMATCHED_VIEW = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "trello_request_duration_seconds",
+    "Time spent handling requests, by URL name.",
+    ["view"],
+)
+DB_QUERIES = Counter(
+    "trello_db_queries",
+    "Database queries made while handling requests, by URL name.",
+    ["view"],
+)
+DB_TIME = Counter(
+    "trello_db_query_duration_seconds",
+    "Time spent in database queries while handling requests, by URL name.",
+    ["view"],
+)
+BOARD_CREATIONS = Counter(
+    "trello_board_creations",
+    "Board creations submitted from the boards page, by outcome "
+    "(created, duplicate or empty).",
+    ["outcome"],
+)
+
+
+def view_name(request: HttpRequest) -> str:
+    """
+    Return the URL name a request was routed to.
+
+    Args:
+        request (HttpRequest): The handled request.
+
+    Returns:
+        str: The URL name, or `UNMATCHED_VIEW`.
+    """
+    match = request.resolver_match
+    return (match.url_name if match else None) or UNMATCHED_VIEW
+
+
+@lru_cache(maxsize=None)
+def _view_metrics(view: str) -> tuple[Histogram, Counter, Counter]:
+    """
+    Return the labelled request metrics of a URL name.
+
+    `labels()` takes a lock and builds a key on every call; the children
+    are looked up once per URL name instead.
+
+    Args:
+        view (str): The URL name.
+
+    Returns:
+        tuple[Histogram, Counter, Counter]: The latency histogram, and the
+            query count and query time counters.
+    """
+    return (
+        REQUEST_LATENCY.labels(view),
+        DB_QUERIES.labels(view),
+        DB_TIME.labels(view),
+    )
+
+
+def observe_request(
+    view: str, duration: float, queries: int, db_time: float
+) -> None:
+    """
+    Record a handled request.
+
+    Args:
+        view (str): The URL name of the request.
+        duration (float): The time taken to handle it, in seconds.
+        queries (int): The number of database queries it made.
+        db_time (float): The time spent in those queries, in seconds.
+    """
+    latency, query_count, query_time = _view_metrics(view)
+    latency.observe(duration)
+    if queries:
+        query_count.inc(queries)
+        query_time.inc(db_time)
+
+
+def count_creation(outcome: str) -> None:
+    """
+    Record the outcome of a board creation.
+
+    Args:
+        outcome (str): "created", "duplicate" or "empty".
+    """
+    BOARD_CREATIONS.labels(outcome).inc()
+
+
+def metrics_registry(path: Optional[str] = None) -> CollectorRegistry:
+    """
+    Return the registry to expose.
+
+    Args:
+        path (str | None): The directory of the multi-process files; by
+                           default `PROMETHEUS_MULTIPROC_DIR`.
+
+    Returns:
+        CollectorRegistry: The registry aggregating every worker in
+                           multi-process mode, or the registry of this
+                           process.
+    """
+    path = path or os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return registry
+
+
+class MetricsView(View):
+    """Exposes the metrics in the Prometheus text format."""
+
+    http_method_names = ["get"]
+
+    def get(
+        self, request: HttpRequest  # pylint: disable=W0613
+    ) -> HttpResponse:
+        """
+        Handles GET requests from the Prometheus scraper.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: The current value of every metric.
+        """
+        return HttpResponse(
+            generate_latest(metrics_registry()),
+            content_type=CONTENT_TYPE_LATEST,
+        )
@@ -0,0 +1,312 @@
+"""Middleware of the Trello project."""
+
+import json
+import logging
+
+from typing import Any, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+
+from trello.metrics import observe_request, view_name
+from trello.routers import PIN_COOKIE, RoutingState, current_routing
+from trello.staticfiles import collected_files
+from trello.timing import RequestTimings, current_timings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimingMiddleware:
+    """
+    Measure where the time of every request goes.
+
+    The number of queries, the database, template and total times are sent
+    in a `Server-Timing` header (unless `SERVER_TIMING` is off), which
+    browser developer tools display. Requests slower than
+    `SLOW_REQUEST_MS` are logged to `trello.middleware` as one JSON object,
+    with the SQL of their `SLOW_REQUEST_QUERIES` slowest queries.
+
+    The same figures feed the Prometheus metrics of `trello.metrics`,
+    labelled with the URL name of the request.
+
+    The total covers the middleware below this one and the view; the body
+    of streaming responses is produced later and is not included. Place
+    the middleware first to time as much of the request as possible.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], Any],
+    ) -> None:
+        """
+        Wrap the next handler of the chain.
+
+        Args:
+            get_response (Callable): The next middleware or the view.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """
+        Handle a request with timings collected.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase | Awaitable[HttpResponseBase]: The response,
+                awaitable when the chain is async.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = RequestTimings(settings.SLOW_REQUEST_QUERIES)
+        token = current_timings.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.report(request, response, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Handle a request with timings collected, in an async chain.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase: The response.
+        """
+        timings = RequestTimings(settings.SLOW_REQUEST_QUERIES)
+        token = current_timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.report(request, response, timings)
+
+    @staticmethod
+    def report(
+        request: HttpRequest,
+        response: HttpResponseBase,
+        timings: RequestTimings,
+    ) -> HttpResponseBase:
+        """
+        Add the `Server-Timing` header, update the request metrics and log
+        the request if it was slow.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            response (HttpResponseBase): The response to the request.
+            timings (RequestTimings): The timings of the request.
+
+        Returns:
+            HttpResponseBase: The response.
+        """
+        elapsed = timings.elapsed()
+        observe_request(
+            view_name(request), elapsed, timings.queries, timings.db_time
+        )
+        total = elapsed * 1000
+        db_time = timings.db_time * 1000
+        template_time = timings.template_time * 1000
+        if settings.SERVER_TIMING:
+            response.headers["Server-Timing"] = (
+                f'db;dur={db_time:.1f};desc="{timings.queries} queries", '
+                f"tpl;dur={template_time:.1f}, total;dur={total:.1f}"
+            )
+        if total >= settings.SLOW_REQUEST_MS:
+            record = {
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "total_ms": round(total, 1),
+                "db_ms": round(db_time, 1),
+                "queries": timings.queries,
+                "template_ms": round(template_time, 1),
+                "slowest_queries": [
+                    {"ms": round(duration * 1000, 1), "sql": sql}
+                    for duration, sql in timings.slowest_queries()
+                ],
+            }
+            logger.warning("Slow request %s", json.dumps(record))
+        return response
+
+
+class ReplicaPinningMiddleware:
+    """
+    Keep the reads of visitors who just wrote on the primary database.
+
+    Requests carrying the pin cookie read from the primary instead of a
+    replica. Responses to requests that wrote set the cookie for
+    `REPLICA_PIN_SECONDS`, so the replicas can catch up before the visitor
+    reads from them again. Nothing happens without `DATABASE_REPLICAS`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], Any],
+    ) -> None:
+        """
+        Wrap the next handler of the chain.
+
+        Args:
+            get_response (Callable): The next middleware or the view.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """
+        Handle a request routed according to the pin cookie.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase | Awaitable[HttpResponseBase]: The response,
+                awaitable when the chain is async.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = RoutingState(pinned=PIN_COOKIE in request.COOKIES)
+        token = current_routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_routing.reset(token)
+        return self.pin(response, state)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Handle a request routed according to the pin cookie, in an async
+        chain.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase: The response.
+        """
+        state = RoutingState(pinned=PIN_COOKIE in request.COOKIES)
+        token = current_routing.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_routing.reset(token)
+        return self.pin(response, state)
+
+    @staticmethod
+    def pin(
+        response: HttpResponseBase, state: RoutingState
+    ) -> HttpResponseBase:
+        """
+        Set the pin cookie on the response of a request that wrote.
+
+        Args:
+            response (HttpResponseBase): The response to the request.
+            state (RoutingState): The routing state of the request.
+
+        Returns:
+            HttpResponseBase: The response.
+        """
+        if state.wrote and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class StaticFilesMiddleware:
+    """
+    Serve the files collected in `STATIC_ROOT`, before any other work.
+
+    The files are listed once, when the middleware is loaded, so
+    `collectstatic` must run before the workers start. Clients get the
+    brotli or gzip copy written by `collectstatic` when they accept it, and
+    keep fingerprinted files for a year without revalidating them (see
+    `trello.staticfiles`). Not used when `SERVE_STATIC` is off, for a web
+    server serving `STATIC_ROOT` itself, or when nothing was collected; the
+    development server serves the static files itself.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], Any],
+    ) -> None:
+        """
+        Wrap the next handler of the chain and list the collected files.
+
+        Args:
+            get_response (Callable): The next middleware or the view.
+
+        Raises:
+            MiddlewareNotUsed: When there are no files to serve.
+        """
+        self.files = collected_files() if settings.SERVE_STATIC else {}
+        if not self.files:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """
+        Serve a static file, or hand the request over.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase | Awaitable[HttpResponseBase]: The response,
+                awaitable when the chain is async.
+        """
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.serve(request) or self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Serve a static file, or hand the request over, in an async chain.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase: The response.
+        """
+        return self.serve(request) or await self.get_response(request)
+
+    def serve(self, request: HttpRequest) -> HttpResponseBase | None:
+        """
+        Return the response to a request for a collected file.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponseBase | None: The file, or None for other requests.
+        """
+        static_file = self.files.get(request.path)
+        if static_file is None or request.method not in ("GET", "HEAD"):
+            return None
+        return static_file.response(request)
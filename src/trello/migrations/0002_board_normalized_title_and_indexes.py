@@ -0,0 +1,68 @@
+# Generated by Django 5.1.3 on 2026-10-18 02:20
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def normalize_title(title: str) -> str:
+    """
+    Return the lookup key of a title as this migration defines it.
+
+    A frozen copy of `trello.models.normalize_title`, so replaying the
+    migration yields the same keys whatever the model later does: NFKC,
+    casefold, and whitespace collapsed to single spaces.
+    """
+    return " ".join(unicodedata.normalize("NFKC", title).casefold().split())
+
+
+def backfill_normalized_title(apps, schema_editor) -> None:
+    """
+    Populate `normalized_title` for existing boards.
+
+    Titles that only differed by case were allowed before, the later boards
+    of such a group get their id appended to their title, so that the title
+    still yields the key and the board stays reachable by its URL.
+    """
+    board_model = apps.get_model("trello", "Board")
+    seen: set[str] = set()
+    boards = board_model.objects.using(schema_editor.connection.alias)
+    for board in boards.order_by("id").iterator(chunk_size=2000):
+        key = normalize_title(board.title)
+        while key in seen:
+            suffix = f" #{board.pk}"
+            board.title = board.title[: 255 - len(suffix)] + suffix
+            key = normalize_title(board.title)
+        seen.add(key)
+        board.normalized_title = key
+        board.save(update_fields=["title", "normalized_title"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trello", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="normalized_title",
+            field=models.CharField(default="", editable=False, max_length=768),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            backfill_normalized_title, migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name="board",
+            name="normalized_title",
+            field=models.CharField(editable=False, max_length=768, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["created_at", "id"], name="board_created_at_id_idx"
+            ),
+        ),
+    ]
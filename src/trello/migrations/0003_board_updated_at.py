@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-18 03:05
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def backfill_updated_at(apps, schema_editor) -> None:
+    """Start the modification time of existing boards at their creation."""
+    board_model = apps.get_model("trello", "Board")
+    board_model.objects.using(schema_editor.connection.alias).update(
+        updated_at=F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trello", "0002_board_normalized_title_and_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.3 on 2026-10-18 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trello", "0003_board_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(
+                fields=["updated_at"], name="board_updated_at_idx"
+            ),
+        ),
+    ]
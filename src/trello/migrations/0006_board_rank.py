@@ -0,0 +1,67 @@
+# Generated by Django 5.1.3 on 2026-10-18 04:10
+
+from django.db import migrations, models
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+RANK_WIDTH = 8
+
+
+def encode_rank(value: int, width: int) -> str:
+    """
+    Write `value / RANK_BASE**width` as a rank, without trailing zeros.
+    """
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, RANK_BASE)
+        digits.append(RANK_DIGITS[digit])
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def spaced_ranks(count: int) -> list[str]:
+    """
+    Return `count` short, evenly spaced ranks, as this migration defines it.
+
+    A frozen copy of `trello.ordering.spaced_ranks`, so replaying the
+    migration yields the same ranks whatever the module later does.
+    """
+    width = RANK_WIDTH
+    while RANK_BASE**width < (count + 1) * RANK_BASE:
+        width += 1
+    gap = RANK_BASE**width // (count + 1)
+    return [encode_rank(gap * (i + 1), width) for i in range(count)]
+
+
+def backfill_rank(apps, schema_editor) -> None:
+    """
+    Rank existing boards in creation order, evenly spaced.
+    """
+    board_model = apps.get_model("trello", "Board")
+    boards = board_model.objects.using(schema_editor.connection.alias)
+    ids = list(boards.order_by("created_at", "id").values_list("pk", flat=True))
+    ranked = [
+        board_model(pk=pk, rank=rank)
+        for pk, rank in zip(ids, spaced_ranks(len(ids)))
+    ]
+    boards.bulk_update(ranked, ["rank"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trello", "0005_lists_and_cards"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="rank",
+            field=models.CharField(default="", editable=False, max_length=255),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_rank, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(fields=["rank", "id"], name="board_rank_id_idx"),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.3 on 2026-10-18 05:00
+
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE trello_board_fts USING fts5("
+    "title, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3 4')",
+    "INSERT INTO trello_board_fts (rowid, title) "
+    "SELECT id, title FROM trello_board",
+]
+SQLITE_BACKWARD = ["DROP TABLE trello_board_fts"]
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX board_normalized_title_trgm_idx ON trello_board "
+    "USING gin (normalized_title gin_trgm_ops)",
+]
+POSTGRESQL_BACKWARD = ["DROP INDEX board_normalized_title_trgm_idx"]
+
+
+def run_for_vendor(statements: dict[str, list[str]]):
+    """
+    Build a migration function running the statements of the database.
+
+    Args:
+        statements (dict[str, list[str]]): The SQL keyed by vendor.
+
+    Returns:
+        Callable: The function for `RunPython`.
+    """
+
+    def run(apps, schema_editor) -> None:  # pylint: disable=W0613
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trello", "0006_board_rank"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor(
+                {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRESQL_FORWARD}
+            ),
+            run_for_vendor(
+                {"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRESQL_BACKWARD}
+            ),
+        ),
+    ]
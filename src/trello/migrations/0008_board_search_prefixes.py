@@ -0,0 +1,56 @@
+# Generated by Django 5.1.3 on 2026-10-18 06:05
+
+from django.db import migrations
+
+
+def rebuild_sql(prefixes: str) -> list[str]:
+    """
+    Build the SQL recreating the FTS5 table with the given prefix indexes.
+
+    Args:
+        prefixes (str): The indexed prefix lengths, space separated.
+
+    Returns:
+        list[str]: The statements.
+    """
+    return [
+        "DROP TABLE trello_board_fts",
+        "CREATE VIRTUAL TABLE trello_board_fts USING fts5("
+        "title, tokenize = 'unicode61 remove_diacritics 2', "
+        f"prefix = '{prefixes}')",
+        "INSERT INTO trello_board_fts (rowid, title) "
+        "SELECT id, title FROM trello_board",
+    ]
+
+
+def run_on_sqlite(statements: list[str]):
+    """
+    Build a migration function running the statements on SQLite only.
+
+    Args:
+        statements (list[str]): The SQL to run.
+
+    Returns:
+        Callable: The function for `RunPython`.
+    """
+
+    def run(apps, schema_editor) -> None:  # pylint: disable=W0613
+        if schema_editor.connection.vendor == "sqlite":
+            for sql in statements:
+                schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("trello", "0007_board_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_on_sqlite(rebuild_sql("2 3 4 5 6 7 8")),
+            run_on_sqlite(rebuild_sql("2 3 4")),
+        ),
+    ]
@@ -1,7 +1,31 @@
 """This module contains models for the Trello application."""
 
+import unicodedata
+
+from typing import Any, Collection, Optional
+
 from django.db import models
 
+from trello.ordering import RANK_MAX_LENGTH, rank_after
+
+TITLE_MAX_LENGTH = 255
+
+
+def normalize_title(title: str) -> str:
+    """
+    Return the case-insensitive lookup key of a board title.
+
+    The title is NFKC-normalized, casefolded and has its whitespace collapsed,
+    so that "My Board", "my  board" and "MY BOARD" share the same key.
+
+    Args:
+        title (str): The title of the board.
+
+    Returns:
+        str: The normalized title.
+    """
+    return " ".join(unicodedata.normalize("NFKC", title).casefold().split())
+
 
 class Board(models.Model):
     """
@@ -9,11 +33,41 @@ class Board(models.Model):
 
     Attributes:
         title (str): The title of the board.
+        normalized_title (str): The case-insensitive lookup key of the title,
+            refreshed when a changed `title` is saved.
+        loaded_title (str | None): The title as last loaded or saved, None
+            for boards not stored yet.
         created_at (datetime): The date and time when the board was created.
+        updated_at (datetime): The date and time when the board was last
+            saved.
+        rank (str): The ordering key of the board in the boards listing
+            (see `trello.ordering`). New boards are ranked last.
     """
 
-    title: models.CharField = models.CharField(max_length=255, unique=True)
+    title: models.CharField = models.CharField(
+        max_length=TITLE_MAX_LENGTH, unique=True
+    )
+    # Casefolding may expand characters (e.g. "ß" -> "ss"), hence the margin.
+    normalized_title: models.CharField = models.CharField(
+        max_length=768, unique=True, editable=False
+    )
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
+    rank: models.CharField = models.CharField(
+        max_length=RANK_MAX_LENGTH, editable=False
+    )
+    loaded_title: Optional[str] = None
+
+    class Meta:
+        """Model options for `Board`."""
+
+        indexes = [
+            models.Index(fields=["rank", "id"], name="board_rank_id_idx"),
+            models.Index(
+                fields=["created_at", "id"], name="board_created_at_id_idx"
+            ),
+            models.Index(fields=["updated_at"], name="board_updated_at_idx"),
+        ]
 
     def __str__(self) -> str:
         """
@@ -23,3 +77,122 @@ class Board(models.Model):
             str: The title of the board.
         """
         return str(self.title)
+
+    @classmethod
+    def from_db(
+        cls,
+        db: Optional[str],
+        field_names: Collection[str],
+        values: Collection[Any],
+        **kwargs: Any,
+    ) -> "Board":
+        """
+        Build a board from a database row, remembering its stored title.
+
+        Args:
+            db (str | None): The alias of the database the row comes from.
+            field_names (Collection[str]): The names of the loaded fields.
+            values (Collection[Any]): The values of the loaded fields.
+            **kwargs: Passed on to `Model.from_db`.
+
+        Returns:
+            Board: The board.
+        """
+        board = super().from_db(db, field_names, values, **kwargs)
+        board.loaded_title = dict(zip(field_names, values)).get("title")
+        return board
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Refresh `normalized_title` if `title` changed, and save the board.
+
+        The key of a stored title is kept as it is, so boards whose key was
+        made unique by the 0002 backfill can still be saved. A board saved
+        without a rank is ranked after the last board.
+        """
+        if "title" in self.__dict__ and self.title != self.loaded_title:
+            self.normalized_title = normalize_title(self.title)
+        if not self.rank:
+            last = Board.objects.aggregate(last=models.Max("rank"))["last"]
+            self.rank = rank_after(last or None, self.normalized_title)
+        super().save(*args, **kwargs)
+        if "title" in self.__dict__:
+            self.loaded_title = self.title
+
+
+class List(models.Model):
+    """
+    Model representing a list (column) of cards on a board.
+
+    Attributes:
+        board (Board): The board the list belongs to.
+        title (str): The title of the list.
+        position (int): The ordering key of the list within its board. Keys
+            are spaced apart (see `trello.ordering`), so moving a list only
+            rewrites its own key.
+        created_at (datetime): The date and time when the list was created.
+    """
+
+    board: "models.ForeignKey[Board, Board]" = models.ForeignKey(
+        Board, on_delete=models.CASCADE, related_name="lists"
+    )
+    board_id: int
+    title: models.CharField = models.CharField(max_length=TITLE_MAX_LENGTH)
+    position: models.BigIntegerField = models.BigIntegerField()
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Model options for `List`."""
+
+        indexes = [
+            models.Index(
+                fields=["board", "position"], name="list_board_position_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the list.
+
+        Returns:
+            str: The title of the list.
+        """
+        return str(self.title)
+
+
+class Card(models.Model):
+    """
+    Model representing a card in a list.
+
+    Attributes:
+        list (List): The list the card belongs to.
+        title (str): The title of the card.
+        position (int): The ordering key of the card within its list.
+        created_at (datetime): The date and time when the card was created.
+    """
+
+    list: "models.ForeignKey[List, List]" = models.ForeignKey(
+        List, on_delete=models.CASCADE, related_name="cards"
+    )
+    list_id: int
+    title: models.CharField = models.CharField(max_length=TITLE_MAX_LENGTH)
+    position: models.BigIntegerField = models.BigIntegerField()
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Model options for `Card`."""
+
+        indexes = [
+            models.Index(
+                fields=["list", "position"], name="card_list_position_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the card.
+
+        Returns:
+            str: The title of the card.
+        """
+        return str(self.title)
@@ -0,0 +1,281 @@
+"""Ordering keys for boards, lists and cards.
+
+Lists and cards are ordered by an integer `position`. New keys are spaced
+`POSITION_GAP` apart, so an item can be moved between two neighbours by
+giving it the midpoint of their keys: one row is updated and the rest of the
+column is left alone. Only when two neighbours end up adjacent (after about
+16 moves into the same gap) is the column renumbered.
+
+Boards, which users reorder across the whole workspace, use string ranks
+instead: base-36 fractions written without the leading "0." or trailing
+zeros, compared as plain strings. There is always a rank between two others,
+so a move never has to renumber anything; ranks only grow longer, one digit
+per five or so moves into the same gap, until `rebalance_ranks` respaces
+them. Appended boards end their ranks with digits derived from their title,
+so boards created at the same time, which read the same last rank, do not
+tie.
+"""
+
+import hashlib
+
+from typing import Optional
+
+POSITION_GAP = 1 << 16
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+# Ranks of up to `RANK_WIDTH` digits are moved to the ends in fixed steps,
+# so appending boards one by one does not lengthen their ranks.
+RANK_WIDTH = 8
+RANK_STEP = RANK_BASE**4
+# Appended ranks end with this many digits of a digest of the item's key
+# (the digits below `RANK_STEP`), so concurrent appends do not tie.
+RANK_TAG_DIGITS = 4
+# Longest rank the database column holds, and the length above which the
+# `rebalance_ranks` command respaces the ranks by default.
+RANK_MAX_LENGTH = 255
+RANK_REBALANCE_LENGTH = 24
+
+
+def position_between(
+    before: Optional[int], after: Optional[int]
+) -> Optional[int]:
+    """
+    Return an ordering key strictly between two neighbouring keys.
+
+    Args:
+        before (int | None): The key of the previous item, or None at the
+                             start of the column.
+        after (int | None): The key of the next item, or None at the end of
+                            the column.
+
+    Returns:
+        int | None: The new key, or None if the neighbours are adjacent and
+                    the column has to be renumbered first.
+    """
+    if before is None and after is None:
+        return POSITION_GAP
+    if after is None:
+        return before + POSITION_GAP if before is not None else None
+    if before is None:
+        return after - POSITION_GAP
+    if after - before < 2:
+        return None
+    return (before + after) // 2
+
+
+def spaced_positions(count: int, start: int = 0) -> list[int]:
+    """
+    Return `count` evenly spaced keys following `start`.
+
+    Args:
+        count (int): The number of keys.
+        start (int): The key preceding the first one.
+
+    Returns:
+        list[int]: The ascending keys.
+    """
+    return [start + POSITION_GAP * (i + 1) for i in range(count)]
+
+
+def _encode_rank(value: int, width: int) -> str:
+    """
+    Write `value / RANK_BASE**width` as a rank.
+
+    Args:
+        value (int): The numerator, between 1 and `RANK_BASE**width - 1`.
+        width (int): The number of digits.
+
+    Returns:
+        str: The rank, without trailing zeros.
+    """
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, RANK_BASE)
+        digits.append(RANK_DIGITS[digit])
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def _step_rank(rank: str, steps: int) -> Optional[str]:
+    """
+    Move a short rank by a whole number of `RANK_STEP`.
+
+    Args:
+        rank (str): The rank to move from.
+        steps (int): The number of steps, negative to move towards the top.
+
+    Returns:
+        str | None: The moved rank, or None if `rank` is too long or the
+                    step leaves the range of ranks.
+    """
+    if len(rank) > RANK_WIDTH:
+        return None
+    value = int(rank.ljust(RANK_WIDTH, "0"), RANK_BASE) + steps * RANK_STEP
+    if not 0 < value < RANK_BASE**RANK_WIDTH:
+        return None
+    return _encode_rank(value, RANK_WIDTH)
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """
+    Return the shortest rank between `low` and `high`.
+
+    Args:
+        low (str): The lower rank, or "" for the start of the range.
+        high (str | None): The upper rank, or None for the end of the range.
+
+    Returns:
+        str: A rank strictly between the two.
+    """
+    prefix = ""
+    while True:
+        if high is not None:
+            padded = low.ljust(len(high), "0")
+            common = 0
+            while common < len(high) and padded[common] == high[common]:
+                common += 1
+            prefix += high[:common]
+            low, high = low[common:], high[common:]
+        low_digit = RANK_DIGITS.index(low[0]) if low else 0
+        high_digit = RANK_DIGITS.index(high[0]) if high else RANK_BASE
+        if high_digit - low_digit > 1:
+            return prefix + RANK_DIGITS[(low_digit + high_digit) // 2]
+        if high is not None and len(high) > 1:
+            return prefix + high[:1]
+        prefix += RANK_DIGITS[low_digit]
+        low, high = low[1:], None
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Return a rank strictly between two neighbouring ranks.
+
+    Args:
+        before (str | None): The rank of the previous item, or None at the
+                             top.
+        after (str | None): The rank of the next item, or None at the
+                            bottom.
+
+    Returns:
+        str: The new rank.
+
+    Raises:
+        ValueError: If `before` does not sort before `after`.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"No rank between {before!r} and {after!r}.")
+    if before is not None and after is None:
+        stepped = _step_rank(before, 1)
+    elif before is None and after is not None:
+        stepped = _step_rank(after, -1)
+    else:
+        stepped = None
+    return stepped or _midpoint(before or "", after)
+
+
+def _rank_tag(key: str) -> str:
+    """
+    Return the `RANK_TAG_DIGITS` digits a key ends its appended ranks with.
+
+    Args:
+        key (str): The unique key of the item, e.g. a normalized title.
+
+    Returns:
+        str: The digits, derived from a digest of the key.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    value = int.from_bytes(digest, "big") % RANK_BASE**RANK_TAG_DIGITS
+    return _encode_rank(value, RANK_TAG_DIGITS).ljust(RANK_TAG_DIGITS, "0")
+
+
+def _next_block(block: str, width: int) -> Optional[str]:
+    """
+    Return the block of `width` digits following `block`.
+
+    Args:
+        block (str): The digits, padded with zeros to `width`.
+        width (int): The number of digits of a block.
+
+    Returns:
+        str | None: The next block, with its zeros, or None after the last.
+    """
+    value = int(block.ljust(width, "0"), RANK_BASE) + 1
+    if value >= RANK_BASE**width:
+        return None
+    return _encode_rank(value, width).ljust(width, "0")
+
+
+def rank_after(before: Optional[str], key: str) -> str:
+    """
+    Return a rank after `before` for an item appended at the bottom.
+
+    The leading digits step past those of `before` and the rank ends with
+    digits derived from `key`. Items appended concurrently after the same
+    rank therefore still get distinct ranks, ordered by their keys, instead
+    of ties. Once the leading digits reach the end of the range, the next
+    block of digits is stepped instead, so each extra block of a rank makes
+    room for as many appends again.
+
+    Args:
+        before (str | None): The rank of the last item, or None when there
+                             are no items.
+        key (str): The unique key of the appended item.
+
+    Returns:
+        str: The new rank.
+    """
+    width = RANK_WIDTH - RANK_TAG_DIGITS
+    if not before:
+        first = rank_between(None, None).ljust(width, "0")
+        return (first + _rank_tag(key)).rstrip("0")
+    start, end = 0, width
+    while True:
+        head = _next_block(before[start:end], width)
+        if head is not None:
+            return (before[:start] + head + _rank_tag(key)).rstrip("0")
+        start, end = end, end + width
+
+
+def ranks_between(
+    before: Optional[str], after: Optional[str], count: int
+) -> list[str]:
+    """
+    Return `count` ascending ranks between two neighbouring ranks.
+
+    The ranks are picked by bisection, so their length grows with the
+    logarithm of `count` rather than with `count`.
+
+    Args:
+        before (str | None): The rank of the previous item, or None.
+        after (str | None): The rank of the next item, or None.
+        count (int): The number of ranks.
+
+    Returns:
+        list[str]: The ranks.
+    """
+    if count <= 0:
+        return []
+    middle = _midpoint(before or "", after)
+    half = (count - 1) // 2
+    return [
+        *ranks_between(before, middle, half),
+        middle,
+        *ranks_between(middle, after, count - 1 - half),
+    ]
+
+
+def spaced_ranks(count: int) -> list[str]:
+    """
+    Return `count` short, evenly spaced ranks.
+
+    Args:
+        count (int): The number of ranks.
+
+    Returns:
+        list[str]: The ascending ranks.
+    """
+    width = RANK_WIDTH
+    while RANK_BASE**width < (count + 1) * RANK_BASE:
+        width += 1
+    gap = RANK_BASE**width // (count + 1)
+    return [_encode_rank(gap * (i + 1), width) for i in range(count)]
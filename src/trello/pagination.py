@@ -0,0 +1,253 @@
+"""Keyset (cursor) pagination for board listings.
+
+Offset pagination gets slower the deeper a client pages because the database
+still has to walk every skipped row. Keyset pagination instead filters on the
+sort key of the last row seen, so every page is a bounded index range scan
+regardless of how many rows the table holds.
+"""
+
+import base64
+import binascii
+import json
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Iterator, Optional
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+
+
+@dataclass(frozen=True)
+class Page:
+    """
+    A single page of results.
+
+    Attributes:
+        items (list): The model instances on this page, in display order.
+        next_cursor (str | None): Cursor for the following page, if any.
+        previous_cursor (str | None): Cursor for the preceding page, if any.
+    """
+
+    items: list = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the items on the page."""
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        """Return the number of items on the page."""
+        return len(self.items)
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset by a unique, ascending pair of fields.
+
+    Attributes:
+        queryset (QuerySet): The unordered queryset to paginate.
+        ordering (tuple[str, str]): The sort key; the last field must be
+            unique so that the key identifies exactly one row.
+        page_size (int): The maximum number of items per page.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        page_size: int,
+        ordering: tuple[str, str] = ("created_at", "id"),
+    ) -> None:
+        """
+        Initializes the paginator.
+
+        Args:
+            queryset (QuerySet): The queryset to paginate.
+            page_size (int): The maximum number of items per page.
+            ordering (tuple[str, str]): The fields to sort and seek on.
+
+        Raises:
+            ValueError: If `page_size` is not positive.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        self.queryset = queryset
+        self.page_size = page_size
+        self.ordering = ordering
+
+    def encode_cursor(self, obj: Model | dict) -> str:
+        """
+        Builds an opaque cursor pointing at `obj`.
+
+        Args:
+            obj (Model | dict): The row the cursor should point at, either a
+                model instance or a dictionary from `QuerySet.values()`.
+
+        Returns:
+            str: A URL-safe cursor string.
+        """
+        meta = self.queryset.model._meta  # pylint: disable=W0212
+        row = SimpleNamespace(**obj) if isinstance(obj, dict) else obj
+        values = [
+            meta.get_field(name).value_to_string(row) for name in self.ordering
+        ]
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> list[Any]:
+        """
+        Parses a cursor produced by `encode_cursor`.
+
+        Args:
+            cursor (str): The cursor string.
+
+        Returns:
+            list: The sort key values, converted to their Python types.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        meta = self.queryset.model._meta  # pylint: disable=W0212
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded))
+            return [
+                meta.get_field(name).to_python(value)
+                for name, value in zip(self.ordering, values, strict=True)
+            ]
+        except (
+            binascii.Error,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ) as error:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from error
+
+    def _seek(self, key: list[Any], forward: bool) -> QuerySet:
+        """
+        Returns the rows strictly after (or before) `key` in sort order.
+
+        Args:
+            key (list): The decoded sort key.
+            forward (bool): Whether to seek past the key or before it.
+
+        Returns:
+            QuerySet: The filtered and ordered queryset.
+        """
+        first, second = self.ordering
+        op = "gt" if forward else "lt"
+        condition = Q(**{f"{first}__{op}": key[0]}) | Q(
+            **{first: key[0], f"{second}__{op}": key[1]}
+        )
+        return self._ordered(forward).filter(condition)
+
+    def _ordered(self, forward: bool) -> QuerySet:
+        """
+        Returns the queryset ordered by the sort key.
+
+        Args:
+            forward (bool): Ascending when True, descending otherwise.
+
+        Returns:
+            QuerySet: The ordered queryset.
+        """
+        prefix = "" if forward else "-"
+        return self.queryset.order_by(*(prefix + f for f in self.ordering))
+
+    def get_page(
+        self, after: Optional[str] = None, before: Optional[str] = None
+    ) -> Page:
+        """
+        Fetches one page of results.
+
+        Only `page_size + 1` rows are read, the extra row tells whether
+        there is another page in the direction of travel. Malformed cursors
+        fall back to the first page.
+
+        Args:
+            after (str | None): Return the page following this cursor.
+            before (str | None): Return the page preceding this cursor.
+
+        Returns:
+            Page: The requested page.
+        """
+        queryset, key, forward = self._window(after, before)
+        return self._build_page(list(queryset), key, forward)
+
+    async def aget_page(
+        self, after: Optional[str] = None, before: Optional[str] = None
+    ) -> Page:
+        """
+        Fetches one page of results using the async ORM.
+
+        Args:
+            after (str | None): Return the page following this cursor.
+            before (str | None): Return the page preceding this cursor.
+
+        Returns:
+            Page: The requested page.
+        """
+        queryset, key, forward = self._window(after, before)
+        return self._build_page([row async for row in queryset], key, forward)
+
+    def _window(
+        self, after: Optional[str], before: Optional[str]
+    ) -> tuple[QuerySet, Optional[list[Any]], bool]:
+        """
+        Builds the bounded query of the requested page.
+
+        Args:
+            after (str | None): Return the page following this cursor.
+            before (str | None): Return the page preceding this cursor.
+
+        Returns:
+            tuple: The query, the decoded cursor (if any) and whether the
+                query walks forward.
+        """
+        key: Optional[list[Any]] = None
+        forward = True
+        try:
+            if before:
+                key, forward = self.decode_cursor(before), False
+            elif after:
+                key = self.decode_cursor(after)
+        except ValueError:
+            key, forward = None, True
+        queryset = (
+            self._ordered(forward) if key is None else self._seek(key, forward)
+        )
+        return queryset[: self.page_size + 1], key, forward
+
+    def _build_page(
+        self, rows: list, key: Optional[list[Any]], forward: bool
+    ) -> Page:
+        """
+        Builds a page from the rows read by the query of `_window`.
+
+        Args:
+            rows (list): Up to `page_size + 1` rows in query order.
+            key (list | None): The decoded cursor, if any.
+            forward (bool): Whether the rows were read forward.
+
+        Returns:
+            Page: The requested page.
+        """
+        items = rows[: self.page_size]
+        has_more = len(rows) > self.page_size
+        if forward:
+            return Page(
+                items=items,
+                next_cursor=self.encode_cursor(items[-1]) if has_more else None,
+                previous_cursor=(
+                    self.encode_cursor(items[0]) if key and items else None
+                ),
+            )
+        items.reverse()
+        return Page(
+            items=items,
+            next_cursor=self.encode_cursor(items[-1]) if items else None,
+            previous_cursor=(
+                self.encode_cursor(items[0]) if has_more else None
+            ),
+        )
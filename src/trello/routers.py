@@ -0,0 +1,142 @@
+"""Routing of the board reads to the read replicas.
+
+Requests read the boards, lists and cards from a random replica listed in
+`DATABASE_REPLICAS`; every write, and everything else, goes to the primary
+("default") database. Replicas lag behind the primary, so a visitor who
+just created or moved a board would not find it there: the request that
+wrote is pinned to the primary from then on, and
+`ReplicaPinningMiddleware` sets a cookie pinning the visitor's following
+requests for `REPLICA_PIN_SECONDS`, which covers the redirect to the new
+board's page.
+
+The routing state of a request lives in a context variable, like its
+timings, and follows it into the threads that async views run the ORM in.
+Outside a request (management commands, the shell), reads stay on the
+primary.
+"""
+
+import random
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+
+# Name of the cookie pinning a visitor's reads to the primary.
+PIN_COOKIE = "pin_primary"
+ROUTED_APPS = {"trello"}
+
+
+@dataclass
+class RoutingState:
+    """
+    Where the reads of one request go.
+
+    Attributes:
+        pinned (bool): Whether reads must go to the primary.
+        wrote (bool): Whether the request wrote to the primary.
+    """
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+current_routing: ContextVar[Optional[RoutingState]] = ContextVar(
+    "current_routing", default=None
+)
+
+
+def record_write() -> None:
+    """Pin the current request, if any, to the primary after a write."""
+    state = current_routing.get()
+    if state is not None:
+        state.wrote = state.pinned = True
+
+
+class ReplicaRouter:
+    """
+    Send the reads of requests to the replicas and the writes to the primary.
+
+    Reads inside a transaction of the primary stay there, so a
+    read-modify-write such as moving a board sees its own transaction.
+    Related objects are read from the database their parent came from.
+    """
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> Optional[str]:
+        """
+        Pick the database to read a model from.
+
+        Args:
+            model (type[Model]): The model being read.
+            **hints: Routing hints, such as the related `instance`.
+
+        Returns:
+            str | None: A replica alias, or None for the primary.
+        """
+        # pylint: disable=W0212
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        state = current_routing.get()
+        if (
+            model._meta.app_label not in ROUTED_APPS
+            or not settings.DATABASE_REPLICAS
+            or state is None
+            or state.pinned
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return None
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(
+        self, model: type[Model], **hints: Any  # pylint: disable=W0613
+    ) -> Optional[str]:
+        """
+        Send writes to the primary and pin the request to it.
+
+        Args:
+            model (type[Model]): The model being written.
+            **hints: Routing hints.
+
+        Returns:
+            str: The primary alias.
+        """
+        record_write()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(
+        self, obj1: Model, obj2: Model, **hints: Any  # pylint: disable=W0613
+    ) -> bool:
+        """
+        Allow relations between objects of any database.
+
+        The replicas hold copies of the primary's rows.
+
+        Args:
+            obj1 (Model): The first object.
+            obj2 (Model): The second object.
+            **hints: Routing hints.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def allow_migrate(
+        self, db: str, app_label: str, **hints: Any  # pylint: disable=W0613
+    ) -> Optional[bool]:
+        """
+        Leave the replicas out of migrations; they copy the primary.
+
+        Args:
+            db (str): The alias of the database being migrated.
+            app_label (str): The application of the migration.
+            **hints: Routing hints.
+
+        Returns:
+            bool | None: False for replicas, None otherwise.
+        """
+        return False if db in settings.DATABASE_REPLICAS else None
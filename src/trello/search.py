@@ -0,0 +1,303 @@
+"""Ranked prefix search over board titles.
+
+On SQLite the titles are mirrored into the FTS5 table `trello_board_fts`,
+keyed by board id and kept in sync by the `Board` signal handlers (and by
+`import_boards`, whose bulk INSERT sends no signals). Every word of the
+query matches as a prefix, except single characters, which match whole
+words only. The table indexes prefixes of two to eight characters; for any
+other prefix SQLite merges the postings of every word it starts, which is
+only cheap for long, specific prefixes.
+
+The work per search is bounded whatever the number of boards: each MATCH
+reads at most `SEARCH_CANDIDATES` rows, newest first, from the posting
+lists, so SQLite never scores every match (bm25 counts them all first).
+Titles holding every query word as a whole word are read first, prefix
+matches only when those are too few, and the titles starting with the
+query come from the `normalized_title` index, so an exact title is never
+crowded out. The candidates are then ordered in Python: by the number of
+whole words, then titles starting with the query, then shorter titles.
+
+On PostgreSQL the `normalized_title` column carries a trigram GIN index
+instead, which serves `LIKE '%...%'` filters; results are ordered by
+trigram similarity. Other databases fall back to a plain substring scan.
+"""
+
+import re
+import unicodedata
+
+from typing import Iterable
+
+from django.db import connection
+from django.db.models import F, FloatField, Func, Value
+
+from trello.models import Board, normalize_title
+
+FTS_TABLE = "trello_board_fts"
+SEARCH_LIMIT = 20
+SEARCH_CANDIDATES = 200
+# The shortest prefix the FTS5 table indexes (see migration 0008).
+FTS_MIN_PREFIX = 2
+
+_WORD = re.compile(r"\w+")
+
+
+def _uses_fts() -> bool:
+    """
+    Return whether the default database keeps the FTS5 index.
+
+    Returns:
+        bool: True on SQLite.
+    """
+    return connection.vendor == "sqlite"
+
+
+def fts_query(query: str, prefix: bool = True) -> str:
+    """
+    Build an FTS5 MATCH expression requiring every word.
+
+    Words are quoted, so FTS5 operators typed by users are matched as
+    text. Words shorter than `FTS_MIN_PREFIX` always match whole words.
+
+    Args:
+        query (str): The text typed by the user.
+        prefix (bool): Whether words match as prefixes or whole words.
+
+    Returns:
+        str: The expression, or "" when the query holds no words.
+    """
+    return " ".join(
+        f'"{word}"*' if prefix and len(word) >= FTS_MIN_PREFIX else f'"{word}"'
+        for word in _WORD.findall(query)
+    )
+
+
+def _fold(text: str) -> str:
+    """
+    Casefold text and strip its diacritics, as the FTS5 tokenizer does.
+
+    Args:
+        text (str): The text to fold.
+
+    Returns:
+        str: The folded text.
+    """
+    normalized = normalize_title(text)
+    if normalized.isascii():
+        return normalized
+    decomposed = unicodedata.normalize("NFKD", normalized)
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+
+
+def _score(title: str, words: list[str], query: str) -> tuple[int, bool, int]:
+    """
+    Return the sort key of a matching title; lower sorts first.
+
+    Args:
+        title (str): The title of the matching board.
+        words (list[str]): The folded words of the query.
+        query (str): The folded query.
+
+    Returns:
+        tuple[int, bool, int]: Missing whole words, whether the title does
+            not start with the query, and the length of the title.
+    """
+    folded = _fold(title)
+    title_words = set(_WORD.findall(folded))
+    whole = sum(word in title_words for word in words)
+    return len(words) - whole, not folded.startswith(query), len(folded)
+
+
+def index_board(board: Board) -> None:
+    """
+    Add or refresh the search entry of a board.
+
+    Args:
+        board (Board): The saved board.
+    """
+    if not _uses_fts():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [board.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title) VALUES (%s, %s)",
+            [board.pk, board.title],
+        )
+
+
+def unindex_board(board_id: int) -> None:
+    """
+    Remove the search entry of a board.
+
+    Args:
+        board_id (int): The primary key of the deleted board.
+    """
+    if not _uses_fts():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [board_id])
+
+
+def index_new_boards(normalized_titles: Iterable[str]) -> None:
+    """
+    Add search entries for bulk-created boards that have none yet.
+
+    Each board is checked by a lookup of its rowid, so the cost follows the
+    number of keys, not the size of the index.
+
+    Args:
+        normalized_titles (Iterable[str]): The keys of the new boards.
+    """
+    keys = list(normalized_titles)
+    if not keys or not _uses_fts():
+        return
+    placeholders = ", ".join(["%s"] * len(keys))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title) "
+            f"SELECT id, title FROM trello_board "
+            f"WHERE normalized_title IN ({placeholders}) AND NOT EXISTS "
+            f"(SELECT 1 FROM {FTS_TABLE} WHERE rowid = trello_board.id)",
+            keys,
+        )
+
+
+def index_boards_after(board_id: int) -> None:
+    """
+    Add search entries for the boards with an id above `board_id`.
+
+    Cheaper than `index_new_boards` for large loads of new boards, which
+    get increasing ids.
+
+    Args:
+        board_id (int): The largest id of the boards already indexed.
+    """
+    if not _uses_fts():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title) "
+            f"SELECT id, title FROM trello_board WHERE id > %s",
+            [board_id],
+        )
+
+
+def rebuild_index() -> int:
+    """
+    Rebuild the search index from the boards table.
+
+    Needed after boards are written without signals, e.g. by raw SQL or
+    `bulk_create`.
+
+    Returns:
+        int: The number of indexed boards.
+    """
+    if not _uses_fts():
+        return Board.objects.count()
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title) "
+            f"SELECT id, title FROM trello_board"
+        )
+        return cursor.rowcount
+
+
+def _fts_matches(expression: str) -> list[tuple[int, str]]:
+    """
+    Return the newest boards matching an FTS5 expression.
+
+    Args:
+        expression (str): The MATCH expression.
+
+    Returns:
+        list[tuple[int, str]]: The ids and titles of at most
+            `SEARCH_CANDIDATES` boards.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, title FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s ORDER BY rowid DESC LIMIT %s",
+            [expression, SEARCH_CANDIDATES],
+        )
+        return cursor.fetchall()
+
+
+def _titles_starting_with(key: str, limit: int) -> list[tuple[int, str]]:
+    """
+    Return the boards whose normalized title starts with `key`.
+
+    The range is read from the unique index of `normalized_title`, the
+    exact title first.
+
+    Args:
+        key (str): The normalized query.
+        limit (int): The maximum number of boards.
+
+    Returns:
+        list[tuple[int, str]]: The ids and titles of the boards.
+    """
+    if not key:
+        return []
+    end = key[:-1] + chr(ord(key[-1]) + 1)
+    boards = Board.objects.filter(
+        normalized_title__gte=key, normalized_title__lt=end
+    ).order_by("normalized_title")
+    return list(boards.values_list("pk", "title")[:limit])
+
+
+def _fts_candidates(query: str, limit: int) -> list[tuple[int, str]]:
+    """
+    Gather the boards that may best match `query`, boundedly.
+
+    Args:
+        query (str): The text typed by the user.
+        limit (int): The number of boards that will be returned.
+
+    Returns:
+        list[tuple[int, str]]: The ids and titles of the candidates.
+    """
+    whole, prefix = fts_query(query, prefix=False), fts_query(query)
+    rows = _fts_matches(whole)
+    if len(rows) < limit and prefix != whole:
+        rows += _fts_matches(prefix)
+    rows += _titles_starting_with(normalize_title(query), limit)
+    return list(dict(rows).items())
+
+
+def search_boards(query: str, limit: int = SEARCH_LIMIT) -> list[Board]:
+    """
+    Return the boards best matching `query`.
+
+    Args:
+        query (str): The text typed by the user.
+        limit (int): The maximum number of boards to return.
+
+    Returns:
+        list[Board]: The matching boards, best match first.
+    """
+    if _uses_fts():
+        if not fts_query(query):
+            return []
+        candidates = _fts_candidates(query, limit)
+        folded = _fold(query)
+        words = _WORD.findall(folded)
+        candidates.sort(key=lambda row: _score(row[1], words, folded))
+        ids = [pk for pk, _ in candidates[:limit]]
+        boards = Board.objects.in_bulk(ids)
+        return [boards[pk] for pk in ids if pk in boards]
+
+    key = normalize_title(query)
+    if not key:
+        return []
+    matches = Board.objects.filter(normalized_title__contains=key)
+    if connection.vendor == "postgresql":
+        similarity: Func = Func(
+            F("normalized_title"),
+            Value(key),
+            function="similarity",
+            output_field=FloatField(),
+        )
+        return list(matches.order_by(similarity.desc(), "id")[:limit])
+    return list(matches.order_by("rank", "id")[:limit])
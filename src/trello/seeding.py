@@ -0,0 +1,306 @@
+"""Fast generation of synthetic boards for scaling tests and benchmarks.
+
+Titles are "<prefix> <n>", optionally padded with random words up to a
+length drawn from a configurable distribution, some of them in non-Latin
+scripts; creation times are spread over a number of days and increase with
+the board id, as they would in a real workspace. The same options and seed
+always produce the same boards, so a load can be repeated or grown.
+
+Rows are built as plain tuples and written in batches by one prepared
+INSERT, in chunked transactions, skipping titles that already exist.
+`bulk_create` builds a model instance and prepares every field of every row
+in Python, which caps it at about 15,000 boards a second here; the tuples
+load several times faster. On SQLite the load also relaxes the durability
+pragmas that only matter if the machine crashes mid-load.
+"""
+
+import random
+import time
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Iterator, Optional
+
+from django.db import connection, transaction
+from django.db.models import Max
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+
+from trello.autocomplete import title_index
+from trello.cache import bump_listing_version
+from trello.models import TITLE_MAX_LENGTH, Board, Card, List, normalize_title
+from trello.ordering import ranks_between, spaced_positions
+from trello.search import index_boards_after
+from trello.services import CREATE_COLUMNS
+
+SEED_BATCH_SIZE = 10_000
+SEED_CHUNK_SIZE = 100_000
+# SQLite settings for the duration of a load: no fsync, temporary b-trees in
+# memory and a 256 MiB page cache.
+SQLITE_LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-262144",
+}
+
+WORDS = (
+    "backlog", "sprint", "roadmap", "release", "design", "research",
+    "marketing", "hiring", "budget", "launch", "support", "planning",
+    "q1", "q2", "q3", "q4", "team", "ideas", "bugs", "ops",
+)  # fmt: skip
+UNICODE_WORDS = (
+    "café", "naïve", "Straße", "über", "señal", "çalışma", "доска",
+    "задачи", "πρόγραμμα", "日本語", "計画", "데이터", "مشروع", "🚀",
+)  # fmt: skip
+
+
+@dataclass(frozen=True)
+class SeedSpec:
+    """
+    Shape of the generated boards.
+
+    Attributes:
+        prefix (str): The first word of every title.
+        min_length (int): The shortest length titles are padded to.
+        max_length (int): The longest length titles are padded to; 0 leaves
+            titles unpadded.
+        length_mode (float | None): The most common padded length, for a
+            triangular distribution; None draws lengths uniformly.
+        unicode_ratio (float): The share of titles padded with non-Latin
+            words.
+        days (float): The number of days, up to now, the creation times are
+            spread over; 0 gives every board the current time.
+        seed (int): The seed of the random generator.
+    """
+
+    prefix: str = "Board"
+    min_length: int = 0
+    max_length: int = 0
+    length_mode: Optional[float] = None
+    unicode_ratio: float = 0.0
+    days: float = 0.0
+    seed: int = 0
+
+    def validate(self) -> None:
+        """
+        Check that the options describe titles that fit the column.
+
+        Raises:
+            ValueError: If an option is out of range.
+        """
+        if not 0 <= self.min_length <= self.max_length <= TITLE_MAX_LENGTH:
+            raise ValueError(
+                f"Title lengths must satisfy 0 <= min <= max <= "
+                f"{TITLE_MAX_LENGTH}."
+            )
+        if self.length_mode is not None and not (
+            self.min_length <= self.length_mode <= self.max_length
+        ):
+            raise ValueError("The length mode must lie between min and max.")
+        if not 0 <= self.unicode_ratio <= 1:
+            raise ValueError("The unicode ratio must lie between 0 and 1.")
+        if self.days < 0:
+            raise ValueError("The number of days cannot be negative.")
+
+
+@dataclass
+class SeedResult:
+    """
+    Outcome of a load.
+
+    Attributes:
+        previous_id (int): The largest board id before the load; the new
+            boards have larger ids.
+        created (int): The number of boards inserted.
+        skipped (int): The number of generated titles that already existed.
+        seconds (float): The wall-clock duration of the load.
+    """
+
+    previous_id: int = 0
+    created: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of generated titles handled per second."""
+        total = self.created + self.skipped
+        return total / self.seconds if self.seconds else 0.0
+
+
+def generate_titles(count: int, spec: SeedSpec) -> Iterator[str]:
+    """
+    Yield `count` unique board titles shaped by `spec`.
+
+    Args:
+        count (int): The number of titles.
+        spec (SeedSpec): The shape of the titles.
+
+    Yields:
+        str: The titles, numbered from 0.
+    """
+    rng = random.Random(spec.seed)
+    for number in range(count):
+        title = base = f"{spec.prefix} {number}"
+        if spec.max_length:
+            if spec.length_mode is None:
+                length = rng.randint(spec.min_length, spec.max_length)
+            else:
+                length = round(
+                    rng.triangular(
+                        spec.min_length, spec.max_length, spec.length_mode
+                    )
+                )
+            words = (
+                UNICODE_WORDS if rng.random() < spec.unicode_ratio else WORDS
+            )
+            while len(title) < length:
+                title = f"{title} {rng.choice(words)}"
+            title = title[: max(length, len(base))].rstrip()
+        yield title
+
+
+@contextmanager
+def fast_load() -> Iterator[None]:
+    """
+    Relax the durability settings of SQLite for the enclosed block.
+
+    Other databases, and loads inside a transaction (where SQLite ignores
+    the settings), are left alone. The previous values are restored on
+    exit.
+
+    Yields:
+        None: Control while the settings are relaxed.
+    """
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        yield
+        return
+    with connection.cursor() as cursor:
+        previous = {}
+        for name, value in SQLITE_LOAD_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}")
+            previous[name] = cursor.fetchone()[0]
+            cursor.execute(f"PRAGMA {name} = {value}")
+        try:
+            yield
+        finally:
+            for name, value in previous.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def _insert_sql() -> str:
+    """
+    Build the INSERT of one board that skips taken titles.
+
+    Returns:
+        str: The statement, with one placeholder per column.
+    """
+    quote = connection.ops.quote_name
+    columns = CREATE_COLUMNS
+    meta = Board._meta  # pylint: disable=E1101,W0212
+    fields = [meta.get_field(name) for name in columns]
+    return " ".join(
+        [
+            connection.ops.insert_statement(on_conflict=OnConflict.IGNORE),
+            quote(meta.db_table),
+            f"({', '.join(quote(name) for name in columns)})",
+            f"VALUES ({', '.join(['%s'] * len(columns))})",
+            connection.ops.on_conflict_suffix_sql(
+                fields, OnConflict.IGNORE, None, None
+            ),
+        ]
+    ).strip()
+
+
+def _rows(count: int, spec: SeedSpec, last_rank: Optional[str]) -> Iterator:
+    """
+    Yield the column values of the generated boards.
+
+    Args:
+        count (int): The number of boards.
+        spec (SeedSpec): The shape of the boards.
+        last_rank (str | None): The largest rank in the table.
+
+    Yields:
+        tuple: The title, normalized title, rank and timestamps of a board.
+    """
+    rng = random.Random(f"{spec.seed}:times")
+    now = timezone.now()
+    start = now - timedelta(days=spec.days)
+    step = timedelta(days=spec.days) / max(count, 1)
+    adapt = connection.ops.adapt_datetimefield_value
+    # Appending ranks one by one exhausts the short ranks after about 850,000
+    # boards; bisecting the whole range keeps them short.
+    ranks = ranks_between(last_rank, None, count)
+    titles = generate_titles(count, spec)
+    for number, (title, rank) in enumerate(zip(titles, ranks)):
+        created = adapt(start + step * (number + rng.random()))
+        yield title, normalize_title(title), rank, created, created
+
+
+def seed_boards(
+    count: int,
+    spec: SeedSpec = SeedSpec(),
+    batch_size: int = SEED_BATCH_SIZE,
+    chunk_size: int = SEED_CHUNK_SIZE,
+) -> SeedResult:
+    """
+    Insert `count` generated boards, ranked after the existing ones.
+
+    Each transaction writes `chunk_size` rows in batches of `batch_size`,
+    then adds the new boards to the search index.
+
+    Args:
+        count (int): The number of titles to generate.
+        spec (SeedSpec): The shape of the boards.
+        batch_size (int): The number of rows per INSERT call.
+        chunk_size (int): The number of rows per transaction.
+
+    Returns:
+        SeedResult: The number of created and skipped boards, and the time
+            the load took.
+    """
+    spec.validate()
+    began = time.perf_counter()
+    result = SeedResult()
+    sql = _insert_sql()
+    last = Board.objects.aggregate(rank=Max("rank"), id=Max("id"))
+    result.previous_id = last["id"] or 0
+    rows = _rows(count, spec, last["rank"])
+    with fast_load(), connection.cursor() as cursor:
+        for chunk_start in range(0, count, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, count)
+            with transaction.atomic():
+                for start in range(chunk_start, chunk_end, batch_size):
+                    size = min(batch_size, chunk_end - start)
+                    cursor.executemany(sql, [next(rows) for _ in range(size)])
+                    result.created += cursor.rowcount
+                index_boards_after(last["id"] or 0)
+                last = Board.objects.aggregate(id=Max("id"))
+    title_index.reset()
+    bump_listing_version()
+    result.skipped = count - result.created
+    result.seconds = time.perf_counter() - began
+    return result
+
+
+def add_lists(board_id: int, lists: int, cards: int) -> None:
+    """
+    Give a board `lists` lists of `cards` cards each.
+
+    Args:
+        board_id (int): The primary key of the board.
+        lists (int): The number of lists.
+        cards (int): The number of cards per list.
+    """
+    with transaction.atomic():
+        created = List.objects.bulk_create(
+            List(board_id=board_id, title=f"List {i}", position=position)
+            for i, position in enumerate(spaced_positions(lists))
+        )
+        Card.objects.bulk_create(
+            Card(list_id=board_list.pk, title=f"Card {i}", position=position)
+            for board_list in created
+            for i, position in enumerate(spaced_positions(cards))
+        )
@@ -10,8 +10,19 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+
 from pathlib import Path
 
+from trello.env import (
+    database_settings,
+    env_bool,
+    env_int,
+    replica_databases,
+    session_engine,
+)
+from trello.templating import PRODUCTION_LOADERS
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -25,7 +36,7 @@ SECRET_KEY = (
 )
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = env_bool("DJANGO_DEBUG", True)
 
 ALLOWED_HOSTS: list[str] = ["*"]
 
@@ -43,7 +54,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "trello.middleware.RequestTimingMiddleware",
+    "trello.middleware.ReplicaPinningMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "trello.middleware.StaticFilesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -54,11 +68,18 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "trello.urls"
 
+# In production mode every template is read, stripped of its comments and
+# indentation, and compiled once per worker, at its start (see
+# `trello.templating`). Otherwise templates are rendered as written, and
+# reloaded when edited under the development server.
+TEMPLATE_PRODUCTION = env_bool("TEMPLATE_PRODUCTION", not DEBUG)
+
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # The Django backend, with render times counted per request.
+        "BACKEND": "trello.timing.TimedDjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
+        "APP_DIRS": not TEMPLATE_PRODUCTION,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -66,23 +87,51 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            **({"loaders": PRODUCTION_LOADERS} if TEMPLATE_PRODUCTION else {}),
         },
     },
 ]
 
 WSGI_APPLICATION = "trello.wsgi.application"
 
+# Serve the board pages with the ASGI-native views of `trello.async_views`.
+# Only worth enabling when running under an ASGI server such as uvicorn.
+ASYNC_VIEWS = env_bool("ASYNC_VIEWS", False)
+
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
+# See `database_settings` for the `DATABASE_*` and `SQLITE_*` variables, and
+# `replica_databases` for `DATABASE_REPLICAS`.
+DATABASES = {"default": database_settings(BASE_DIR / "db.sqlite3")}
+DATABASES.update(replica_databases(DATABASES["default"]))
+
+# Reads of the boards, lists and cards go to a random replica, if any, unless
+# the visitor wrote in the last `REPLICA_PIN_SECONDS` seconds (see
+# `trello.routers.ReplicaRouter`). Allow for the replication lag.
+DATABASE_ROUTERS = ["trello.routers.ReplicaRouter"]
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+REPLICA_PIN_SECONDS = env_int("DATABASE_REPLICA_PIN_SECONDS", 5)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Local memory by default; point `CACHE_BACKEND`/`CACHE_LOCATION` at a shared
+# backend (e.g. "django.core.cache.backends.redis.RedisCache") in production.
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
     }
 }
 
+# Lifetime, in seconds, of a cached board detail page.
+BOARD_PAGE_CACHE_TIMEOUT = env_int("BOARD_PAGE_CACHE_TIMEOUT", 3600)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -129,6 +178,92 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.1/howto/static-files/
 
 STATIC_URL = "static/"
+STATICFILES_DIRS = [BASE_DIR / "static"]
+STATIC_ROOT = Path(os.environ.get("STATIC_ROOT", BASE_DIR / "staticfiles"))
+
+# With the manifest, `collectstatic` fingerprints and precompresses the files
+# (see `trello.staticfiles`), and pages link to the fingerprinted names; it
+# must run before the application starts.
+STATIC_MANIFEST = env_bool("STATIC_MANIFEST", not DEBUG)
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "trello.staticfiles.CompressedManifestStorage"
+            if STATIC_MANIFEST
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        )
+    },
+}
+
+# Serve the collected files from the application (see
+# `trello.middleware.StaticFilesMiddleware`). Turn off when a web server
+# serves `STATIC_ROOT` under `STATIC_URL` instead.
+SERVE_STATIC = env_bool("SERVE_STATIC", True)
+
+# Boards listing
+# Number of boards rendered per page of the `/boards/` listing.
+
+BOARDS_PAGE_SIZE = env_int("BOARDS_PAGE_SIZE", 50)
+
+# JSON API
+# Largest `limit` accepted by `/api/boards/`, and the `max-age`, in seconds,
+# of API responses (0 lets caches store them but revalidate every use).
+
+API_MAX_PAGE_SIZE = env_int("API_MAX_PAGE_SIZE", 500)
+API_CACHE_MAX_AGE = env_int("API_CACHE_MAX_AGE", 0)
+
+# Token that clients of `/api/boards/import/` send as `Authorization: Bearer
+# <token>`. The endpoint takes no CSRF token and is disabled while this is
+# empty.
+API_IMPORT_TOKEN = os.environ.get("API_IMPORT_TOKEN", "")
+
+# Title autocomplete
+# Seconds after which a worker rebuilds its in-memory title index, to pick up
+# boards created or renamed by other workers.
+
+AUTOCOMPLETE_REFRESH_SECONDS = env_int("AUTOCOMPLETE_REFRESH_SECONDS", 300)
+
+# Live updates
+# Backend carrying board events to every worker (see `trello.events`): the
+# default only reaches visitors of the worker that made the change, so set
+# "trello.events.RedisBackend" when running several workers. Idle streams
+# get a keepalive comment every `EVENTS_KEEPALIVE_SECONDS`, and are closed
+# when `EVENTS_MAX_PENDING` events are waiting to be sent.
+
+EVENTS_BACKEND = os.environ.get("EVENTS_BACKEND", "trello.events.LocalBackend")
+EVENTS_REDIS_URL = os.environ.get(
+    "EVENTS_REDIS_URL", "redis://localhost:6379/0"
+)
+EVENTS_REDIS_CHANNEL = os.environ.get("EVENTS_REDIS_CHANNEL", "trello:boards")
+EVENTS_KEEPALIVE_SECONDS = env_int("EVENTS_KEEPALIVE_SECONDS", 15)
+EVENTS_MAX_PENDING = env_int("EVENTS_MAX_PENDING", 100)
+
+# Request timing
+# Whether responses carry a `Server-Timing` header with the query count and the
+# database, template and total times, the duration above which requests are
+# logged as slow, in milliseconds, and how many of their slowest queries are
+# logged (see `trello.middleware.RequestTimingMiddleware`).
+
+SERVER_TIMING = env_bool("SERVER_TIMING", True)
+SLOW_REQUEST_MS = env_int("SLOW_REQUEST_MS", 500)
+SLOW_REQUEST_QUERIES = env_int("SLOW_REQUEST_QUERIES", 3)
+
+# Sessions
+# Board pages never read the session; see `session_engine` for the stores of
+# `SESSION_STORE`. Expired sessions left in the database are removed by the
+# `purge_sessions` command.
+# https://docs.djangoproject.com/en/5.1/topics/http/sessions/#configuring-the-session-engine
+
+SESSION_ENGINE = session_engine()
+
+# Messages
+# Flash messages (such as board creation errors shown after a redirect) travel
+# in a signed cookie, so reading them never touches the session table.
+# https://docs.djangoproject.com/en/5.1/ref/contrib/messages/#storage-backends
+
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
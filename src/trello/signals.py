@@ -0,0 +1,196 @@
+"""Signal handlers keeping derived data in sync with the models."""
+
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from trello.autocomplete import title_index
+from trello.cache import bump_listing_version, discard_board_page
+from trello.events import board_event, publish
+from trello.models import Board, Card, List
+from trello.routers import record_write
+from trello.search import index_board, unindex_board
+from trello.services import touch_board
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def drop_cached_board_page(
+    instance: Board, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Drop the cached detail page of a saved or deleted board.
+
+    Args:
+        instance (Board): The board that was saved or deleted.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    discard_board_page(instance.pk)
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def renew_listing_version(**kwargs) -> None:  # pylint: disable=W0613
+    """
+    Renew the version of the boards listing after a board changes.
+
+    Args:
+        **kwargs: The signal arguments.
+    """
+    bump_listing_version()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def pin_to_primary(**kwargs) -> None:  # pylint: disable=W0613
+    """
+    Pin the current request to the primary database after a write.
+
+    The router sees the writes of the ORM; this also covers the rows that
+    `create_board` inserts with raw SQL.
+
+    Args:
+        **kwargs: The signal arguments.
+    """
+    record_write()
+
+
+@receiver(post_save, sender=Board)
+def index_saved_board(
+    instance: Board, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Refresh the search entry of a saved board.
+
+    Args:
+        instance (Board): The board that was saved.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    index_board(instance)
+
+
+@receiver(post_delete, sender=Board)
+def unindex_deleted_board(
+    instance: Board, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Remove the search entry of a deleted board.
+
+    Args:
+        instance (Board): The board that was deleted.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    unindex_board(instance.pk)
+
+
+@receiver(post_save, sender=Board)
+def add_to_title_index(
+    instance: Board, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Add a saved board to the autocomplete index once it is committed.
+
+    Args:
+        instance (Board): The board that was saved.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    board_id, key, title = (
+        instance.pk,
+        instance.normalized_title,
+        instance.title,
+    )
+    transaction.on_commit(lambda: title_index.add(board_id, key, title))
+
+
+@receiver(post_delete, sender=Board)
+def remove_from_title_index(
+    instance: Board, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Remove a deleted board from the autocomplete index once committed.
+
+    Args:
+        instance (Board): The board that was deleted.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    board_id, key = instance.pk, instance.normalized_title
+    transaction.on_commit(lambda: title_index.discard(board_id, key))
+
+
+@receiver(post_save, sender=Board)
+def announce_saved_board(
+    instance: Board,
+    created: bool,
+    update_fields: Optional[frozenset[str]] = None,
+    **kwargs,  # pylint: disable=W0613
+) -> None:
+    """
+    Publish the creation or the new title of a board once committed.
+
+    Saves limited to other fields than the title, and saves keeping the
+    title the board was loaded with, are not announced.
+
+    Args:
+        instance (Board): The board that was saved.
+        created (bool): Whether the board was created.
+        update_fields (frozenset[str] | None): The saved fields, or None
+            when all of them were.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    if not created:
+        if update_fields is not None and "title" not in update_fields:
+            return
+        if instance.title == instance.loaded_title:
+            return
+    message = board_event("created" if created else "renamed", instance)
+    transaction.on_commit(lambda: publish(message))
+
+
+@receiver(post_delete, sender=Board)
+def announce_deleted_board(
+    instance: Board, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Publish the deletion of a board once committed.
+
+    Args:
+        instance (Board): The board that was deleted.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    message = board_event("deleted", instance)
+    transaction.on_commit(lambda: publish(message))
+
+
+@receiver(post_save, sender=List)
+@receiver(post_delete, sender=List)
+@receiver(post_save, sender=Card)
+@receiver(post_delete, sender=Card)
+def touch_parent_board(
+    sender: type[Model],
+    instance: List | Card,
+    origin: Any = None,
+    **kwargs,  # pylint: disable=W0613
+) -> None:
+    """
+    Mark the board of a saved or deleted list or card as changed.
+
+    Rows removed by the cascade of a parent's deletion are skipped, since
+    the handler of the parent already covers the board.
+
+    Args:
+        sender (type[Model]): The model class of the instance.
+        instance (List | Card): The list or card that was saved or deleted.
+        origin (Any): The instance or queryset whose deletion was requested.
+        **kwargs: Remaining signal arguments.
+    """
+    if origin is not None:
+        model = origin.model if isinstance(origin, QuerySet) else type(origin)
+        if model is not sender:
+            return
+    if isinstance(instance, Card):
+        touch_board(instance.list.board_id)
+    else:
+        touch_board(instance.board_id)
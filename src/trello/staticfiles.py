@@ -0,0 +1,191 @@
+"""Static files: fingerprinted, precompressed, and served from memory.
+
+`CompressedManifestStorage` is Django's manifest storage: `collectstatic`
+copies every file under a name carrying a hash of its contents, which
+`{% static %}` links to. It also writes a gzip copy (`.gz`) and, when the
+`brotli` package is installed, a brotli copy (`.br`) of the text files,
+so nothing is compressed while serving.
+
+`collected_files` lists the files of `STATIC_ROOT` once, for
+`trello.middleware.StaticFilesMiddleware`. Fingerprinted files never change
+under their name, so they are cached by browsers for a year without being
+revalidated; other files must be revalidated on every use.
+"""
+
+import gzip
+import logging
+import mimetypes
+
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import (
+    ManifestStaticFilesStorage,
+    staticfiles_storage,
+)
+from django.http import FileResponse, HttpRequest
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# The suffix of the precompressed copies, by content coding, most preferred
+# first.
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": partial(gzip.compress, compresslevel=9, mtime=0),
+}
+if brotli is not None:
+    COMPRESSORS["br"] = partial(brotli.compress, quality=11)
+
+COMPRESSIBLE = {".css", ".js", ".mjs", ".map", ".svg", ".txt", ".json"}
+
+# Copies saving less than this share of the original are not kept.
+MIN_SAVING = 0.05
+
+
+class CompressedManifestStorage(ManifestStaticFilesStorage):
+    """The manifest storage, precompressing fingerprinted text files."""
+
+    def post_process(self, *args: Any, **kwargs: Any) -> Iterator:
+        """
+        Fingerprint the collected files, then compress the fingerprinted
+        copies.
+
+        Args:
+            *args: The collected files, by name.
+            **kwargs: The options of `collectstatic`, such as `dry_run`.
+
+        Yields:
+            tuple: The original name, fingerprinted name and whether it was
+                processed, or an exception, for each file.
+        """
+        yield from super().post_process(*args, **kwargs)
+        if kwargs.get("dry_run"):
+            return
+        for name in set(self.hashed_files.values()):
+            if Path(name).suffix in COMPRESSIBLE:
+                self.compress(name)
+
+    def compress(self, name: str) -> None:
+        """
+        Write the compressed copies of a file that are worth keeping.
+
+        Args:
+            name (str): The name of the file in the storage.
+        """
+        path = Path(self.path(name))
+        data = path.read_bytes()
+        for encoding, compressor in COMPRESSORS.items():
+            compressed = compressor(data)
+            target = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+            if len(compressed) <= len(data) * (1 - MIN_SAVING):
+                target.write_bytes(compressed)
+                logger.debug("Compressed %s with %s", name, encoding)
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    """
+    A collected static file.
+
+    Attributes:
+        path (Path): The file.
+        content_type (str): Its media type.
+        encodings (tuple[str, ...]): The content codings of its precompressed
+            copies, most preferred first.
+        immutable (bool): Whether it is fingerprinted.
+    """
+
+    path: Path
+    content_type: str
+    encodings: tuple[str, ...]
+    immutable: bool
+
+    def response(self, request: HttpRequest) -> FileResponse:
+        """
+        Return the smallest copy of the file the client accepts.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            FileResponse: The file, with its caching headers.
+        """
+        accepted = accepted_encodings(request.headers.get("Accept-Encoding"))
+        encoding = next((e for e in self.encodings if e in accepted), None)
+        path = self.path
+        if encoding is not None:
+            path = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+        # The response closes the file once sent.
+        response = FileResponse(
+            path.open("rb"),  # pylint: disable=R1732
+            content_type=self.content_type,
+        )
+        if encoding is not None:
+            response["Content-Encoding"] = encoding
+        if self.encodings:
+            patch_vary_headers(response, ["Accept-Encoding"])
+        response["Cache-Control"] = IMMUTABLE if self.immutable else REVALIDATE
+        return response
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    """
+    Parse an `Accept-Encoding` header.
+
+    Args:
+        header (str | None): The header value.
+
+    Returns:
+        set[str]: The content codings the client accepts.
+    """
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, weight = part.partition(";")
+        if weight.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted - {""}
+
+
+def collected_files() -> dict[str, StaticFile]:
+    """
+    List the files of `STATIC_ROOT` by URL path.
+
+    Returns:
+        dict[str, StaticFile]: The files, empty when nothing was collected.
+    """
+    root = Path(settings.STATIC_ROOT or "")
+    if not settings.STATIC_ROOT or not root.is_dir():
+        return {}
+    # Only the manifest storage knows which names are fingerprinted.
+    hashed = set(getattr(staticfiles_storage, "hashed_files", {}).values())
+    files = {}
+    for path in root.rglob("*"):
+        if not path.is_file() or path.suffix in (".br", ".gz"):
+            continue
+        name = path.relative_to(root).as_posix()
+        files[f"{settings.STATIC_URL}{name}"] = StaticFile(
+            path=path,
+            content_type=(
+                mimetypes.guess_type(name)[0] or "application/octet-stream"
+            ),
+            encodings=tuple(
+                encoding
+                for encoding, suffix in ENCODING_SUFFIXES.items()
+                if path.with_name(path.name + suffix).is_file()
+            ),
+            immutable=name in hashed,
+        )
+    return files
@@ -0,0 +1,188 @@
+"""Template loading for production: compiled once, minified at compile time.
+
+`PRODUCTION_LOADERS` wraps the minifying loaders of this module in Django's
+cached loader, so every template is read, minified and compiled once per
+worker, and `warm_templates` does that for all templates when the worker
+starts instead of during its first requests.
+
+The minifying loaders drop the HTML comments of `.html` templates (except
+conditional comments) and the indentation and blank lines, before the
+template is compiled, so rendering costs nothing extra and the comments
+documenting the templates never reach the clients. Newlines are kept, so
+inline scripts still parse the same; the contents of `<pre>` and
+`<textarea>` elements are left untouched. Indentation inside multi-line
+JavaScript template literals would be lost, so scripts avoid them.
+"""
+
+import logging
+import re
+
+from pathlib import Path
+from typing import Iterator
+
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.backends.base import BaseEngine
+from django.template.backends.django import DjangoTemplates
+from django.template.base import Origin
+from django.template.loaders import app_directories, cached, filesystem
+
+logger = logging.getLogger(__name__)
+
+PRODUCTION_LOADERS = [
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "trello.templating.MinifyingFilesystemLoader",
+            "trello.templating.MinifyingAppDirectoriesLoader",
+        ],
+    )
+]
+
+# Elements whose contents are kept (pre, textarea) or only lose their
+# indentation (script, style), and comments, in the order they appear.
+TOKENS = re.compile(
+    r"(?P<raw><(?P<tag>script|style|pre|textarea)\b.*?</(?P=tag)\s*>)"
+    r"|(?P<comment><!--(?!\[if).*?-->)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def squeeze_lines(text: str) -> str:
+    """
+    Remove the indentation, trailing spaces and blank lines of some HTML.
+
+    A leading or trailing run of whitespace becomes a single newline, so
+    words on either side of the text stay apart.
+
+    Args:
+        text (str): The HTML.
+
+    Returns:
+        str: The HTML without the whitespace.
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    squeezed = "\n".join(line for line in lines if line)
+    if not squeezed:
+        return "\n" if text and text.isspace() else ""
+    if text[0].isspace():
+        squeezed = "\n" + squeezed
+    if text[-1].isspace():
+        squeezed += "\n"
+    return squeezed
+
+
+def _pieces(source: str) -> Iterator[str]:
+    """
+    Yield the parts of an HTML template that are kept, squeezed.
+
+    Args:
+        source (str): The template source.
+
+    Yields:
+        str: The text between comments and elements, and the elements.
+    """
+    position = 0
+    for match in TOKENS.finditer(source):
+        start = match.start()
+        yield squeeze_lines(source[position:start])
+        raw = match["raw"]
+        if raw is not None:
+            keep = match["tag"].lower() in ("pre", "textarea")
+            yield raw if keep else squeeze_lines(raw)
+        position = match.end()
+    yield squeeze_lines(source[position:])
+
+
+def minify_html(source: str) -> str:
+    """
+    Strip the comments and the indentation of an HTML template.
+
+    Args:
+        source (str): The template source.
+
+    Returns:
+        str: The minified source.
+    """
+    parts = [""]
+    for piece in _pieces(source):
+        # Text on both sides of a removed comment may end and start a line.
+        if piece.startswith("\n") and parts[-1].endswith("\n"):
+            piece = piece[1:]
+        if piece:
+            parts.append(piece)
+    return "".join(parts).strip() + "\n"
+
+
+class MinifyingFilesystemLoader(filesystem.Loader):
+    """The filesystem loader, minifying HTML templates."""
+
+    def get_contents(self, origin: Origin) -> str:
+        """
+        Read a template and minify it if it is HTML.
+
+        Args:
+            origin (Origin): The template to read.
+
+        Returns:
+            str: The template source.
+        """
+        contents = super().get_contents(origin)
+        if origin.name.endswith(".html"):
+            return minify_html(contents)
+        return contents
+
+
+class MinifyingAppDirectoriesLoader(
+    MinifyingFilesystemLoader, app_directories.Loader
+):
+    """The application directories loader, minifying HTML templates."""
+
+
+def cached_template_names(backend: BaseEngine) -> list[str]:
+    """
+    List the HTML templates the cached loaders of an engine can find.
+
+    Args:
+        backend (BaseEngine): The template engine.
+
+    Returns:
+        list[str]: The template names, sorted; empty for engines without
+            the cached loader.
+    """
+    names = set()
+    loaders = (
+        backend.engine.template_loaders
+        if isinstance(backend, DjangoTemplates)
+        else []
+    )
+    for loader in loaders:
+        if not isinstance(loader, cached.Loader):
+            continue
+        for inner in loader.loaders:
+            for directory in inner.get_dirs():  # type: ignore[attr-defined]
+                for path in Path(directory).rglob("*.html"):
+                    names.add(path.relative_to(directory).as_posix())
+    return sorted(names)
+
+
+def warm_templates() -> int:
+    """
+    Compile every template the cached loaders can find, ahead of requests.
+
+    Does nothing for engines without the cached loader, which would compile
+    the templates again anyway. Templates that do not compile on their own
+    are skipped.
+
+    Returns:
+        int: The number of compiled templates.
+    """
+    compiled = 0
+    for backend in engines.all():
+        for name in cached_template_names(backend):
+            try:
+                backend.get_template(name)
+            except (TemplateDoesNotExist, TemplateSyntaxError) as error:
+                logger.debug("Not warming template %s: %s", name, error)
+            else:
+                compiled += 1
+    return compiled
@@ -0,0 +1,47 @@
+"""Shared fixtures for the Trello test suite."""
+
+from typing import Iterator
+
+import pytest
+
+from django.conf import settings
+from django.core.cache import cache
+
+from trello.autocomplete import title_index
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """
+    Start and finish every test with an empty cache and title index.
+
+    Yields:
+        None: Control to the test.
+    """
+    cache.clear()
+    title_index.reset()
+    yield
+    cache.clear()
+    title_index.reset()
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """
+    Keep the SQLite test database in a file instead of in memory.
+
+    Connections to a shared in-memory database fail at once with "database
+    table is locked" when they write concurrently, while a file database
+    makes them wait for each other, as in production. This lets tests race
+    several threads against the database.
+
+    Args:
+        tmp_path_factory (pytest.TempPathFactory): Creates the directory of
+            the database file.
+    """
+    database = settings.DATABASES["default"]
+    if database["ENGINE"] == "django.db.backends.sqlite3":
+        path = tmp_path_factory.mktemp("database") / "test.sqlite3"
+        database.setdefault("TEST", {})["NAME"] = str(path)
@@ -0,0 +1,249 @@
+"""
+Tests for the JSON endpoints of the Trello application.
+
+These tests validate that the bulk import endpoint accepts titles as plain
+lines, NDJSON or a JSON list, and reports created and skipped titles, and
+that the read-only endpoints paginate, honour sparse fieldsets and answer
+conditional requests.
+"""
+
+import json
+
+import pytest
+
+from django.test import Client
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+
+from trello.models import Board
+
+IMPORT_TOKEN = "import-secret"
+
+
+@pytest.mark.django_db
+class TestBoardImportView:
+    """Test suite for the `BoardImportView` endpoint."""
+
+    @pytest.fixture(name="importer", autouse=True)
+    def fixture_importer(self, settings) -> Client:
+        """
+        Configure the import token and return a client sending it.
+
+        The client enforces CSRF checks, like any client outside the test
+        suite.
+
+        Args:
+            settings: The pytest-django settings fixture.
+
+        Returns:
+            Client: The authenticated client.
+        """
+        settings.API_IMPORT_TOKEN = IMPORT_TOKEN
+        return Client(
+            enforce_csrf_checks=True,
+            headers={"Authorization": f"Bearer {IMPORT_TOKEN}"},
+        )
+
+    def test_import_json_list(self, importer: Client) -> None:
+        """Test importing a JSON list of titles."""
+        Board.objects.create(title="Existing")
+
+        response = importer.post(
+            reverse("import_boards"),
+            data=json.dumps(["One", "Two", "existing"]),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {
+            "created": ["One", "Two"],
+            "skipped": ["existing"],
+            "created_count": 2,
+            "skipped_count": 1,
+        }
+
+    def test_import_plain_lines(self, importer: Client) -> None:
+        """Test importing newline-delimited titles."""
+        response = importer.post(
+            reverse("import_boards"),
+            data="One\nTwo\n\nOne\n",
+            content_type="text/plain",
+        )
+
+        assert response.status_code == 201
+        assert response.json()["created"] == ["One", "Two"]
+        assert response.json()["skipped"] == ["One"]
+
+    def test_import_ndjson(self, importer: Client) -> None:
+        """Test importing one JSON string per line."""
+        response = importer.post(
+            reverse("import_boards"),
+            data='"Line one"\n"Line two"\n',
+            content_type="application/x-ndjson",
+        )
+
+        assert response.json()["created"] == ["Line one", "Line two"]
+
+    def test_nothing_created(self, importer: Client) -> None:
+        """Test that an import creating nothing answers 200."""
+        Board.objects.create(title="Existing")
+
+        response = importer.post(
+            reverse("import_boards"),
+            data=json.dumps({"titles": ["Existing"]}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert response.json()["created_count"] == 0
+
+    def test_invalid_body(self, importer: Client) -> None:
+        """Test that a malformed body is rejected with a 400."""
+        response = importer.post(
+            reverse("import_boards"),
+            data=json.dumps({"titles": [1, 2]}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert Board.objects.count() == 0
+
+    def test_get_not_allowed(self, importer: Client) -> None:
+        """Test that the endpoint only accepts POST requests."""
+        assert importer.get(reverse("import_boards")).status_code == 405
+
+    @pytest.mark.parametrize("authorization", [None, "Bearer wrong", "secret"])
+    def test_token_required(self, authorization: str | None) -> None:
+        """Test that requests without the token are refused."""
+        headers = {"Authorization": authorization} if authorization else {}
+        client = Client(enforce_csrf_checks=True, headers=headers)
+
+        response = client.post(
+            reverse("import_boards"), data="One", content_type="text/plain"
+        )
+
+        assert response.status_code == 401
+        assert response["WWW-Authenticate"] == "Bearer"
+        assert Board.objects.count() == 0
+
+    def test_disabled_without_token(self, settings, importer: Client) -> None:
+        """Test that the endpoint is disabled until a token is set."""
+        settings.API_IMPORT_TOKEN = ""
+
+        response = importer.post(
+            reverse("import_boards"), data="One", content_type="text/plain"
+        )
+
+        assert response.status_code == 403
+        assert Board.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestBoardListAPIView:
+    """Test suite for the `BoardListAPIView` endpoint."""
+
+    def test_pages_follow_cursors(self) -> None:
+        """Test walking every page through the `next` cursors."""
+        for i in range(5):
+            Board.objects.create(title=f"Board {i}")
+
+        titles, url = [], f"{reverse('api_boards')}?limit=2"
+        while url:
+            payload = Client().get(url).json()
+            titles += [board["title"] for board in payload["results"]]
+            cursor = payload["next"]
+            url = (
+                f"{reverse('api_boards')}?limit=2&after={cursor}"
+                if cursor
+                else ""
+            )
+
+        assert titles == [f"Board {i}" for i in range(5)]
+
+    def test_sparse_fieldset(self) -> None:
+        """Test that only the requested fields are returned."""
+        Board.objects.create(title="Sparse")
+
+        response = Client().get(reverse("api_boards"), {"fields": "title"})
+
+        assert response.json()["results"] == [{"title": "Sparse"}]
+
+    @pytest.mark.parametrize(
+        "params", [{"fields": "title,secret"}, {"limit": "0"}, {"limit": "x"}]
+    )
+    def test_invalid_parameters(self, params: dict[str, str]) -> None:
+        """Test that unknown fields and bad limits are rejected."""
+        response = Client().get(reverse("api_boards"), params)
+
+        assert response.status_code == 400
+
+    def test_not_modified(
+        self, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """Test that an unchanged listing is answered with a 304."""
+        Board.objects.create(title="Cached")
+        response = Client().get(reverse("api_boards"))
+
+        assert "public" in response.headers["Cache-Control"]
+        with django_assert_num_queries(0):
+            repeat = Client().get(
+                reverse("api_boards"),
+                headers={"if-none-match": response["ETag"]},
+            )
+
+        assert repeat.status_code == 304
+
+    def test_compressed(self) -> None:
+        """Test that clients accepting gzip get a compressed body."""
+        for i in range(50):
+            Board.objects.create(title=f"Board {i}")
+
+        response = Client().get(
+            reverse("api_boards"), headers={"accept-encoding": "gzip"}
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.django_db
+class TestBoardDetailAPIView:
+    """Test suite for the `BoardDetailAPIView` endpoint."""
+
+    def test_by_id(self) -> None:
+        """Test looking a board up by its primary key."""
+        board = Board.objects.create(title="By id")
+
+        response = Client().get(
+            reverse("api_board_detail", args=[board.pk]), {"fields": "id,title"}
+        )
+
+        assert response.json() == {"id": board.pk, "title": "By id"}
+
+    def test_by_title_ignores_case(self) -> None:
+        """Test looking a board up by a differently cased title."""
+        Board.objects.create(title="My Board")
+
+        response = Client().get(
+            reverse("api_board_by_title", args=["my board"]),
+            {"fields": "title"},
+        )
+
+        assert response.json() == {"title": "My Board"}
+
+    def test_missing(self) -> None:
+        """Test that an unknown board is a JSON 404."""
+        response = Client().get(reverse("api_board_detail", args=[999]))
+
+        assert response.status_code == 404
+        assert response.json() == {"error": "Board not found."}
+
+    def test_not_modified(self) -> None:
+        """Test that the body digest is used to answer conditional GETs."""
+        board = Board.objects.create(title="Detail")
+        url = reverse("api_board_detail", args=[board.pk])
+        etag = Client().get(url)["ETag"]
+
+        assert (
+            Client().get(url, headers={"if-none-match": etag}).status_code
+            == 304
+        )
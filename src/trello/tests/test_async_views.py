@@ -0,0 +1,157 @@
+"""
+Tests for the ASGI-native board views.
+
+These tests validate that `AsyncCreateBoardView` and `AsyncBoardDetailView`
+behave like their sync counterparts: same templates, same context, same
+redirects, error messages and conditional responses.
+"""
+
+from typing import Awaitable, cast
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.test import AsyncRequestFactory, TestCase
+from django.views import View
+
+from trello.async_views import AsyncBoardDetailView, AsyncCreateBoardView
+from trello.models import Board
+
+
+async def dispatch(
+    view_class: type[View], request: HttpRequest, **kwargs
+) -> HttpResponse:
+    """
+    Run an async class-based view on a request.
+
+    Args:
+        view_class (type[View]): The view to run.
+        request (HttpRequest): The request to handle.
+        **kwargs: URL arguments for the view.
+
+    Returns:
+        HttpResponse: The response of the view.
+    """
+    response = view_class.as_view()(request, **kwargs)
+    return await cast(Awaitable[HttpResponse], response)
+
+
+class TestAsyncCreateBoardView(TestCase):
+    """Test the `AsyncCreateBoardView` class."""
+
+    def setUp(self) -> None:
+        """Prepare a request factory."""
+        self.factory = AsyncRequestFactory()
+
+    async def test_get_lists_boards(self) -> None:
+        """Test that the boards page lists existing boards."""
+        await Board.objects.acreate(title="Async Board")
+
+        response = await dispatch(
+            AsyncCreateBoardView, self.factory.get("/boards/")
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Async Board", response.content.decode())
+        self.assertTrue(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    async def test_get_not_modified(self) -> None:
+        """Test that an unchanged listing is answered with a 304."""
+        etag = (
+            await dispatch(AsyncCreateBoardView, self.factory.get("/boards/"))
+        )["ETag"]
+
+        response = await dispatch(
+            AsyncCreateBoardView,
+            self.factory.get("/boards/", headers={"if-none-match": etag}),
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_context_is_paginated(self) -> None:
+        """Test that the context holds one page of boards."""
+        await Board.objects.acreate(title="Paged")
+
+        context = await AsyncCreateBoardView().get_context_data()
+
+        self.assertEqual(
+            [board.title for board in context["boards"]], ["Paged"]
+        )
+        self.assertIs(context["show_input"], False)
+        self.assertIsNone(context["message"])
+
+    async def test_post_creates_board(self) -> None:
+        """Test that posting a title creates the board and redirects."""
+
+        response = await dispatch(
+            AsyncCreateBoardView,
+            self.factory.post("/boards/", {"board_title": "My_Board"}),
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "/boards/My_Board/")
+        self.assertTrue(await Board.objects.filter(title="My_Board").aexists())
+
+    async def test_post_duplicate_title(self) -> None:
+        """Test that a duplicate title returns the form with a message."""
+        await Board.objects.acreate(title="Taken")
+
+        response = await dispatch(
+            AsyncCreateBoardView,
+            self.factory.post(
+                "/boards/",
+                {"board_title": "TAKEN"},
+                headers={"x-fragment": "header-form"},
+            ),
+        )
+
+        content = response.content.decode()
+        self.assertEqual(response.status_code, 422)
+        self.assertIn('<input type="text" id="board_title"', content)
+        self.assertIn("already exists!", content)
+        self.assertEqual(await Board.objects.acount(), 1)
+
+    async def test_post_show_input(self) -> None:
+        """Test that clicking 'Create' shows the board title input."""
+
+        response = await dispatch(
+            AsyncCreateBoardView,
+            self.factory.post("/boards/", {"show_input": "true"}),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('<label for="board_title">', response.content.decode())
+
+
+class TestAsyncBoardDetailView(TestCase):
+    """Test the `AsyncBoardDetailView` class."""
+
+    def setUp(self) -> None:
+        """Prepare a request factory and an empty cache."""
+        self.factory = AsyncRequestFactory()
+        cache.clear()
+
+    async def test_get_board(self) -> None:
+        """Test that a board is rendered and then served from the cache."""
+        await Board.objects.acreate(title="Detail")
+
+        first = await dispatch(
+            AsyncBoardDetailView, self.factory.get("/"), board_title="detail"
+        )
+        second = await dispatch(
+            AsyncBoardDetailView, self.factory.get("/"), board_title="DETAIL"
+        )
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("Detail", first.content.decode())
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    async def test_get_missing_board(self) -> None:
+        """Test that an unknown title yields a 404."""
+
+        with self.assertRaisesMessage(Exception, "No Board matches"):
+            await dispatch(
+                AsyncBoardDetailView,
+                self.factory.get("/"),
+                board_title="missing",
+            )
@@ -0,0 +1,118 @@
+"""
+Tests for the title autocomplete of the Trello application.
+
+These tests validate that the in-memory title index is built once, answers
+prefix and existence lookups without queries, follows committed board
+changes, and is served by the autocomplete endpoint.
+"""
+
+import threading
+
+import pytest
+
+from django.test import Client
+from django.urls import reverse
+from pytest_django import (
+    DjangoAssertNumQueries,
+    DjangoCaptureOnCommitCallbacks,
+)
+
+from trello.autocomplete import read_titles, title_index
+from trello.models import Board
+from trello.services import import_boards
+
+
+@pytest.mark.django_db
+class TestTitleIndex:
+    """Test suite for `TitleIndex`."""
+
+    def test_lookups_after_lazy_build(
+        self, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """Test that only the first lookup reads the database."""
+        for title in ("Roadmap", "Road trip", "Groceries"):
+            Board.objects.create(title=title)
+
+        with django_assert_num_queries(1):
+            assert title_index.suggest("ROAD") == ["Road trip", "Roadmap"]
+        with django_assert_num_queries(0):
+            assert title_index.suggest("road", limit=1) == ["Road trip"]
+            assert title_index.exists("groceries")
+            assert not title_index.exists("Grocery")
+            assert not title_index.suggest("  ")
+
+    def test_follows_committed_changes(
+        self, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+    ) -> None:
+        """Test that created, renamed and deleted boards are reflected."""
+        assert not title_index.suggest("d")
+        with django_capture_on_commit_callbacks(execute=True):
+            board = Board.objects.create(title="Draft")
+        assert title_index.suggest("d") == ["Draft"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            board.title = "Final"
+            board.save()
+        assert not title_index.exists("Draft")
+        assert title_index.suggest("f") == ["Final"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            board.delete()
+        assert not title_index.exists("Final")
+
+    def test_follows_imports(
+        self, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+    ) -> None:
+        """Test that boards created in bulk are added."""
+        title_index.suggest("x")
+        with django_capture_on_commit_callbacks(execute=True):
+            import_boards(["Imported"])
+
+        assert title_index.exists("imported")
+
+    def test_refreshes_when_stale(self, settings) -> None:
+        """Test that boards written elsewhere show up after the refresh."""
+        title_index.suggest("x")
+        Board.objects.bulk_create(
+            [Board(title="Elsewhere", normalized_title="elsewhere")]
+        )
+        assert not title_index.exists("Elsewhere")
+
+        settings.AUTOCOMPLETE_REFRESH_SECONDS = 0
+
+        assert title_index.exists("Elsewhere")
+
+    def test_lookups_during_rebuild(
+        self, settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lookups and changes go on while the index rebuilds."""
+        Board.objects.create(title="Roadmap")
+        title_index.suggest("r")
+        seen = []
+
+        def slow_read() -> tuple[dict[str, str], dict[int, str]]:
+            thread = threading.Thread(
+                target=lambda: seen.append(title_index.suggest("road"))
+            )
+            thread.start()
+            thread.join(timeout=5)
+            title_index.add(None, "road trip", "Road trip")
+            return read_titles()
+
+        monkeypatch.setattr("trello.autocomplete.read_titles", slow_read)
+        settings.AUTOCOMPLETE_REFRESH_SECONDS = 0
+        title_index.suggest("x")
+        settings.AUTOCOMPLETE_REFRESH_SECONDS = 3600
+
+        assert seen == [["Roadmap"]]
+        assert title_index.suggest("road") == ["Road trip", "Roadmap"]
+
+
+@pytest.mark.django_db
+def test_autocomplete_endpoint() -> None:
+    """Test that the endpoint returns suggestions and the exists flag."""
+    Board.objects.create(title="Roadmap")
+
+    response = Client().get(reverse("autocomplete_boards"), {"q": "roadmap"})
+
+    assert response.json() == {"suggestions": ["Roadmap"], "exists": True}
@@ -0,0 +1,213 @@
+"""
+Tests for the cache of rendered board detail pages.
+
+These tests validate that `BoardDetailView` serves repeated requests from the
+cache without database queries, that saving or deleting a board drops its
+cached page, and that both board pages honour ETag and Last-Modified
+validators before rendering, the listing without any query.
+"""
+
+import pytest
+
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+
+from trello.cache import CSRF_PLACEHOLDER, LISTING_VERSION_KEY, get_board_page
+from trello.models import Board
+from trello.services import import_boards, move_board
+
+
+@pytest.mark.django_db
+class TestBoardPageCache:
+    """Test suite for the cached `BoardDetailView`."""
+
+    def test_hit_skips_database(self, django_assert_num_queries) -> None:
+        """Test that a cached page is served without any query."""
+        board = Board.objects.create(title="Cached")
+        client = Client()
+        url = reverse("board_detail", args=[board.title])
+        client.get(url)
+
+        with django_assert_num_queries(0):
+            response = client.get(url)
+
+        assert response.status_code == 200
+        assert "Cached" in response.content.decode()
+
+    def test_csrf_token_is_per_request(self) -> None:
+        """Test that the shared body never leaks the placeholder token."""
+        board = Board.objects.create(title="Tokens")
+        url = reverse("board_detail", args=[board.title])
+        Client().get(url)
+
+        response = Client().get(url)
+        content = response.content.decode()
+
+        assert CSRF_PLACEHOLDER not in content
+        assert 'name="csrfmiddlewaretoken"' in content
+        page = get_board_page("tokens")
+        assert page is not None
+        assert CSRF_PLACEHOLDER in page.body
+
+    def test_save_invalidates(self) -> None:
+        """Test that renaming a board drops its cached page."""
+        board = Board.objects.create(title="Before")
+        client = Client()
+        client.get(reverse("board_detail", args=["Before"]))
+
+        board.title = "After"
+        board.save()
+
+        assert get_board_page("before") is None
+        old_page = client.get(reverse("board_detail", args=["Before"]))
+        new_page = client.get(reverse("board_detail", args=["After"]))
+        assert old_page.status_code == 404
+        assert "After" in new_page.content.decode()
+
+    def test_old_title_reused(self) -> None:
+        """Test that a renamed board's old title reaches the new board."""
+        board = Board.objects.create(title="Before")
+        client = Client()
+        client.get(reverse("board_detail", args=["Before"]))
+        board.title = "After"
+        board.save()
+        client.get(reverse("board_detail", args=["After"]))
+
+        assert (
+            client.get(reverse("board_detail", args=["Before"])).status_code
+            == 404
+        )
+        Board.objects.create(title="Before")
+        page = client.get(reverse("board_detail", args=["Before"])).content
+        assert "<p>Before</p>" in page.decode()
+        assert "<p>After</p>" not in page.decode()
+        assert get_board_page("after") is not None
+
+    def test_delete_invalidates(self) -> None:
+        """Test that deleting a board makes its page return 404."""
+        board = Board.objects.create(title="Doomed")
+        client = Client()
+        url = reverse("board_detail", args=[board.title])
+        client.get(url)
+
+        board.delete()
+
+        assert client.get(url).status_code == 404
+
+    def test_etag_not_modified(self) -> None:
+        """Test that a matching If-None-Match yields a 304 response."""
+        board = Board.objects.create(title="Validators")
+        client = Client()
+        url = reverse("board_detail", args=[board.title])
+        first = client.get(url)
+
+        assert first.has_header("Last-Modified")
+        response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_etag_changes_on_save(self) -> None:
+        """Test that saving a board changes the ETag of its page."""
+        board = Board.objects.create(title="Versioned")
+        client = Client()
+        url = reverse("board_detail", args=[board.title])
+        etag = client.get(url)["ETag"]
+
+        board.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Test suite for conditional GETs of the board pages."""
+
+    def test_listing_not_modified(self, django_assert_num_queries) -> None:
+        """Test that an unchanged listing is answered without a query."""
+        Board.objects.create(title="Listed")
+        client = Client()
+        url = reverse("create_board")
+        etag = client.get(url)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_listing_changes_with_boards(self) -> None:
+        """Test that every kind of board write changes the ETag."""
+        board = Board.objects.create(title="Listed")
+        client = Client()
+        url = reverse("create_board")
+        etags = [client.get(url)["ETag"]]
+
+        for change in (
+            lambda: Board.objects.create(title="Another"),
+            lambda: import_boards(["Imported"]),
+            lambda: move_board(board),
+            board.delete,
+        ):
+            change()
+            etags.append(client.get(url)["ETag"])
+
+        assert len(set(etags)) == 5
+
+    def test_listing_version_evicted(self) -> None:
+        """Test that a lost listing version never validates old ETags."""
+        Board.objects.create(title="Listed")
+        client = Client()
+        url = reverse("create_board")
+        etag = client.get(url)["ETag"]
+        cache.delete(LISTING_VERSION_KEY)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_listing_without_last_modified(self) -> None:
+        """Test that a deletion is not hidden by If-Modified-Since."""
+        Board.objects.create(title="Kept")
+        board = Board.objects.create(title="Deleted")
+        client = Client()
+        url = reverse("create_board")
+        first = client.get(url)
+
+        board.delete()
+        response = client.get(
+            url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+
+        assert not first.has_header("Last-Modified")
+        assert response.status_code == 200
+        assert "Deleted" not in response.content.decode()
+
+    def test_listing_etag_depends_on_page(self, settings) -> None:
+        """Test that different pages of the listing have different ETags."""
+        settings.BOARDS_PAGE_SIZE = 1
+        Board.objects.create(title="First")
+        Board.objects.create(title="Second")
+        client = Client()
+        url = reverse("create_board")
+        first = client.get(url)
+        cursor = first.context["page"].next_cursor
+
+        second = client.get(url, {"after": cursor})
+
+        assert first["ETag"] != second["ETag"]
+
+    def test_detail_not_modified_skips_rendering(self) -> None:
+        """Test that a cache miss still answers a 304 without rendering."""
+        board = Board.objects.create(title="Validated")
+        client = Client()
+        url = reverse("board_detail", args=[board.title])
+        etag = client.get(url)["ETag"]
+        cache.clear()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert get_board_page("validated") is None
@@ -0,0 +1,251 @@
+"""
+Tests for the database connection settings of the Trello project.
+
+These tests validate the settings built from the environment, that
+connections are reused between requests when configured to, that SQLite
+connections run the configured pragmas, that readers are not blocked by a
+write in progress, and that transactions take the write lock as soon as
+they start.
+"""
+
+import threading
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import request_finished, request_started
+from django.db import OperationalError, connection, connections, transaction
+from django.test import Client
+
+from trello.env import database_settings, replica_databases
+from trello.models import Board
+
+sqlite_only = pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="SQLite settings"
+)
+
+
+def pragma(name: str) -> object:
+    """
+    Read a pragma of the default connection.
+
+    Args:
+        name (str): The name of the pragma.
+
+    Returns:
+        object: Its current value.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+def in_thread(func: Callable[[], object]) -> object:
+    """
+    Run `func` on a separate connection and return its result.
+
+    Args:
+        func (Callable[[], object]): The function to run.
+
+    Returns:
+        object: The return value of `func`, or the exception it raised.
+    """
+    outcome: list[object] = []
+
+    def target() -> None:
+        try:
+            outcome.append(func())
+        except OperationalError as error:
+            outcome.append(error)
+        finally:
+            connections.close_all()
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    return outcome[0]
+
+
+class TestDatabaseSettings:
+    """Test suite for `database_settings`."""
+
+    @pytest.fixture(autouse=True)
+    def clean_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Unset the database variables of the environment.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): The environment patcher.
+        """
+        for name in ("ENGINE", "NAME", "POOL", "CONN_MAX_AGE", "REPLICAS"):
+            monkeypatch.delenv(f"DATABASE_{name}", raising=False)
+
+    def test_default(self) -> None:
+        """Test that SQLite opens a connection for each request."""
+        database = database_settings(Path("db.sqlite3"))
+
+        assert database["ENGINE"] == "django.db.backends.sqlite3"
+        assert database["NAME"] == Path("db.sqlite3")
+        assert database["CONN_MAX_AGE"] == 0
+        assert database["CONN_HEALTH_CHECKS"] is True
+        assert "PRAGMA journal_mode=WAL" in database["OPTIONS"]["init_command"]
+
+    def test_persistent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that connections are kept for the configured time."""
+        monkeypatch.setenv("DATABASE_ENGINE", "postgresql")
+        monkeypatch.setenv("DATABASE_CONN_MAX_AGE", "60")
+
+        database = database_settings(Path("db.sqlite3"))
+
+        assert database["ENGINE"] == "django.db.backends.postgresql"
+        assert database["NAME"] == "trello"
+        assert database["CONN_MAX_AGE"] == 60
+        assert database["OPTIONS"] == {}
+
+    def test_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a pool replaces persistent connections."""
+        monkeypatch.setenv("DATABASE_ENGINE", "postgresql")
+        monkeypatch.setenv("DATABASE_CONN_MAX_AGE", "60")
+        monkeypatch.setenv("DATABASE_POOL", "true")
+        monkeypatch.setenv("DATABASE_POOL_MAX_SIZE", "4")
+
+        database = database_settings(Path("db.sqlite3"))
+
+        assert database["CONN_MAX_AGE"] == 0
+        assert database["OPTIONS"]["pool"] == {
+            "min_size": 2,
+            "max_size": 4,
+            "timeout": 10,
+        }
+
+    def test_no_replicas(self) -> None:
+        """Test that there are no replicas by default."""
+        assert not replica_databases(database_settings(Path("db.sqlite3")))
+
+    def test_sqlite_replicas(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that SQLite replicas are named by their files."""
+        monkeypatch.setenv("DATABASE_REPLICAS", "a.sqlite3, b.sqlite3")
+        primary = database_settings(Path("db.sqlite3"))
+
+        replicas = replica_databases(primary)
+
+        assert list(replicas) == ["replica_1", "replica_2"]
+        assert replicas["replica_2"]["NAME"] == "b.sqlite3"
+        assert replicas["replica_2"]["OPTIONS"] == primary["OPTIONS"]
+        assert replicas["replica_2"]["TEST"] == {"MIRROR": "default"}
+
+    def test_postgresql_replicas(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that PostgreSQL replicas are named by their hosts."""
+        monkeypatch.setenv("DATABASE_ENGINE", "postgresql")
+        monkeypatch.setenv("DATABASE_PORT", "5432")
+        monkeypatch.setenv("DATABASE_REPLICAS", "standby,lagging:5433")
+
+        replicas = replica_databases(database_settings(Path("db.sqlite3")))
+
+        assert [
+            (replica["NAME"], replica["HOST"], replica["PORT"])
+            for replica in replicas.values()
+        ] == [("trello", "standby", "5432"), ("trello", "lagging", "5433")]
+
+    @pytest.mark.parametrize(
+        "variables",
+        [
+            {"DATABASE_POOL": "true"},
+            {"DATABASE_ENGINE": "mysql"},
+        ],
+    )
+    def test_invalid(
+        self, monkeypatch: pytest.MonkeyPatch, variables: dict[str, str]
+    ) -> None:
+        """Test that unsupported configurations are rejected."""
+        for name, value in variables.items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(ImproperlyConfigured):
+            database_settings(Path("db.sqlite3"))
+
+
+@pytest.mark.parametrize("max_age, reused", [(0, False), (60, True)])
+@pytest.mark.django_db(transaction=True)
+def test_connection_reuse(
+    monkeypatch: pytest.MonkeyPatch, max_age: int, reused: bool
+) -> None:
+    """Test that `CONN_MAX_AGE` keeps connections between requests."""
+    monkeypatch.setitem(connection.settings_dict, "CONN_MAX_AGE", max_age)
+    connection.close()
+    connection.ensure_connection()
+    opened = connection.connection
+
+    request_started.send(sender=None)
+    Board.objects.count()
+    request_finished.send(sender=None)
+
+    assert (connection.connection is opened) is reused
+    connection.close()
+
+
+@pytest.mark.skipif(
+    "pool" not in connection.settings_dict["OPTIONS"],
+    reason="PostgreSQL connection pool",
+)
+@pytest.mark.django_db(transaction=True)
+def test_pool_reuse() -> None:
+    """Test that requests borrow pooled connections instead of opening."""
+    connection.close()
+    pool = connection.pool  # type: ignore[attr-defined]
+    pool.wait()
+    opened = pool.get_stats().get("connections_num", 0)
+
+    for _ in range(10):
+        assert Client().get("/boards/").status_code == 200
+
+    assert pool.get_stats().get("connections_num", 0) == opened
+
+
+@sqlite_only
+@pytest.mark.django_db
+def test_pragmas() -> None:
+    """Test that connections open in WAL mode with the tuned pragmas."""
+    assert pragma("journal_mode") == "wal"
+    # NORMAL.
+    assert pragma("synchronous") == 1
+    assert pragma("mmap_size") == 256 * 1024 * 1024
+    assert pragma("cache_size") == -64 * 1024
+    assert pragma("busy_timeout") == 5000
+
+
+@sqlite_only
+@pytest.mark.django_db(transaction=True)
+def test_reader_not_blocked_by_writer() -> None:
+    """Test that a write in progress does not stop other readers."""
+    Board.objects.create(title="Committed")
+
+    with transaction.atomic():
+        Board.objects.create(title="Pending")
+
+        titles = in_thread(
+            lambda: list(Board.objects.values_list("title", flat=True))
+        )
+
+    assert titles == ["Committed"]
+
+
+@sqlite_only
+@pytest.mark.django_db(transaction=True)
+def test_transactions_take_write_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a second writer waits from the start of a transaction."""
+    monkeypatch.setitem(connection.settings_dict["OPTIONS"], "timeout", 0.05)
+
+    def write() -> object:
+        with transaction.atomic():
+            return Board.objects.create(title="Second")
+
+    with transaction.atomic():
+        # No statement has run yet, yet the lock is already held.
+        outcome = in_thread(write)
+
+    assert isinstance(outcome, OperationalError)
+    assert "locked" in str(outcome)
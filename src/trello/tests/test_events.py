@@ -0,0 +1,186 @@
+"""
+Tests for the live board list updates.
+
+These tests validate that the hub delivers events published from any
+thread and closes streams that stop reading, that board creations, renames
+and deletions are published once committed, imported boards included, and
+that the events endpoint streams them to ASGI clients only.
+"""
+
+import asyncio
+import threading
+
+from typing import AsyncGenerator, Callable, cast
+
+import pytest
+
+from django.http import StreamingHttpResponse
+from django.test import Client, SimpleTestCase
+
+from trello.events import (
+    EventHub,
+    board_event,
+    hub,
+    publish,
+    stream_events,
+)
+from trello.models import Board
+from trello.services import create_board, import_boards
+
+
+class TestEventHub:
+    """Test suite for `EventHub`."""
+
+    def test_broadcast_from_thread(self) -> None:
+        """Test that events broadcast by other threads reach the loop."""
+
+        async def receive() -> tuple[bytes | None, int]:
+            event_hub = EventHub()
+            subscription = event_hub.subscribe(10)
+            thread = threading.Thread(
+                target=event_hub.broadcast, args=[b"event"]
+            )
+            thread.start()
+            message = await asyncio.wait_for(subscription.queue.get(), 1)
+            thread.join()
+            event_hub.unsubscribe(subscription)
+            return message, event_hub.count()
+
+        assert asyncio.run(receive()) == (b"event", 0)
+
+    def test_slow_subscription_closed(self) -> None:
+        """Test that a stream too far behind is told to close."""
+
+        async def receive() -> list[bytes | None]:
+            event_hub = EventHub()
+            subscription = event_hub.subscribe(2)
+            for number in range(3):
+                event_hub.broadcast(str(number).encode())
+            await asyncio.sleep(0)
+            messages = []
+            while not subscription.queue.empty():
+                messages.append(subscription.queue.get_nowait())
+            return messages
+
+        assert asyncio.run(receive()) == [None]
+
+
+@pytest.mark.django_db
+class TestBoardSignals:
+    """Test suite for the events published by the `Board` signals."""
+
+    @pytest.fixture(name="published")
+    def fixture_published(self, monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+        """
+        Collect the published events.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Replaces `publish`.
+
+        Returns:
+            list[bytes]: The events published by the test.
+        """
+        messages: list[bytes] = []
+        monkeypatch.setattr("trello.signals.publish", messages.append)
+        monkeypatch.setattr("trello.services.publish", messages.append)
+        return messages
+
+    def test_lifecycle(
+        self,
+        published: list[bytes],
+        django_capture_on_commit_callbacks: Callable,
+    ) -> None:
+        """Test that creations, renames and deletions only are published."""
+        with django_capture_on_commit_callbacks(execute=True):
+            board = create_board("Live")
+            assert board is not None
+            created = board_event("created", board)
+            board.save()
+            board.title = "Renamed"
+            board.save()
+            board.save(update_fields=["rank"])
+            Board.objects.get(pk=board.pk).save()
+            renamed = board_event("renamed", board)
+            deleted = board_event("deleted", board)
+            board.delete()
+
+        assert published == [created, renamed, deleted]
+        assert b'"url": "/boards/Live/"' in created
+
+    def test_imported_boards(
+        self,
+        published: list[bytes],
+        django_capture_on_commit_callbacks: Callable,
+    ) -> None:
+        """Test that the boards created by an import are published."""
+        Board.objects.create(title="Existing")
+        published.clear()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            import_boards(["First", "existing", "Second"])
+
+        boards = Board.objects.filter(title__in=["First", "Second"])
+        assert published == [
+            board_event("created", board) for board in boards.order_by("id")
+        ]
+
+    def test_published_on_commit(
+        self,
+        published: list[bytes],
+        django_capture_on_commit_callbacks: Callable,
+    ) -> None:
+        """Test that nothing is published before the commit."""
+        with django_capture_on_commit_callbacks() as callbacks:
+            Board.objects.create(title="Pending")
+
+        assert not published
+        for callback in callbacks:
+            callback()
+        assert len(published) == 1
+
+
+class TestBoardEventsView(SimpleTestCase):
+    """Test the `BoardEventsView` class and `stream_events`."""
+
+    async def test_stream(self) -> None:
+        """Test that published events are streamed to ASGI clients."""
+        message = board_event("deleted", Board(pk=7, title="Gone"))
+
+        response = cast(
+            StreamingHttpResponse,
+            await self.async_client.get("/api/boards/events/"),
+        )
+        chunks = cast(AsyncGenerator[bytes, None], response.streaming_content)
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        self.assertEqual(await anext(chunks), b"retry: 5000\n\n")
+        publish(message)
+        self.assertEqual(await anext(chunks), message)
+        await chunks.aclose()
+
+    async def test_unsubscribes(self) -> None:
+        """Test that closing a stream drops its subscription."""
+        before = hub.count()
+        stream = stream_events()
+
+        await anext(stream)
+        self.assertEqual(hub.count(), before + 1)
+        await stream.aclose()
+
+        self.assertEqual(hub.count(), before)
+
+    async def test_keepalive(self) -> None:
+        """Test that idle streams send comments."""
+        with self.settings(EVENTS_KEEPALIVE_SECONDS=0):
+            stream = stream_events()
+            await anext(stream)
+
+            self.assertEqual(await anext(stream), b": keepalive\n\n")
+            await stream.aclose()
+
+    def test_wsgi_refused(self) -> None:
+        """Test that the WSGI application does not hold streams open."""
+        response = Client().get("/api/boards/events/")
+
+        self.assertEqual(response.status_code, 501)
@@ -0,0 +1,168 @@
+"""
+Tests for the streaming board export.
+
+These tests validate the NDJSON and CSV serializations, the `created_at`
+range filters, the export endpoint and the `export_boards` command.
+"""
+
+import csv
+import io
+import json
+
+from datetime import timedelta
+
+import pytest
+
+from django.core.management import CommandError, call_command
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from trello.export import export_boards, parse_bound
+from trello.models import Board
+
+
+@pytest.fixture(name="boards")
+def fixture_boards() -> list[Board]:
+    """
+    Create three boards created one day apart.
+
+    Returns:
+        list[Board]: The boards, oldest first.
+    """
+    now = timezone.now()
+    boards = [Board.objects.create(title=f"Board {i}") for i in range(3)]
+    for days_ago, board in zip((2, 1, 0), boards):
+        Board.objects.filter(pk=board.pk).update(
+            created_at=now - timedelta(days=days_ago)
+        )
+        board.refresh_from_db()
+    return boards
+
+
+@pytest.mark.django_db
+class TestExportBoards:
+    """Test suite for the `export_boards` generator."""
+
+    def test_ndjson(self, boards: list[Board]) -> None:
+        """Test that every board becomes one JSON line."""
+        lines = "".join(export_boards("ndjson")).splitlines()
+
+        records = [json.loads(line) for line in lines]
+        assert [record["title"] for record in records] == [
+            board.title for board in boards
+        ]
+        assert records[0]["created_at"] == boards[0].created_at.isoformat()
+
+    def test_csv(self, boards: list[Board]) -> None:
+        """Test that the CSV export has a header and one row per board."""
+        rows = list(csv.reader(io.StringIO("".join(export_boards("csv")))))
+
+        assert rows[0] == ["id", "title", "created_at", "updated_at"]
+        assert [row[1] for row in rows[1:]] == [b.title for b in boards]
+
+    def test_range(self, boards: list[Board]) -> None:
+        """Test that `since` and `until` bound `created_at`."""
+        blocks = export_boards(
+            "ndjson",
+            since=boards[1].created_at,
+            until=boards[2].created_at,
+        )
+
+        lines = "".join(blocks).splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Board 1"]
+
+    def test_chunks(self, boards: list[Board]) -> None:
+        """Test that rows are streamed in blocks of `chunk_size`."""
+        blocks = list(export_boards("ndjson", chunk_size=2))
+
+        assert len(blocks) == 2
+        assert len(boards) == 3
+
+    def test_unknown_format(self) -> None:
+        """Test that an unsupported format is rejected."""
+        with pytest.raises(ValueError):
+            export_boards("xml")
+
+    def test_parse_bound(self) -> None:
+        """Test that dates and date-times are parsed as aware values."""
+        day = parse_bound("2024-05-01")
+        moment = parse_bound("2024-05-01T10:00:00+00:00")
+
+        assert parse_bound(None) is None
+        assert day is not None and timezone.is_aware(day)
+        assert moment is not None and moment.hour == 10
+        with pytest.raises(ValueError):
+            parse_bound("yesterday")
+
+
+@pytest.mark.django_db
+class TestBoardExportView:
+    """Test suite for the `BoardExportView` endpoint."""
+
+    def test_streams_ndjson(self, boards: list[Board]) -> None:
+        """Test that the endpoint streams NDJSON by default."""
+        response = Client().get(reverse("export_boards"))
+
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        body = response.getvalue().decode()
+        assert len(body.splitlines()) == len(boards)
+
+    def test_streams_csv_since(self, boards: list[Board]) -> None:
+        """Test the CSV format together with a `since` filter."""
+        response = Client().get(
+            reverse("export_boards"),
+            {"format": "csv", "since": boards[2].created_at.isoformat()},
+        )
+
+        assert response["Content-Type"] == "text/csv"
+        body = response.getvalue().decode()
+        assert [row[1] for row in csv.reader(io.StringIO(body))] == [
+            "title",
+            "Board 2",
+        ]
+
+    def test_bad_request(self) -> None:
+        """Test that invalid parameters are rejected with a 400."""
+        client = Client()
+
+        assert (
+            client.get(reverse("export_boards"), {"format": "xml"}).status_code
+            == 400
+        )
+        assert (
+            client.get(reverse("export_boards"), {"since": "soon"}).status_code
+            == 400
+        )
+
+
+@pytest.mark.django_db
+class TestExportBoardsCommand:
+    """Test suite for the `export_boards` management command."""
+
+    def test_stdout(self, boards: list[Board]) -> None:
+        """Test that the command writes the export to stdout."""
+        stdout = io.StringIO()
+
+        call_command("export_boards", "--format=csv", stdout=stdout)
+
+        assert len(stdout.getvalue().splitlines()) == len(boards) + 1
+
+    def test_output_file(self, boards: list[Board], tmp_path) -> None:
+        """Test that the command can write to a file."""
+        target = tmp_path / "boards.ndjson"
+
+        call_command(
+            "export_boards",
+            f"--output={target}",
+            f"--until={boards[1].created_at.isoformat()}",
+        )
+
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Board 0"]
+
+    def test_invalid_bound(self) -> None:
+        """Test that an invalid bound raises a `CommandError`."""
+        with pytest.raises(CommandError):
+            call_command("export_boards", "--since=never")
@@ -0,0 +1,130 @@
+"""
+Tests for the Prometheus metrics of the Trello application.
+
+These tests validate that requests are recorded per URL name with their
+latency and database queries, that board creations are counted by outcome,
+that `/metrics` exposes everything, and that the values of several worker
+processes are aggregated through a shared directory.
+"""
+
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from django.test import Client
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from trello.metrics import metrics_registry
+from trello.models import Board
+
+
+def sample(name: str, **labels: str) -> float:
+    """
+    Read the current value of a metric of this process.
+
+    Args:
+        name (str): The name of the sample.
+        **labels (str): The labels of the sample.
+
+    Returns:
+        float: The value, 0 when the sample does not exist yet.
+    """
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    """Test suite for the request and board creation metrics."""
+
+    def test_request_metrics(self) -> None:
+        """Test that a request is timed and its queries counted."""
+        count = sample(
+            "trello_request_duration_seconds_count", view="create_board"
+        )
+        queries = sample("trello_db_queries_total", view="create_board")
+
+        Client().get(reverse("create_board"))
+
+        assert (
+            sample("trello_request_duration_seconds_count", view="create_board")
+            == count + 1
+        )
+        assert (
+            sample("trello_db_queries_total", view="create_board")
+            == queries + 1
+        )
+
+    def test_unmatched_requests(self) -> None:
+        """Test that requests to unknown URLs share one label."""
+        count = sample(
+            "trello_request_duration_seconds_count", view="unmatched"
+        )
+
+        Client().get("/no/such/page/")
+
+        assert (
+            sample("trello_request_duration_seconds_count", view="unmatched")
+            == count + 1
+        )
+
+    @pytest.mark.parametrize(
+        ("title", "outcome"),
+        [("Fresh", "created"), ("TAKEN", "duplicate"), ("  ", "empty")],
+    )
+    def test_creation_outcomes(self, title: str, outcome: str) -> None:
+        """Test that board creations are counted by outcome."""
+        Board.objects.create(title="Taken")
+        before = sample("trello_board_creations_total", outcome=outcome)
+
+        Client().post(reverse("create_board"), {"board_title": title})
+
+        assert (
+            sample("trello_board_creations_total", outcome=outcome)
+            == before + 1
+        )
+
+    def test_endpoint(self) -> None:
+        """Test that `/metrics` exposes the metrics as text."""
+        Client().get(reverse("redirect_to_boards"))
+
+        response = Client().get(reverse("metrics"))
+
+        content = response.content.decode()
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert (
+            'trello_request_duration_seconds_bucket{le="0.005",'
+            'view="redirect_to_boards"}'
+        ) in content
+        assert "# TYPE trello_board_creations_total counter" in content
+
+
+def test_multiprocess_aggregation(tmp_path: Path) -> None:
+    """Test that the values of several workers are added up."""
+    script = (
+        "from trello.metrics import count_creation, observe_request\n"
+        "observe_request('board_detail', 0.01, 3, 0.002)\n"
+        "count_creation('created')\n"
+    )
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", script], env=env, check=True, timeout=60
+        )
+
+    registry = metrics_registry(str(tmp_path))
+
+    assert registry.get_sample_value(
+        "trello_board_creations_total", {"outcome": "created"}
+    ) == pytest.approx(2)
+    assert registry.get_sample_value(
+        "trello_db_queries_total", {"view": "board_detail"}
+    ) == pytest.approx(6)
+    assert registry.get_sample_value(
+        "trello_request_duration_seconds_count", {"view": "board_detail"}
+    ) == pytest.approx(2)
@@ -0,0 +1,104 @@
+"""
+Tests for the middleware of the Trello project.
+
+These tests validate that `RequestTimingMiddleware` reports the queries and
+the database, template and total times of a request in a `Server-Timing`
+header, for sync and async requests alike, and logs slow requests with the
+SQL of their slowest queries.
+"""
+
+import json
+import logging
+import re
+
+import pytest
+
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from trello.models import Board
+
+TIMING = re.compile(
+    r'db;dur=(?P<db>[\d.]+);desc="(?P<queries>\d+) queries", '
+    r"tpl;dur=(?P<tpl>[\d.]+), total;dur=(?P<total>[\d.]+)"
+)
+
+
+def timings(header: str) -> dict[str, float]:
+    """
+    Parse the `Server-Timing` header of a response.
+
+    Args:
+        header (str): The header value.
+
+    Returns:
+        dict[str, float]: The query count and the times, by name.
+    """
+    match = TIMING.fullmatch(header)
+    assert match is not None, header
+    return {name: float(value) for name, value in match.groupdict().items()}
+
+
+@pytest.mark.django_db
+class TestRequestTimingMiddleware:
+    """Test suite for `RequestTimingMiddleware`."""
+
+    def test_server_timing(self) -> None:
+        """Test that a rendered page reports its queries and times."""
+        Board.objects.create(title="Timed")
+
+        response = Client().get(reverse("create_board"))
+
+        values = timings(response["Server-Timing"])
+        # The page of boards; the validators come from the cache.
+        assert values["queries"] == 1
+        assert 0 < values["tpl"] <= values["total"]
+        assert values["db"] <= values["total"]
+
+    def test_no_template(self) -> None:
+        """Test that a JSON response reports no template time."""
+        response = Client().get(reverse("api_boards"))
+
+        assert timings(response["Server-Timing"])["tpl"] == 0
+
+    def test_async_request(self) -> None:
+        """Test that queries run in worker threads are counted."""
+        response = async_to_sync(AsyncClient().get)(reverse("create_board"))
+
+        assert timings(response["Server-Timing"])["queries"] == 1
+
+    def test_disabled(self, settings) -> None:
+        """Test that the header can be turned off."""
+        settings.SERVER_TIMING = False
+
+        response = Client().get(reverse("create_board"))
+
+        assert not response.has_header("Server-Timing")
+
+    def test_slow_request_log(
+        self, settings, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that slow requests are logged with their slowest queries."""
+        settings.SLOW_REQUEST_MS = 0
+        settings.SLOW_REQUEST_QUERIES = 1
+
+        with caplog.at_level(logging.WARNING, logger="trello.middleware"):
+            Client().get(reverse("create_board"))
+
+        [message] = [record.getMessage() for record in caplog.records]
+        record = json.loads(message.removeprefix("Slow request "))
+        assert record["path"] == "/boards/"
+        assert record["status"] == 200
+        assert record["queries"] == 1
+        assert len(record["slowest_queries"]) == 1
+        assert record["slowest_queries"][0]["sql"].startswith("SELECT")
+
+    def test_fast_request_not_logged(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that requests under the threshold are not logged."""
+        with caplog.at_level(logging.WARNING, logger="trello.middleware"):
+            Client().get(reverse("create_board"))
+
+        assert not caplog.records
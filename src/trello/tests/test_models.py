@@ -1,13 +1,19 @@
 """
 Tests for the Board model in the Trello application.
 
-These tests validate the correct behavior of the Board.
+These tests validate the correct behavior of the Board, and that boards
+whose key was made unique by the 0002 backfill can be found and saved.
 """
 
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase
 from django.utils import timezone
 
-from trello.models import Board
+from trello.models import Board, normalize_title
 
 
 class TestBoardModel(TestCase):
@@ -40,3 +46,62 @@ class TestBoardModel(TestCase):
             "unique constraint" in str(context.exception).lower()
             or "duplicate key" in str(context.exception).lower()
         )
+
+    def test_board_normalized_title(self) -> None:
+        """Test that saving a Board fills its normalized title."""
+        board = Board.objects.create(title="  My   BOARD ")
+
+        self.assertEqual(board.normalized_title, "my board")
+
+    def test_board_normalized_title_unique(self) -> None:
+        """Test that titles differing only by case are rejected."""
+        Board.objects.create(title="Roadmap")
+
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Board.objects.create(title="ROADMAP")
+
+    def test_backfilled_duplicate_saves(self) -> None:
+        """Test that a board keeps a key its title does not yield."""
+        Board.objects.create(title="Roadmap")
+        duplicate = Board.objects.create(title="Other")
+        Board.objects.filter(pk=duplicate.pk).update(
+            title="ROADMAP", normalized_title=f"roadmap #{duplicate.pk}"
+        )
+
+        board = Board.objects.get(pk=duplicate.pk)
+        board.save()
+
+        board.refresh_from_db()
+        self.assertEqual(board.normalized_title, f"roadmap #{duplicate.pk}")
+        board.title = "Renamed"
+        board.save()
+        self.assertEqual(board.normalized_title, "renamed")
+
+    def test_backfill_renames_duplicates(self) -> None:
+        """Test that the 0002 backfill keeps duplicates reachable."""
+        migration = import_module(
+            "trello.migrations.0002_board_normalized_title_and_indexes"
+        )
+        first = Board.objects.create(title="Roadmap")
+        second = Board.objects.create(title="Other")
+        Board.objects.filter(pk=second.pk).update(title="ROADMAP")
+
+        migration.backfill_normalized_title(
+            apps, SimpleNamespace(connection=connection)
+        )
+
+        second.refresh_from_db()
+        self.assertEqual(second.title, f"ROADMAP #{second.pk}")
+        self.assertEqual(second.normalized_title, normalize_title(second.title))
+        first.refresh_from_db()
+        self.assertEqual(first.normalized_title, "roadmap")
+
+
+class TestNormalizeTitle(TestCase):
+    """Test the `normalize_title` helper."""
+
+    def test_casefold_and_whitespace(self) -> None:
+        """Test that case and whitespace differences are folded away."""
+        self.assertEqual(normalize_title(" Straße\tPlan "), "strasse plan")
+        self.assertEqual(normalize_title("Ｂｏａｒｄ"), "board")
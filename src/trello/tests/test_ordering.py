@@ -0,0 +1,172 @@
+"""
+Tests for the ordering keys of the Trello application.
+
+These tests validate that `position_between` returns keys strictly between
+their neighbours, and asks for a renumbering once a gap is used up, and that
+board ranks always fit between their neighbours and stay short when boards
+are appended or respaced, and that boards appended after the same rank do
+not tie.
+"""
+
+import random
+
+import pytest
+
+from trello.ordering import (
+    POSITION_GAP,
+    RANK_MAX_LENGTH,
+    RANK_WIDTH,
+    position_between,
+    rank_after,
+    rank_between,
+    ranks_between,
+    spaced_positions,
+    spaced_ranks,
+)
+
+
+class TestPositionBetween:
+    """Test suite for `position_between`."""
+
+    @pytest.mark.parametrize(
+        ("before", "after", "expected"),
+        [
+            (None, None, POSITION_GAP),
+            (POSITION_GAP, None, 2 * POSITION_GAP),
+            (None, POSITION_GAP, 0),
+            (0, 10, 5),
+        ],
+    )
+    def test_between(
+        self, before: int | None, after: int | None, expected: int
+    ) -> None:
+        """Test the key chosen for each kind of neighbourhood."""
+        assert position_between(before, after) == expected
+
+    def test_adjacent(self) -> None:
+        """Test that adjacent keys leave no room."""
+        assert position_between(4, 5) is None
+
+    def test_gap_allows_repeated_inserts(self) -> None:
+        """Test that a gap takes sixteen inserts at the top before filling."""
+        low, high = spaced_positions(2)
+        inserts = 0
+        while (position := position_between(low, high)) is not None:
+            high = position
+            inserts += 1
+
+        assert inserts == 16
+
+
+def test_spaced_positions() -> None:
+    """Test that generated keys are evenly spaced after `start`."""
+    assert spaced_positions(3, start=10) == [
+        10 + POSITION_GAP,
+        10 + 2 * POSITION_GAP,
+        10 + 3 * POSITION_GAP,
+    ]
+
+
+def assert_ascending(ranks: list[str]) -> None:
+    """
+    Assert that ranks are strictly ascending and free of trailing zeros.
+
+    Args:
+        ranks (list[str]): The ranks, in listing order.
+    """
+    assert all(low < high for low, high in zip(ranks, ranks[1:]))
+    assert not any(rank.endswith("0") for rank in ranks)
+
+
+class TestRankBetween:
+    """Test suite for `rank_between`."""
+
+    @pytest.mark.parametrize(
+        ("before", "after"),
+        [(None, None), ("i", None), (None, "i"), ("a", "b"), ("az", "b")],
+    )
+    def test_between(self, before: str | None, after: str | None) -> None:
+        """Test that the rank sorts strictly between its neighbours."""
+        assert_ascending(
+            [
+                rank
+                for rank in (before, rank_between(before, after), after)
+                if rank
+            ]
+        )
+
+    def test_wrong_order(self) -> None:
+        """Test that neighbours in the wrong order are rejected."""
+        with pytest.raises(ValueError):
+            rank_between("b", "a")
+
+    def test_appends_keep_length(self) -> None:
+        """Test that appending boards one by one does not grow the ranks."""
+        ranks = [rank_between(None, None)]
+        for _ in range(10_000):
+            ranks.append(rank_between(ranks[-1], None))
+
+        assert_ascending(ranks)
+        assert max(map(len, ranks)) <= RANK_WIDTH
+
+    def test_random_moves(self) -> None:
+        """Test that random moves keep every rank in order."""
+        generator = random.Random(0)
+        ranks = spaced_ranks(200)
+        for _ in range(5000):
+            ranks.pop(generator.randrange(len(ranks)))
+            index = generator.randrange(len(ranks) + 1)
+            before = ranks[index - 1] if index else None
+            after = ranks[index] if index < len(ranks) else None
+            ranks.insert(index, rank_between(before, after))
+
+        assert_ascending(ranks)
+
+
+def test_ranks_between() -> None:
+    """Test that bisected ranks are ascending and short."""
+    ranks = ranks_between("a", "b", 1000)
+
+    assert_ascending(["a", *ranks, "b"])
+    assert max(map(len, ranks)) <= 4
+
+
+def test_spaced_ranks() -> None:
+    """Test that respaced ranks are ascending and of bounded length."""
+    ranks = spaced_ranks(50_000)
+
+    assert_ascending(ranks)
+    assert max(map(len, ranks)) <= RANK_WIDTH
+
+
+def test_rank_after() -> None:
+    """Test that appended ranks follow the last rank and stay short."""
+    ranks = [rank_after(None, "first")]
+    for index in range(1000):
+        ranks.append(rank_after(ranks[-1], f"board {index}"))
+
+    assert_ascending(ranks)
+    assert max(map(len, ranks)) <= RANK_WIDTH
+
+
+def test_rank_after_last_rank() -> None:
+    """Test that appending after the largest short rank adds one block."""
+    ranks = ["zzzz"]
+    for index in range(1000):
+        ranks.append(rank_after(ranks[-1], f"board {index}"))
+
+    assert_ascending(ranks)
+    assert max(map(len, ranks)) <= 2 * RANK_WIDTH
+
+
+@pytest.mark.parametrize(
+    "before", [None, "i", "zzzzzzzz", "i0000000z", "zzzz" * 50 + "xn3"]
+)
+def test_concurrent_rank_after(before: str | None) -> None:
+    """Test that boards appended after the same rank get distinct ranks."""
+    ranks = {rank_after(before, f"board {index}") for index in range(100)}
+
+    assert len(ranks) == 100
+    assert all(before is None or rank > before for rank in ranks)
+    assert max(map(len, ranks)) <= RANK_MAX_LENGTH
+    assert rank_after(before, "board 1") == rank_after(before, "board 1")
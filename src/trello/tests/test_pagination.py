@@ -0,0 +1,154 @@
+"""
+Tests for the keyset pagination of the boards listing.
+
+These tests validate that `KeysetPaginator` walks the boards in
+`(created_at, id)` order in both directions, that malformed or forged cursors
+fall back to the first page, and that the `/boards/` page only loads a single
+page.
+"""
+
+import base64
+import json
+
+import pytest
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from trello.models import Board
+from trello.pagination import KeysetPaginator
+
+
+def forged_cursor(*values: str) -> str:
+    """
+    Encode values that decode as JSON but are not valid sort keys.
+
+    Args:
+        *values (str): The values of the cursor.
+
+    Returns:
+        str: The cursor.
+    """
+    raw = json.dumps(list(values)).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+@pytest.fixture(name="boards")
+def fixture_boards() -> list[Board]:
+    """
+    Create seven boards in a known order.
+
+    Returns:
+        list[Board]: The created boards, oldest first.
+    """
+    return [Board.objects.create(title=f"Board {i}") for i in range(7)]
+
+
+@pytest.mark.django_db
+class TestKeysetPaginator:
+    """Test suite for the `KeysetPaginator` class."""
+
+    def test_first_page(self, boards: list[Board]) -> None:
+        """Test that the first page holds the oldest boards."""
+        page = KeysetPaginator(Board.objects.all(), page_size=3).get_page()
+
+        assert page.items == boards[:3]
+        assert page.previous_cursor is None
+        assert page.next_cursor is not None
+
+    def test_walk_forward_and_back(self, boards: list[Board]) -> None:
+        """Test that next and previous cursors visit every board once."""
+        paginator = KeysetPaginator(Board.objects.all(), page_size=3)
+
+        first = paginator.get_page()
+        second = paginator.get_page(after=first.next_cursor)
+        third = paginator.get_page(after=second.next_cursor)
+
+        assert second.items == boards[3:6]
+        assert third.items == boards[6:]
+        assert third.next_cursor is None
+
+        back = paginator.get_page(before=third.previous_cursor)
+        assert back.items == boards[3:6]
+        assert paginator.get_page(before=back.previous_cursor).items == (
+            boards[:3]
+        )
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-a-cursor", forged_cursor("garbage", "1")]
+    )
+    def test_invalid_cursor_falls_back_to_first_page(
+        self, boards: list[Board], cursor: str
+    ) -> None:
+        """Test that a malformed or forged cursor yields the first page."""
+        paginator = KeysetPaginator(Board.objects.all(), page_size=3)
+
+        assert paginator.get_page(after=cursor).items == boards[:3]
+
+    def test_rejects_non_positive_page_size(self) -> None:
+        """Test that a page size below one is refused."""
+        with pytest.raises(ValueError):
+            KeysetPaginator(Board.objects.all(), page_size=0)
+
+
+@pytest.mark.django_db
+class TestBoardsPagination:
+    """Test suite for the paginated `/boards/` page."""
+
+    def test_page_size_setting(self, settings, boards: list[Board]) -> None:
+        """Test that the page only lists `BOARDS_PAGE_SIZE` boards."""
+        settings.BOARDS_PAGE_SIZE = 5
+
+        response = Client().get(reverse("create_board"))
+
+        assert response.context["boards"] == boards[:5]
+        assert f"?after={response.context['page'].next_cursor}" in (
+            response.content.decode()
+        )
+
+    def test_next_page_link(self, settings, boards: list[Board]) -> None:
+        """Test that following the next cursor renders the second page."""
+        settings.BOARDS_PAGE_SIZE = 5
+        client = Client()
+        url = reverse("create_board")
+        cursor = client.get(url).context["page"].next_cursor
+
+        response = client.get(url, {"after": cursor})
+
+        assert response.context["boards"] == boards[5:]
+        assert "Board 6" in response.content.decode()
+        assert "Board 0" not in response.content.decode()
+
+    @pytest.mark.parametrize(
+        ("url", "cursor"),
+        [
+            ("create_board", forged_cursor("a", "x")),
+            ("api_boards", forged_cursor("garbage", "1")),
+        ],
+    )
+    def test_forged_cursor(
+        self, boards: list[Board], url: str, cursor: str
+    ) -> None:
+        """Test that a decodable but invalid cursor shows the first page."""
+        response = Client().get(reverse(url), {"after": cursor})
+
+        assert response.status_code == 200
+        assert boards[0].title in response.content.decode()
+
+    @pytest.mark.usefixtures("boards")
+    def test_single_bounded_query(self, settings) -> None:
+        """Test that the listing rows are fetched with one LIMIT-ed query."""
+        settings.BOARDS_PAGE_SIZE = 2
+
+        with CaptureQueriesContext(connection) as queries:
+            Client().get(reverse("create_board"))
+
+        board_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "trello_board" in query["sql"]
+        ]
+        assert len(board_queries) == 1
+        assert "LIMIT 3" in board_queries[0]
@@ -0,0 +1,114 @@
+"""
+Tests for the routing of board reads to the read replicas.
+
+A second SQLite file, copied from the test database, stands in for a
+replica; rows written after the copy are missing from it, as if replication
+lagged. These tests validate that requests read the boards from the
+replica, that writes and reads outside requests use the primary, and that a
+visitor who created a board is pinned to the primary long enough to see it.
+"""
+
+import sqlite3
+
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from django.db import connection, connections
+from django.db.utils import load_backend
+from django.test import Client
+
+from trello.models import Board
+from trello.routers import PIN_COOKIE
+
+pytestmark = [
+    pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="SQLite file replica"
+    ),
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture(name="replicate")
+def replicate_fixture(tmp_path: Path, settings) -> Iterator[Callable[[], None]]:
+    """
+    Add a replica of the test database, in a second SQLite file.
+
+    Args:
+        tmp_path (Path): The directory of the replica file.
+        settings: The settings of the test.
+
+    Yields:
+        Callable[[], None]: Copies the primary into the replica.
+    """
+    path = tmp_path / "replica.sqlite3"
+    backend = load_backend(connection.settings_dict["ENGINE"])
+    connections["replica"] = backend.DatabaseWrapper(
+        {**connection.settings_dict, "NAME": str(path)}, "replica"
+    )
+    settings.DATABASE_REPLICAS = ["replica"]
+
+    def copy() -> None:
+        connection.ensure_connection()
+        target = sqlite3.connect(path)
+        try:
+            connection.connection.backup(target)
+        finally:
+            target.close()
+
+    yield copy
+    connections["replica"].close()
+    del connections["replica"]
+
+
+def test_reads_from_replica(replicate: Callable[[], None]) -> None:
+    """Test that requests read boards from the replica."""
+    Board.objects.create(title="Replicated")
+    replicate()
+    Board.objects.create(title="Lagging")
+    client = Client()
+
+    assert client.get("/boards/Replicated/").status_code == 200
+    assert client.get("/boards/Lagging/").status_code == 404
+
+
+def test_reads_outside_requests(replicate: Callable[[], None]) -> None:
+    """Test that code outside requests reads from the primary."""
+    replicate()
+    Board.objects.create(title="Lagging")
+
+    assert Board.objects.filter(title="Lagging").exists()
+
+
+def test_pinned_after_write(replicate: Callable[[], None], settings) -> None:
+    """Test that a visitor who created a board reads it from the primary."""
+    settings.REPLICA_PIN_SECONDS = 7
+    replicate()
+    client = Client()
+
+    response = client.post("/boards/", {"board_title": "Fresh"})
+
+    assert response.status_code == 302
+    assert response.cookies[PIN_COOKIE]["max-age"] == 7
+    assert Client().get(response["Location"]).status_code == 404
+    assert client.get(response["Location"]).status_code == 200
+
+
+def test_not_pinned_after_read(replicate: Callable[[], None]) -> None:
+    """Test that requests which only read leave the visitor unpinned."""
+    replicate()
+
+    response = Client().get("/boards/")
+
+    assert response.status_code == 200
+    assert PIN_COOKIE not in response.cookies
+
+
+def test_no_replicas() -> None:
+    """Test that visitors are not pinned when there are no replicas."""
+    response = Client().post("/boards/", {"board_title": "Fresh"})
+
+    assert response.status_code == 302
+    assert PIN_COOKIE not in response.cookies
+    assert Client().get(response["Location"]).status_code == 200
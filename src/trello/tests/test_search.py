@@ -0,0 +1,162 @@
+"""
+Tests for the board search of the Trello application.
+
+These tests validate that the search index follows board creations, renames,
+deletions and bulk imports, that every query word matches as a prefix, that
+the work per search does not grow with the matches, and that the search page
+and endpoint return the matches.
+"""
+
+import io
+
+import pytest
+
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+
+from trello.models import Board
+from trello.search import fts_query, search_boards
+from trello.services import import_boards
+
+
+def titles(query: str) -> list[str]:
+    """
+    Return the titles of the boards matching `query`.
+
+    Args:
+        query (str): The search query.
+
+    Returns:
+        list[str]: The titles, best match first.
+    """
+    return [board.title for board in search_boards(query)]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("road map", '"road"* "map"*'),
+        ('a" OR b', '"a" "OR"* "b"'),
+        ("  ", ""),
+    ],
+)
+def test_fts_query(query: str, expected: str) -> None:
+    """Test that every word but single characters becomes a prefix term."""
+    assert fts_query(query) == expected
+    assert fts_query(query, prefix=False) == expected.replace("*", "")
+
+
+@pytest.mark.django_db
+class TestSearchBoards:
+    """Test suite for `search_boards`."""
+
+    def test_prefix_words(self) -> None:
+        """Test that every word has to match the start of a title word."""
+        for title in ("Product roadmap", "Road trip", "Groceries"):
+            Board.objects.create(title=title)
+
+        assert set(titles("road")) == {"Product roadmap", "Road trip"}
+        assert titles("prod road") == ["Product roadmap"]
+        assert not titles("oad")
+
+    def test_older_best_match_kept(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that more matches than candidates never hide the best one."""
+        monkeypatch.setattr("trello.search.SEARCH_CANDIDATES", 5)
+        Board.objects.create(title="Plan")
+        Board.objects.create(title="Quarterly plan review")
+        for number in range(10):
+            Board.objects.create(title=f"Planning session {number}")
+
+        assert titles("plan")[:2] == ["Plan", "Quarterly plan review"]
+
+    def test_single_character(self) -> None:
+        """Test that one character matches whole words and title starts."""
+        for title in ("Q3 goals", "Plan B", "Quiz", "Backlog"):
+            Board.objects.create(title=title)
+
+        assert set(titles("q")) == {"Q3 goals", "Quiz"}
+        assert titles("b") == ["Plan B", "Backlog"]
+
+    def test_bounded_queries(
+        self, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """Test that a search costs the same queries however many match."""
+        for number in range(30):
+            Board.objects.create(title=f"Roadmap {number}")
+
+        # Whole words, prefixes, titles starting with the query, boards.
+        with django_assert_num_queries(4):
+            assert len(titles("road")) == 20
+
+    def test_ignores_case_and_accents(self) -> None:
+        """Test that case and diacritics do not matter."""
+        Board.objects.create(title="Café Menu")
+
+        assert titles("CAFE") == ["Café Menu"]
+
+    def test_follows_renames_and_deletions(self) -> None:
+        """Test that the index follows saved and deleted boards."""
+        board = Board.objects.create(title="Draft")
+        board.title = "Final"
+        board.save()
+
+        assert not titles("draft")
+        assert titles("final") == ["Final"]
+        board.delete()
+        assert not titles("final")
+
+    def test_imported_boards(self) -> None:
+        """Test that bulk-imported boards are searchable."""
+        import_boards(["Imported one", "Imported two"])
+
+        assert set(titles("imported")) == {"Imported one", "Imported two"}
+
+    def test_rebuild_command(self) -> None:
+        """Test that the index can be rebuilt from the boards table."""
+        Board.objects.bulk_create(
+            [Board(title="Bulk", normalized_title="bulk")]
+        )
+        stdout = io.StringIO()
+
+        call_command("rebuild_search_index", stdout=stdout)
+
+        assert stdout.getvalue().strip() == "Indexed 1 boards."
+        assert titles("bulk") == ["Bulk"]
+
+
+@pytest.mark.django_db
+class TestSearchViews:
+    """Test suite for the search page and endpoint."""
+
+    def test_search_page(self) -> None:
+        """Test that the page lists the matches and keeps the query."""
+        Board.objects.create(title="Roadmap")
+
+        response = Client().get(reverse("search_boards"), {"q": "road"})
+
+        assert [board.title for board in response.context["boards"]] == [
+            "Roadmap"
+        ]
+        assert 'value="road"' in response.content.decode()
+
+    def test_search_endpoint(self) -> None:
+        """Test that the endpoint returns the matches as JSON."""
+        board = Board.objects.create(title="Roadmap")
+
+        response = Client().get(reverse("api_search_boards"), {"q": "road"})
+
+        assert response.json() == {
+            "results": [{"id": board.pk, "title": "Roadmap"}]
+        }
+
+    def test_search_endpoint_limit(self) -> None:
+        """Test that an invalid limit is rejected."""
+        response = Client().get(
+            reverse("api_search_boards"), {"q": "road", "limit": "0"}
+        )
+
+        assert response.status_code == 400
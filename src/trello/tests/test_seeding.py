@@ -0,0 +1,139 @@
+"""
+Tests for the synthetic board generator.
+
+These tests validate that generated titles are unique, reproducible and
+shaped by the length and script options, that loaded boards are ranked
+after the existing ones, dated over the requested period and searchable,
+that a repeated load skips existing titles, and the `seed_boards` command.
+"""
+
+import io
+
+from datetime import timedelta
+
+import pytest
+
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from trello.models import TITLE_MAX_LENGTH, Board, Card, List, normalize_title
+from trello.search import search_boards
+from trello.seeding import SeedSpec, generate_titles, seed_boards
+
+
+class TestGenerateTitles:
+    """Test suite for `generate_titles`."""
+
+    def test_numbered(self) -> None:
+        """Test that titles are numbered and unpadded by default."""
+        assert list(generate_titles(3, SeedSpec(prefix="Demo"))) == [
+            "Demo 0",
+            "Demo 1",
+            "Demo 2",
+        ]
+
+    def test_lengths(self) -> None:
+        """Test that padded titles stay unique and within the bounds."""
+        spec = SeedSpec(min_length=20, max_length=60, length_mode=30)
+
+        titles = list(generate_titles(1000, spec))
+
+        assert len({normalize_title(title) for title in titles}) == 1000
+        assert all(len(title) <= 60 for title in titles)
+        assert min(len(title) for title in titles) >= 19
+
+    def test_unicode_ratio(self) -> None:
+        """Test that about the requested share of titles is non-Latin."""
+        spec = SeedSpec(min_length=30, max_length=40, unicode_ratio=0.25)
+
+        titles = list(generate_titles(1000, spec))
+
+        assert 200 <= sum(not title.isascii() for title in titles) <= 300
+
+    def test_reproducible(self) -> None:
+        """Test that a seed always produces the same titles."""
+        spec = SeedSpec(max_length=80, unicode_ratio=0.5, seed=7)
+
+        assert list(generate_titles(50, spec)) == list(
+            generate_titles(50, spec)
+        )
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            SeedSpec(min_length=10, max_length=5),
+            SeedSpec(max_length=TITLE_MAX_LENGTH + 1),
+            SeedSpec(max_length=10, length_mode=20),
+            SeedSpec(unicode_ratio=2),
+            SeedSpec(days=-1),
+        ],
+    )
+    def test_invalid(self, spec: SeedSpec) -> None:
+        """Test that options out of range are rejected."""
+        with pytest.raises(ValueError):
+            spec.validate()
+
+
+@pytest.mark.django_db
+class TestSeedBoards:
+    """Test suite for `seed_boards` and the `seed_boards` command."""
+
+    def test_load(self) -> None:
+        """Test that the boards are ranked, dated and searchable."""
+        existing = Board.objects.create(title="Existing")
+
+        result = seed_boards(500, SeedSpec(days=30), batch_size=64)
+
+        assert (result.created, result.skipped) == (500, 0)
+        assert result.previous_id == existing.pk
+        boards = list(Board.objects.filter(pk__gt=existing.pk).order_by("pk"))
+        ranks = [board.rank for board in boards]
+        assert existing.rank < ranks[0]
+        assert ranks == sorted(ranks)
+        created = [board.created_at for board in boards]
+        assert created == sorted(created)
+        assert created[-1] - created[0] > timedelta(days=29)
+        assert created[-1] <= timezone.now()
+        assert [board.title for board in search_boards("board 499")] == [
+            "Board 499"
+        ]
+
+    def test_chunks(self) -> None:
+        """Test that chunked loads index every board once."""
+        seed_boards(100, batch_size=7, chunk_size=30)
+
+        assert Board.objects.count() == 100
+        assert [board.title for board in search_boards("board 42")] == [
+            "Board 42"
+        ]
+
+    def test_grow(self) -> None:
+        """Test that a repeated load only adds the missing titles."""
+        spec = SeedSpec(max_length=50, seed=3)
+        seed_boards(20, spec)
+
+        result = seed_boards(30, spec)
+
+        assert (result.created, result.skipped) == (10, 20)
+        assert Board.objects.count() == 30
+
+    def test_command(self) -> None:
+        """Test that the command seeds lists and cards, then grows."""
+        stdout = io.StringIO()
+
+        call_command(
+            "seed_boards", "3", "--lists=2", "--cards=4", stdout=stdout
+        )
+        call_command("seed_boards", "5", "--batch-size=2", stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        assert lines[0].startswith("Created 3 boards; skipped 0 existing")
+        assert lines[1].startswith("Created 2 boards; skipped 3 existing")
+        assert lines[1].endswith("rows/s).")
+        assert List.objects.count() == 6
+        assert Card.objects.filter(list__board__title="Board 2").count() == 8
+
+    def test_command_invalid(self) -> None:
+        """Test that invalid options are reported as command errors."""
+        with pytest.raises(CommandError, match="unicode ratio"):
+            call_command("seed_boards", "3", "--unicode=1.5")
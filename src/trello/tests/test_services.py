@@ -0,0 +1,422 @@
+"""
+Tests for the board services of the Trello application.
+
+These tests validate that `import_boards` deduplicates titles in memory and
+against existing boards, creates the remaining boards in batches and reports
+only the boards it inserted, that
+`create_board` creates each title once even under concurrent requests, and
+that cards and boards are moved by rewriting a single ordering key.
+"""
+
+import io
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django.core.management import call_command
+from django.db import connection
+from pytest_django import (
+    DjangoAssertNumQueries,
+    DjangoCaptureOnCommitCallbacks,
+)
+
+from trello import services
+from trello.autocomplete import title_index
+from trello.models import Board, Card, List
+from trello.search import search_boards
+from trello.services import (
+    add_card,
+    add_list,
+    create_board,
+    import_boards,
+    move_board,
+    move_card,
+    rebalance_ranks,
+)
+
+
+@pytest.mark.django_db
+class TestImportBoards:
+    """Test suite for the `import_boards` service."""
+
+    def test_creates_boards(self) -> None:
+        """Test that every new title becomes a board."""
+        result = import_boards(["Alpha", "Beta", "Gamma"])
+
+        assert result.created == ["Alpha", "Beta", "Gamma"]
+        assert not result.skipped
+        assert set(
+            Board.objects.values_list("normalized_title", flat=True)
+        ) == {
+            "alpha",
+            "beta",
+            "gamma",
+        }
+
+    def test_skips_duplicates(self) -> None:
+        """Test that repeated and existing titles are skipped."""
+        Board.objects.create(title="Existing")
+
+        result = import_boards(["New", "new ", "EXISTING", "", "  "])
+
+        assert result.created == ["New"]
+        assert result.skipped == ["new", "EXISTING"]
+        assert Board.objects.count() == 2
+
+    def test_skips_overlong_titles(self) -> None:
+        """Test that titles longer than the column are skipped."""
+        result = import_boards(["x" * 256, "Fits"])
+
+        assert result.created == ["Fits"]
+        assert result.skipped == ["x" * 256]
+
+    def test_batches(self, django_assert_num_queries) -> None:
+        """Test that each batch costs one SELECT and two INSERTs."""
+        titles = [f"Board {i}" for i in range(10)]
+
+        # The last rank, then two batches of SAVEPOINT, SELECT, INSERT into
+        # the boards and the search index, and RELEASE.
+        with django_assert_num_queries(11):
+            result = import_boards(titles, batch_size=5)
+
+        assert len(result.created) == 10
+
+    @pytest.mark.parametrize("vendor", ["sqlite", "other"])
+    def test_concurrent_titles_skipped(
+        self,
+        vendor: str,
+        monkeypatch: pytest.MonkeyPatch,
+        django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+    ) -> None:
+        """Test that titles created after the pre-read are not reported."""
+        rank_after = services.rank_after
+
+        def race(before: str | None, key: str) -> str:
+            if key == "raced":
+                Board.objects.create(title="RACED")
+            return rank_after(before, key)
+
+        monkeypatch.setattr(services, "rank_after", race)
+        monkeypatch.setattr(connection, "vendor", vendor)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = import_boards(["Alpha", "Raced", "Omega"])
+
+        assert result.created == ["Alpha", "Omega"]
+        assert result.skipped == ["Raced"]
+        assert Board.objects.get(normalized_title="raced").title == "RACED"
+        assert title_index.suggest("rac") == ["RACED"]
+        assert [board.title for board in search_boards("raced")] == ["RACED"]
+
+
+def create_and_close(title: str) -> bool:
+    """
+    Create a board from a worker thread and close its connection.
+
+    Args:
+        title (str): The title of the board.
+
+    Returns:
+        bool: Whether the board was created.
+    """
+    try:
+        return create_board(title) is not None
+    finally:
+        connection.close()
+
+
+class TestCreateBoard:
+    """Test suite for the `create_board` service."""
+
+    @pytest.mark.django_db
+    def test_creates_board(
+        self, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+    ) -> None:
+        """Test that a new board is saved, ranked last and indexed."""
+        first = Board.objects.create(title="First")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            board = create_board("Second Board")
+
+        assert board is not None
+        assert Board.objects.get(pk=board.pk).normalized_title == "second board"
+        assert board.rank > first.rank
+        assert [b.title for b in search_boards("second")] == ["Second Board"]
+        assert title_index.exists("SECOND board")
+
+    @pytest.mark.django_db
+    def test_taken_title(self, django_assert_num_queries) -> None:
+        """Test that a taken title costs a single read and no write."""
+        Board.objects.create(title="Taken")
+
+        with django_assert_num_queries(1):
+            assert create_board("TAKEN") is None
+
+        assert Board.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_title_taken_meanwhile(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the upsert reports a title taken after the first read."""
+        Board.objects.create(title="Raced")
+        monkeypatch.setattr(
+            "trello.services._creation_state", lambda key: (False, None)
+        )
+
+        assert create_board("raced") is None
+        assert Board.objects.count() == 1
+
+    @pytest.mark.django_db(transaction=True)
+    def test_concurrent_creations(self) -> None:
+        """Test that racing requests create every title exactly once."""
+        titles = [f"Board {i % 20}" for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            created = list(pool.map(create_and_close, titles))
+
+        assert sum(created) == 20
+        assert Board.objects.count() == 20
+
+
+def card_titles(board_list: List) -> list[str]:
+    """
+    Return the titles of the cards of a list, in order.
+
+    Args:
+        board_list (List): The list to read.
+
+    Returns:
+        list[str]: The card titles.
+    """
+    return list(
+        Card.objects.filter(list=board_list)
+        .order_by("position", "id")
+        .values_list("title", flat=True)
+    )
+
+
+@pytest.mark.django_db
+class TestCards:
+    """Test suite for the list and card services."""
+
+    def test_add_appends(self) -> None:
+        """Test that new lists and cards go to the end."""
+        board = Board.objects.create(title="Board")
+        first, second = add_list(board, "Todo"), add_list(board, "Done")
+        for title in ("a", "b", "c"):
+            add_card(first, title)
+
+        assert first.position < second.position
+        assert card_titles(first) == ["a", "b", "c"]
+
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [(0, ["c", "a", "b"]), (1, ["a", "c", "b"]), (9, ["a", "b", "c"])],
+    )
+    def test_move_within_list(self, index: int, expected: list[str]) -> None:
+        """Test moving the last card to each slot of its own list."""
+        board_list = add_list(Board.objects.create(title="Board"), "Todo")
+        add_card(board_list, "a")
+        add_card(board_list, "b")
+        card = add_card(board_list, "c")
+
+        move_card(card, board_list, index)
+
+        assert card_titles(board_list) == expected
+
+    def test_move_updates_one_card(
+        self, django_assert_max_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """Test that a move leaves the keys of the other cards alone."""
+        board_list = add_list(Board.objects.create(title="Board"), "Todo")
+        cards = [add_card(board_list, str(i)) for i in range(50)]
+        before = dict(Card.objects.values_list("pk", "position"))
+
+        # Savepoint, neighbour keys, card, board and savepoint release.
+        with django_assert_max_num_queries(5):
+            move_card(cards[-1], board_list, 10)
+
+        after = dict(Card.objects.values_list("pk", "position"))
+        changed = [pk for pk in before if before[pk] != after[pk]]
+        assert changed == [cards[-1].pk]
+
+    def test_move_renumbers_full_gap(self) -> None:
+        """Test that a used-up gap is respaced without losing the order."""
+        board_list = add_list(Board.objects.create(title="Board"), "Todo")
+        add_card(board_list, "first")
+        add_card(board_list, "last")
+        for i in range(20):
+            move_card(add_card(board_list, f"m{i}"), board_list, 1)
+
+        assert card_titles(board_list) == [
+            "first",
+            *(f"m{i}" for i in reversed(range(20))),
+            "last",
+        ]
+
+    def test_move_between_boards(
+        self, django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks
+    ) -> None:
+        """Test moving a card to another board's list."""
+        source = add_list(Board.objects.create(title="One"), "Todo")
+        target = add_list(Board.objects.create(title="Two"), "Todo")
+        card = add_card(source, "card")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            move_card(card, target, 0)
+
+        assert not card_titles(source)
+        assert card_titles(target) == ["card"]
+
+
+def listing() -> list[str]:
+    """
+    Return the board titles in listing order.
+
+    Returns:
+        list[str]: The titles.
+    """
+    return list(
+        Board.objects.order_by("rank", "id").values_list("title", flat=True)
+    )
+
+
+def ranks() -> list[str]:
+    """
+    Return the board ranks in listing order.
+
+    Returns:
+        list[str]: The ranks.
+    """
+    return list(Board.objects.order_by("rank").values_list("rank", flat=True))
+
+
+@pytest.mark.django_db
+class TestMoveBoard:
+    """Test suite for board ranks and `move_board`."""
+
+    @pytest.fixture(name="boards")
+    def fixture_boards(self) -> list[Board]:
+        """
+        Create four boards, ranked in creation order.
+
+        Returns:
+            list[Board]: The boards.
+        """
+        return [Board.objects.create(title=title) for title in "abcd"]
+
+    def test_new_boards_go_last(self, boards: list[Board]) -> None:
+        """Test that created and imported boards are appended."""
+        import_boards(["e", "f"])
+
+        assert boards[0].rank < boards[-1].rank
+        assert listing() == list("abcdef")
+
+    @pytest.mark.parametrize(
+        ("moved", "anchors", "expected"),
+        [
+            (0, {"after": 1}, "bacd"),
+            (0, {"before": 3}, "bcad"),
+            (0, {"after": 3}, "bcda"),
+            (3, {}, "dabc"),
+        ],
+    )
+    def test_move(
+        self,
+        boards: list[Board],
+        moved: int,
+        anchors: dict[str, int],
+        expected: str,
+    ) -> None:
+        """Test moving a board after, before or above the others."""
+        move_board(
+            boards[moved], **{side: boards[i] for side, i in anchors.items()}
+        )
+
+        assert "".join(listing()) == expected
+
+    def test_move_updates_one_board(
+        self,
+        boards: list[Board],
+        django_assert_num_queries: DjangoAssertNumQueries,
+    ) -> None:
+        """Test that a move reads one neighbour and updates one row."""
+        before = dict(Board.objects.values_list("pk", "rank"))
+
+        # Savepoint, neighbour rank, update and savepoint release.
+        with django_assert_num_queries(4):
+            move_board(boards[3], after=boards[0])
+
+        after = dict(Board.objects.values_list("pk", "rank"))
+        assert [pk for pk in before if before[pk] != after[pk]] == [
+            boards[3].pk
+        ]
+        assert listing() == list("adbc")
+
+    def test_tie_is_respaced(self, boards: list[Board]) -> None:
+        """Test that moving between tied ranks respaces them first."""
+        Board.objects.filter(pk__in=[boards[1].pk, boards[2].pk]).update(
+            rank=boards[1].rank
+        )
+
+        move_board(boards[0], after=boards[1])
+
+        assert listing() == list("bacd")
+        assert len(set(Board.objects.values_list("rank", flat=True))) == 4
+
+    def test_tie_respaces_few_boards(self) -> None:
+        """Test that a move across a tie leaves the other boards alone."""
+        boards = [Board.objects.create(title=f"Board {i}") for i in range(20)]
+        Board.objects.filter(pk=boards[11].pk).update(rank=boards[10].rank)
+        before = dict(Board.objects.values_list("pk", "rank"))
+
+        move_board(boards[0], after=boards[10])
+
+        after = dict(Board.objects.values_list("pk", "rank"))
+        changed = [pk for pk in before if before[pk] != after[pk]]
+        assert len(changed) <= 3
+        assert listing()[9:12] == ["Board 10", "Board 0", "Board 11"]
+
+    def test_long_rank_respaces_few_boards(
+        self, boards: list[Board], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a rank too long for the column respaces the gap."""
+        monkeypatch.setattr("trello.services.RANK_MAX_LENGTH", 8)
+        for _ in range(20):
+            move_board(boards[3], after=boards[0])
+            move_board(boards[3], before=boards[1])
+
+        assert listing() == list("adbc")
+        assert max(len(rank) for rank in ranks()) <= 8
+
+    def test_rebalance_keeps_order(self, boards: list[Board]) -> None:
+        """Test that respacing long ranks keeps the listing order."""
+        for _ in range(100):
+            move_board(boards[3], after=boards[0])
+            move_board(boards[3], before=boards[1])
+
+        assert rebalance_ranks() == len(boards)
+        assert listing() == list("adbc")
+        assert max(len(rank) for rank in ranks()) <= 8
+
+    def test_rebalance_marks_updated(self, boards: list[Board]) -> None:
+        """Test that respaced boards get a new update time."""
+        before = {board.pk: board.updated_at for board in boards}
+
+        rebalance_ranks()
+
+        for board in Board.objects.all():
+            assert board.updated_at > before[board.pk]
+
+    def test_rebalance_command(self, boards: list[Board]) -> None:
+        """Test that the command only rebalances long ranks by default."""
+        stdout = io.StringIO()
+
+        call_command("rebalance_ranks", stdout=stdout)
+        call_command("rebalance_ranks", "--max-length=0", stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        assert "nothing to do" in lines[0]
+        assert lines[1].startswith(f"Rebalanced {len(boards)} boards")
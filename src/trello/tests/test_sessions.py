@@ -0,0 +1,132 @@
+"""
+Tests for the session handling of the Trello project.
+
+These tests validate that the session store is read from the environment,
+that the board pages make no session queries, anonymous or logged in, and
+that the `purge_sessions` command deletes only expired sessions.
+"""
+
+import io
+
+from datetime import timedelta
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from trello.env import session_engine
+from trello.models import Board
+
+ENGINE_PREFIX = "django.contrib.sessions.backends."
+
+
+def session_queries(client: Client, method: str, path: str, **data) -> list:
+    """
+    Send a request and return its queries of the session table.
+
+    Args:
+        client (Client): The test client.
+        method (str): "get" or "post".
+        path (str): The path of the request.
+        **data: The form data of the request.
+
+    Returns:
+        list: The SQL of the queries mentioning `django_session`.
+    """
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(path, data)
+    assert response.status_code < 400
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if "django_session" in query["sql"]
+    ]
+
+
+class TestSessionEngine:
+    """Test suite for `session_engine`."""
+
+    def test_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that sessions are cached with a database fallback."""
+        monkeypatch.delenv("SESSION_STORE", raising=False)
+
+        assert session_engine() == f"{ENGINE_PREFIX}cached_db"
+
+    def test_signed_cookies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that sessions can live in signed cookies."""
+        monkeypatch.setenv("SESSION_STORE", "Signed_Cookies")
+
+        assert session_engine() == f"{ENGINE_PREFIX}signed_cookies"
+
+    def test_invalid(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that unknown stores are rejected."""
+        monkeypatch.setenv("SESSION_STORE", "redis")
+
+        with pytest.raises(ImproperlyConfigured):
+            session_engine()
+
+
+@pytest.mark.django_db
+class TestBoardPagesSkipSessions:
+    """Test that the board pages never query the session table."""
+
+    @pytest.mark.parametrize("store", ["cached_db", "signed_cookies", "db"])
+    @pytest.mark.parametrize("logged_in", [False, True])
+    def test_no_session_queries(
+        self, settings, store: str, logged_in: bool
+    ) -> None:
+        """Test the listing, a board page, a creation and its failure."""
+        settings.SESSION_ENGINE = f"{ENGINE_PREFIX}{store}"
+        Board.objects.create(title="Existing")
+        client = Client()
+        if logged_in:
+            client.force_login(User.objects.create_user("visitor"))
+
+        assert not session_queries(client, "get", "/boards/")
+        assert not session_queries(client, "get", "/boards/Existing/")
+        assert not session_queries(client, "get", "/boards/Existing/")
+        assert not session_queries(
+            client, "post", "/boards/", board_title="New"
+        )
+        assert not session_queries(
+            client, "post", "/boards/", board_title="new"
+        )
+        assert not session_queries(client, "get", "/boards/")
+
+    def test_queries_detected(self, settings) -> None:
+        """Test that session queries of other pages are seen."""
+        settings.SESSION_ENGINE = f"{ENGINE_PREFIX}db"
+        client = Client()
+        client.force_login(User.objects.create_superuser("admin"))
+
+        assert session_queries(client, "get", "/admin/")
+
+
+@pytest.mark.django_db
+def test_purge_sessions() -> None:
+    """Test that only expired sessions are deleted, in batches."""
+    now = timezone.now()
+    for number in range(5):
+        Session.objects.create(
+            session_key=f"expired{number}",
+            session_data="",
+            expire_date=now - timedelta(days=number + 1),
+        )
+    Session.objects.create(
+        session_key="current",
+        session_data="",
+        expire_date=now + timedelta(days=1),
+    )
+    stdout = io.StringIO()
+
+    call_command("purge_sessions", "--batch-size=2", stdout=stdout)
+
+    assert stdout.getvalue().startswith("Deleted 5 expired sessions in ")
+    assert list(Session.objects.values_list("pk", flat=True)) == ["current"]
@@ -0,0 +1,135 @@
+"""
+Tests for the static files of the Trello project.
+
+These tests validate that `collectstatic` fingerprints and precompresses
+the stylesheets, that the middleware serves the smallest copy a client
+accepts with far-future caching for fingerprinted files only, and that the
+pages link to the stylesheet instead of embedding it.
+"""
+
+import gzip
+
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from django.core.management import call_command
+from django.http import FileResponse
+from django.test import Client
+
+from trello.staticfiles import accepted_encodings, brotli
+
+MANIFEST_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "trello.staticfiles.CompressedManifestStorage"},
+}
+
+
+@pytest.fixture(name="collected")
+def fixture_collected(settings, tmp_path: Path) -> str:
+    """
+    Collect the static files with the manifest storage.
+
+    Args:
+        settings: The pytest-django settings fixture.
+        tmp_path (Path): The `STATIC_ROOT` of the test.
+
+    Returns:
+        str: The fingerprinted name of the stylesheet.
+    """
+    settings.STATIC_ROOT = tmp_path
+    settings.STORAGES = MANIFEST_STORAGES
+    call_command("collectstatic", interactive=False, verbosity=0)
+    (stylesheet,) = tmp_path.glob("css/base.*.css")
+    return stylesheet.relative_to(tmp_path).as_posix()
+
+
+def test_accepted_encodings() -> None:
+    """Test that refused codings are left out."""
+    header = "gzip;q=1.0, br; q=0, deflate"
+
+    assert accepted_encodings(header) == {"gzip", "deflate"}
+    assert accepted_encodings(None) == set()
+
+
+class TestCollectStatic:
+    """Test the files written by `collectstatic`."""
+
+    def test_precompressed(self, collected: str, tmp_path: Path) -> None:
+        """Test that fingerprinted stylesheets get compressed copies."""
+        css = (tmp_path / collected).read_bytes()
+
+        assert (
+            gzip.decompress((tmp_path / f"{collected}.gz").read_bytes()) == css
+        )
+        assert (tmp_path / f"{collected}.br").exists() == (brotli is not None)
+        assert not (tmp_path / "css/base.css.gz").exists()
+
+
+@pytest.mark.django_db
+class TestStaticFilesMiddleware:
+    """Test suite for `StaticFilesMiddleware`."""
+
+    def test_fingerprinted(self, collected: str) -> None:
+        """Test that fingerprinted files are compressed and immutable."""
+        response = cast(
+            FileResponse,
+            Client().get(f"/static/{collected}", HTTP_ACCEPT_ENCODING="gzip"),
+        )
+        body = response.getvalue()
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/css"
+        assert response["Content-Encoding"] == "gzip"
+        assert response["Vary"] == "Accept-Encoding"
+        assert response["Cache-Control"] == (
+            "public, max-age=31536000, immutable"
+        )
+        assert b".fixed-header" in gzip.decompress(body)
+
+    def test_identity(self, collected: str) -> None:
+        """Test that clients without compression get the plain file."""
+        response = cast(FileResponse, Client().get(f"/static/{collected}"))
+
+        assert "Content-Encoding" not in response
+        assert b".fixed-header" in response.getvalue()
+
+    @pytest.mark.usefixtures("collected")
+    def test_original_revalidated(self) -> None:
+        """Test that files under their original name are revalidated."""
+        response = Client().get("/static/css/base.css")
+
+        assert response["Cache-Control"] == "no-cache"
+
+    @pytest.mark.usefixtures("collected")
+    def test_other_requests(self) -> None:
+        """Test that unknown files and other methods reach the views."""
+        client = Client()
+
+        assert client.get("/static/css/missing.css").status_code == 404
+        assert client.post("/static/css/base.css").status_code == 404
+
+    def test_not_used(self, settings, tmp_path: Path) -> None:
+        """Test that nothing is served when nothing was collected."""
+        settings.STATIC_ROOT = tmp_path / "missing"
+
+        assert Client().get("/boards/").status_code == 200
+
+
+@pytest.mark.django_db
+class TestPages:
+    """Test the links of the pages to the stylesheet."""
+
+    def test_stylesheet_linked(self) -> None:
+        """Test that the styles are linked, not embedded."""
+        body = Client().get("/boards/").content.decode()
+
+        assert "<style" not in body
+        assert '<link rel="stylesheet" href="/static/css/base.css">' in body
+
+    def test_fingerprinted_link(self, collected: str) -> None:
+        """Test that pages link to the fingerprinted stylesheet."""
+        body = Client().get("/boards/").content.decode()
+
+        assert f'href="/static/{collected}"' in body
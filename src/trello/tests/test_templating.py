@@ -0,0 +1,127 @@
+"""
+Tests for the production template mode.
+
+These tests validate that HTML templates lose their comments, indentation
+and blank lines but keep scripts and preformatted text working, that pages
+rendered in production mode are smaller and keep their content, and that
+the cached loaders are filled before the first request.
+"""
+
+import copy
+
+from typing import cast
+
+import pytest
+
+from django.conf import settings
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.template.loaders import cached
+from django.test import Client, override_settings
+
+from trello.models import Board
+from trello.templating import PRODUCTION_LOADERS, minify_html, warm_templates
+
+
+def production_templates() -> list[dict]:
+    """
+    Return the template settings of the production mode.
+
+    Returns:
+        list[dict]: The `TEMPLATES` setting, with the production loaders.
+    """
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["APP_DIRS"] = False
+    templates[0]["OPTIONS"]["loaders"] = PRODUCTION_LOADERS
+    return templates
+
+
+def development_templates() -> list[dict]:
+    """
+    Return the template settings of the development mode.
+
+    Returns:
+        list[dict]: The `TEMPLATES` setting, with the default loaders.
+    """
+    templates = copy.deepcopy(settings.TEMPLATES)
+    templates[0]["APP_DIRS"] = True
+    templates[0]["OPTIONS"].pop("loaders", None)
+    return templates
+
+
+class TestMinifyHtml:
+    """Test suite for `minify_html`."""
+
+    def test_comments_and_indentation(self) -> None:
+        """Test that comments, indentation and blank lines are removed."""
+        source = (
+            "<!--\n  Documentation\n-->\n\n<div>\n"
+            "    <!-- inline --><p>{{ text }}</p>\n\n    <b>bold</b> text\n"
+            "</div>\n"
+        )
+
+        assert minify_html(source) == (
+            "<div>\n<p>{{ text }}</p>\n<b>bold</b> text\n</div>\n"
+        )
+
+    def test_conditional_comments_kept(self) -> None:
+        """Test that conditional comments are not removed."""
+        source = "<!--[if IE]><p>Old</p><![endif]-->\n"
+
+        assert minify_html(source) == source
+
+    def test_words_kept_apart(self) -> None:
+        """Test that words around a comment stay separated."""
+        assert minify_html("Hello <!-- name -->\n    world") == "Hello\nworld\n"
+
+    def test_scripts(self) -> None:
+        """Test that scripts keep their lines and comment-like strings."""
+        source = (
+            "<script>\n    const a = 1\n    const b = '<!-- a -->'\n"
+            "</script>\n"
+        )
+
+        assert minify_html(source) == (
+            "<script>\nconst a = 1\nconst b = '<!-- a -->'\n</script>\n"
+        )
+
+    def test_preformatted_kept(self) -> None:
+        """Test that preformatted text is left untouched."""
+        source = "<pre>\n  indented\n\n  <!-- shown --></pre>\n"
+
+        assert minify_html(source) == source
+
+
+@pytest.mark.django_db
+class TestProductionMode:
+    """Test the pages rendered with the production loaders."""
+
+    def test_pages_minified(self) -> None:
+        """Test that pages lose their comments but keep their content."""
+        Board.objects.create(title="Minified")
+        client = Client()
+        with override_settings(TEMPLATES=development_templates()):
+            default = client.get("/boards/").content.decode()
+
+        with override_settings(TEMPLATES=production_templates()):
+            listing = client.get("/boards/").content.decode()
+            detail = client.get("/boards/Minified/").content.decode()
+
+        assert "<!--" in default
+        assert "<!--" not in listing
+        assert "<!--" not in detail
+        assert len(listing) < len(default) * 0.8
+        assert 'href="/boards/Minified/"' in listing
+        assert "new EventSource(container.dataset.eventsUrl)" in listing
+        assert "<p>Minified</p>" in detail
+
+    def test_warm_templates(self) -> None:
+        """Test that the warm-up compiles the templates into the cache."""
+        with override_settings(TEMPLATES=production_templates()):
+            compiled = warm_templates()
+            backend = cast(DjangoTemplates, engines.all()[0])
+            loader = cast(cached.Loader, backend.engine.template_loaders[0])
+
+            assert compiled > 0
+            assert "boards.html" in loader.get_template_cache
+            assert "admin/base.html" in loader.get_template_cache
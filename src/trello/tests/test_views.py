@@ -14,12 +14,13 @@ valid/invalid board titles).
 
 import pytest
 
+from pytest_django import DjangoAssertNumQueries
 from django.urls import reverse
 from django.test import Client
 
-from django.db.models.query import QuerySet
-
-from trello.models import Board
+from trello.models import Board, Card, List
+from trello.ordering import spaced_positions
+from trello.pagination import Page
 from trello.views import CreateBoardView
 
 
@@ -74,7 +75,7 @@ class TestCreateBoardView:
 
         Verifies that the context dictionary contains the expected
         keys with their default values, and ensures that the 'boards'
-        key is of type `QuerySet`.
+        key holds the evaluated first page of boards.
 
         Returns:
             None
@@ -90,7 +91,8 @@ class TestCreateBoardView:
         # Verify default values
         assert context["show_input"] is False
         assert context["message"] is None
-        assert isinstance(context["boards"], QuerySet)
+        assert isinstance(context["boards"], list)
+        assert isinstance(context["page"], Page)
 
     def test_get_context_data_custom(
         self, view_instance: CreateBoardView
@@ -132,6 +134,21 @@ class TestCreateBoardView:
         # Check that 'show_input' is in the context and its value is False
         assert response.context["show_input"] is False
 
+    def test_listing_scripts(self, client: Client) -> None:
+        """
+        Test that the page title is plain text and the drag-and-drop script
+        is included once.
+
+        Args:
+            client (Client): The Django test client.
+        """
+        Board.objects.create(title="Draggable")
+        content = client.get(reverse("create_board")).content.decode()
+        title = content.split("<title>")[1].split("</title>")[0]
+
+        assert title.strip() == "Boards"
+        assert content.count('addEventListener("dragstart"') == 1
+
     def test_post_show_input(self, client: Client) -> None:
         """
         Test that clicking 'Create' shows the input field for the board title.
@@ -169,6 +186,102 @@ class TestCreateBoardView:
             response["Location"] == expected_url
         ), "Redirected URL does not match the expected URL."
 
+    def test_post_create_board_duplicate_ignores_case(
+        self, client: Client
+    ) -> None:
+        """
+        Test that a title differing only by case counts as a duplicate.
+
+        Args:
+            client (Client): The Django test client.
+        """
+        Board.objects.create(title="My_Board")
+        url = reverse("create_board")
+
+        response = client.post(url, {"board_title": "MY_BOARD"})
+
+        assert response.status_code == 302
+        assert response["Location"] == url
+        assert Board.objects.count() == 1
+
+        # The redirected page shows the error once, with the form open
+        response = client.get(url)
+        assert response.context["show_input"] is True
+        assert response.context["message"] == (
+            "A board named 'MY_BOARD' already exists!"
+        )
+        assert "already exists!" in response.content.decode()
+        assert client.get(url).context["message"] is None
+
+    def test_fragment_show_input(
+        self, client: Client, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """
+        Test that the header form fragment is rendered without any query.
+
+        Args:
+            client (Client): The Django test client.
+            django_assert_num_queries (DjangoAssertNumQueries): Counts the
+                queries made by the request.
+        """
+        Board.objects.create(title="Listed")
+
+        with django_assert_num_queries(0):
+            response = client.post(
+                reverse("create_board"),
+                {"show_input": "true"},
+                headers={"x-fragment": "header-form"},
+            )
+
+        content = response.content.decode()
+        assert response.status_code == 200
+        assert '<div id="header-form">' in content
+        assert '<input type="text" id="board_title"' in content
+        assert "Listed" not in content
+        assert "<html" not in content
+
+    def test_fragment_duplicate_title(
+        self, client: Client, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """
+        Test that a duplicate title in fragment mode never loads the listing.
+
+        Args:
+            client (Client): The Django test client.
+            django_assert_num_queries (DjangoAssertNumQueries): Counts the
+                queries made by the request.
+        """
+        Board.objects.create(title="My_Board")
+
+        with django_assert_num_queries(1):
+            response = client.post(
+                reverse("create_board"),
+                {"board_title": "my_board"},
+                headers={"x-fragment": "header-form"},
+            )
+
+        assert response.status_code == 422
+        assert "A board named &#x27;my_board&#x27; already exists!" in (
+            response.content.decode()
+        )
+
+    def test_fragment_create_board(self, client: Client) -> None:
+        """
+        Test that a board created in fragment mode is named in `Location`.
+
+        Args:
+            client (Client): The Django test client.
+        """
+        response = client.post(
+            reverse("create_board"),
+            {"board_title": "Fresh"},
+            headers={"x-fragment": "header-form"},
+        )
+
+        assert response.status_code == 201
+        assert response["Location"] == "/boards/Fresh/"
+        assert response.content == b""
+
 
 class TestBoardDetailView:
     """Test case for the `BoardDetailView`."""
@@ -206,3 +319,88 @@ class TestBoardDetailView:
         assert (
             "test_board" in response.content.decode()
         ), "Board title is not present in the response."
+
+    @pytest.mark.django_db
+    def test_get_board_detail_view_ignores_case(self) -> None:
+        """
+        Test that `BoardDetailView` finds a board regardless of title case.
+
+        Raises:
+            AssertionError: If the board is not found by a differently
+                            cased title.
+        """
+        Board.objects.create(title="Test_Board")
+
+        response = Client().get(reverse("board_detail", args=["test_board"]))
+
+        assert response.status_code == 200
+        assert "Test_Board" in response.content.decode()
+
+    @pytest.mark.django_db
+    def test_get_board_detail_view_constant_queries(
+        self, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        """
+        Test that a large board is rendered with a fixed number of queries.
+
+        The board, its lists and its cards are loaded with one query each,
+        whatever the number of cards.
+
+        Raises:
+            AssertionError: If more than three queries are made or a card
+                            is missing from the page.
+        """
+        board = Board.objects.create(title="Large")
+        lists = List.objects.bulk_create(
+            List(board=board, title=f"List {i}", position=position)
+            for i, position in enumerate(spaced_positions(10))
+        )
+        Card.objects.bulk_create(
+            Card(list=board_list, title=f"Card {i}", position=position)
+            for board_list in lists
+            for i, position in enumerate(spaced_positions(120))
+        )
+
+        with django_assert_num_queries(3):
+            response = Client().get(reverse("board_detail", args=["Large"]))
+
+        assert response.content.decode().count('class="card"') == 1200
+
+
+@pytest.mark.django_db
+class TestMoveBoardView:
+    """Test case for the `MoveBoardView`."""
+
+    def test_move_reorders_listing(self) -> None:
+        """
+        Test that a dropped board keeps its new place in the listing.
+
+        Raises:
+            AssertionError: If the move is rejected or the listing order
+                            does not change.
+        """
+        for title in ("One", "Two", "Three"):
+            Board.objects.create(title=title)
+
+        response = Client().post(
+            reverse("move_board", args=["three"]), {"after": "one"}
+        )
+        listing = Client().get(reverse("create_board")).context["boards"]
+
+        assert response.status_code == 204
+        assert [board.title for board in listing] == ["One", "Three", "Two"]
+
+    def test_move_next_to_itself(self) -> None:
+        """
+        Test that a board cannot be placed next to itself.
+
+        Raises:
+            AssertionError: If the move is not rejected.
+        """
+        Board.objects.create(title="One")
+
+        response = Client().post(
+            reverse("move_board", args=["One"]), {"before": "One"}
+        )
+
+        assert response.status_code == 400
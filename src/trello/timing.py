@@ -0,0 +1,199 @@
+"""Per-request accounting of database and template time.
+
+`RequestTimingMiddleware` opens a `RequestTimings` for every request and
+stores it in a context variable, which follows the request into the threads
+that async views run the ORM in. Every database connection carries
+`record_query` as an execute wrapper, installed when the connection is
+opened, and templates rendered through `TimedDjangoTemplates` add their
+render time. Outside a request both hooks only read the context variable.
+
+Database time spent while a template is rendered (lazy querysets) counts
+towards both the database and the template time.
+"""
+
+import heapq
+import time
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import (
+    DjangoTemplates,
+    Template,
+    reraise,
+)
+
+SQL_MAX_LENGTH = 1000
+
+
+@dataclass
+class RequestTimings:
+    """
+    Time spent on one request, in seconds.
+
+    Attributes:
+        slowest_limit (int): The number of slowest queries to keep.
+        started (float): The `perf_counter` value at the start.
+        queries (int): The number of database queries.
+        db_time (float): The total duration of the queries.
+        template_time (float): The total duration of template rendering.
+        slowest (list[tuple[float, str]]): A min-heap of the durations and
+            SQL of the slowest queries.
+    """
+
+    slowest_limit: int = 3
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_time: float = 0.0
+    template_time: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def add_query(self, sql: str, duration: float) -> None:
+        """
+        Account for a database query.
+
+        Args:
+            sql (str): The SQL of the query, with parameter placeholders.
+            duration (float): The duration of the query.
+        """
+        self.queries += 1
+        self.db_time += duration
+        if len(self.slowest) < self.slowest_limit:
+            heapq.heappush(self.slowest, (duration, sql))
+        elif self.slowest and duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (duration, sql))
+
+    def elapsed(self) -> float:
+        """
+        Return the time since the request started.
+
+        Returns:
+            float: The elapsed time in seconds.
+        """
+        return time.perf_counter() - self.started
+
+    def slowest_queries(self) -> list[tuple[float, str]]:
+        """
+        Return the slowest queries, slowest first.
+
+        Returns:
+            list[tuple[float, str]]: The durations and SQL of the queries.
+        """
+        return sorted(self.slowest, reverse=True)
+
+
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def record_query(
+    execute: Callable,
+    sql: str,
+    params: Any,
+    many: bool,
+    context: dict,
+) -> Any:
+    """
+    Time a query for the request being handled, if any.
+
+    Args:
+        execute (Callable): The next wrapper or the cursor method.
+        sql (str): The SQL of the query.
+        params (Any): The query parameters.
+        many (bool): Whether this is an `executemany` call.
+        context (dict): The connection and cursor.
+
+    Returns:
+        Any: The result of `execute`.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add_query(sql[:SQL_MAX_LENGTH], time.perf_counter() - start)
+
+
+@receiver(connection_created)
+def instrument_connection(
+    connection: BaseDatabaseWrapper, **kwargs  # pylint: disable=W0613
+) -> None:
+    """
+    Install `record_query` on a database connection once.
+
+    Args:
+        connection (BaseDatabaseWrapper): The connection that was opened.
+        **kwargs: Remaining signal arguments, including the sender.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedTemplate(Template):
+    """A Django template whose render time counts towards the request."""
+
+    def render(self, context: Optional[dict] = None, request=None) -> str:
+        """
+        Render the template and account for the time it took.
+
+        Included templates are rendered by the engine directly, so only
+        the outermost render is timed.
+
+        Args:
+            context (dict | None): The template context.
+            request (HttpRequest | None): The request being handled.
+
+        Returns:
+            str: The rendered template.
+        """
+        timings = current_timings.get()
+        if timings is None:
+            return super().render(context, request)
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.template_time += time.perf_counter() - start
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, returning `TimedTemplate` objects."""
+
+    def from_string(self, template_code: str) -> TimedTemplate:
+        """
+        Compile a template from a string.
+
+        Args:
+            template_code (str): The template source.
+
+        Returns:
+            TimedTemplate: The compiled template.
+        """
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name: str) -> TimedTemplate:
+        """
+        Load a template by name.
+
+        Args:
+            template_name (str): The name of the template.
+
+        Returns:
+            TimedTemplate: The compiled template.
+
+        Raises:
+            TemplateDoesNotExist: If no loader finds the template.
+        """
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+            raise
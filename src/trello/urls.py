@@ -5,17 +5,85 @@ The `urlpatterns` list routes URLs to views. For more information please see:
     https://docs.djangoproject.com/en/5.1/topics/http/urls/
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
-from trello.views import CreateBoardView, redirect_to_boards, BoardDetailView
+from django.views import View
+from trello.api import (
+    BoardAutocompleteView,
+    BoardDetailAPIView,
+    BoardExportView,
+    BoardImportView,
+    BoardListAPIView,
+    BoardSearchAPIView,
+)
+from trello.async_views import AsyncBoardDetailView, AsyncCreateBoardView
+from trello.events import BoardEventsView
+from trello.metrics import MetricsView
+from trello.views import (
+    CreateBoardView,
+    MoveBoardView,
+    SearchBoardsView,
+    redirect_to_boards,
+    BoardDetailView,
+)
+
+board_views: tuple[type[View], type[View]]
+if settings.ASYNC_VIEWS:
+    board_views = (AsyncCreateBoardView, AsyncBoardDetailView)
+else:
+    board_views = (CreateBoardView, BoardDetailView)
 
 urlpatterns = [
     path("", redirect_to_boards, name="redirect_to_boards"),
     path("admin/", admin.site.urls),
-    path("boards/", CreateBoardView.as_view(), name="create_board"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    path("api/boards/", BoardListAPIView.as_view(), name="api_boards"),
+    path(
+        "api/boards/<int:board_id>/",
+        BoardDetailAPIView.as_view(),
+        name="api_board_detail",
+    ),
+    path(
+        "api/boards/by-title/<str:board_title>/",
+        BoardDetailAPIView.as_view(),
+        name="api_board_by_title",
+    ),
+    path(
+        "api/boards/autocomplete/",
+        BoardAutocompleteView.as_view(),
+        name="autocomplete_boards",
+    ),
+    path(
+        "api/boards/search/",
+        BoardSearchAPIView.as_view(),
+        name="api_search_boards",
+    ),
+    path(
+        "api/boards/events/",
+        BoardEventsView.as_view(),
+        name="board_events",
+    ),
+    path(
+        "api/boards/export/",
+        BoardExportView.as_view(),
+        name="export_boards",
+    ),
+    path(
+        "api/boards/import/",
+        BoardImportView.as_view(),
+        name="import_boards",
+    ),
+    path("search/", SearchBoardsView.as_view(), name="search_boards"),
+    path("boards/", board_views[0].as_view(), name="create_board"),
     path(
         "boards/<str:board_title>/",
-        BoardDetailView.as_view(),
+        board_views[1].as_view(),
         name="board_detail",
     ),
+    path(
+        "boards/<str:board_title>/move/",
+        MoveBoardView.as_view(),
+        name="move_board",
+    ),
 ]
@@ -4,15 +4,43 @@ import logging
 
 from typing import Optional
 
+from django.conf import settings
+from django.contrib import messages
 from django.views import View
 from django.urls import reverse
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseRedirect,
+)
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
 
-from trello.models import Board
+from trello.cache import (
+    CSRF_PLACEHOLDER,
+    CachedPage,
+    board_etag,
+    board_last_modified,
+    get_board_page,
+    listing_etag,
+    listing_version,
+    set_board_page,
+)
+from trello.http import conditional_response
+from trello.metrics import count_creation
+from trello.models import Board, normalize_title
+from trello.pagination import KeysetPaginator, Page
+from trello.search import search_boards
+from trello.services import board_detail_queryset, create_board, move_board
 
 logger = logging.getLogger(__name__)
 
+LISTING_ORDER = ("rank", "id")
+HEADER_FORM_TEMPLATE = "partials/header_form.html"
+FRAGMENT_HEADER = "X-Fragment"
+
 
 def redirect_to_boards(request: HttpRequest) -> HttpResponseRedirect:
     """Redirects the user to the boards page.
@@ -30,31 +58,201 @@ def redirect_to_boards(request: HttpRequest) -> HttpResponseRedirect:
     return HttpResponseRedirect("/boards/")
 
 
+def board_url(board: Board) -> str:
+    """Returns the URL of the detail page of a board.
+
+    Args:
+        board (Board): The board.
+
+    Returns:
+        str: The path of the board's page.
+    """
+    return reverse("board_detail", kwargs={"board_title": board.title})
+
+
+def creation_error(board_title: str) -> str:
+    """Returns the message explaining why a board was not created.
+
+    Args:
+        board_title (str): The submitted, stripped board title.
+
+    Returns:
+        str: The error message to display on the page.
+    """
+    if board_title:
+        # The board already exists
+        return f"A board named '{board_title}' already exists!"
+    return "The name of the board cannot be empty!"
+
+
+def wants_fragment(request: HttpRequest) -> bool:
+    """Tells whether a request asks for the header form fragment only.
+
+    The script of the header form sends `X-Fragment: header-form`, so it can
+    swap the form in place instead of reloading the whole boards page.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request object.
+
+    Returns:
+        bool: True when only the header form should be rendered.
+    """
+    return request.headers.get(FRAGMENT_HEADER) == "header-form"
+
+
+def header_form_response(
+    request: HttpRequest,
+    show_input: bool,
+    message: Optional[str] = None,
+    status: int = 200,
+) -> HttpResponse:
+    """Renders the header form on its own, without loading any board.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request object.
+        show_input (bool): Whether to show the input field.
+        message (str): The message to display next to the input field.
+        status (int): The status code of the response.
+
+    Returns:
+        HttpResponse: The rendered fragment.
+    """
+    context = {"show_input": show_input, "message": message}
+    return render(request, HEADER_FORM_TEMPLATE, context, status=status)
+
+
+def creation_succeeded(request: HttpRequest, board: Board) -> HttpResponse:
+    """Sends the browser to the page of a newly created board.
+
+    Fragment requests get a 201 response naming the page in `Location`,
+    which the script follows; a redirect would make `fetch` download the
+    board page only to throw it away.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request object.
+        board (Board): The created board.
+
+    Returns:
+        HttpResponse: The 201 response or the redirect.
+    """
+    count_creation("created")
+    if wants_fragment(request):
+        response = HttpResponse(status=201)
+        response.headers["Location"] = board_url(board)
+        return response
+    return redirect(board_url(board))
+
+
+def creation_failed(request: HttpRequest, board_title: str) -> HttpResponse:
+    """Reports a board that could not be created.
+
+    Fragment requests get the header form with the error, with status 422.
+    Other requests follow Post/Redirect/Get: the error is stored as a flash
+    message and the browser is sent back to the boards page, so reloading
+    it does not resubmit the form.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request object.
+        board_title (str): The submitted, stripped board title.
+
+    Returns:
+        HttpResponse: The fragment or the redirect.
+    """
+    count_creation("duplicate" if board_title else "empty")
+    message = creation_error(board_title)
+    if wants_fragment(request):
+        return header_form_response(request, True, message, status=422)
+    messages.error(request, message)
+    return redirect("create_board")
+
+
+def pending_message(request: HttpRequest) -> Optional[str]:
+    """Pops the flash message left by a failed board creation, if any.
+
+    Args:
+        request (HttpRequest): The incoming HTTP request object.
+
+    Returns:
+        str | None: The message, or None when there is none.
+    """
+    for message in messages.get_messages(request):
+        return str(message)
+    return None
+
+
+def listing_paginator() -> KeysetPaginator:
+    """Returns the paginator of the boards listing.
+
+    Returns:
+        KeysetPaginator: Pages of boards in the order users dragged them into.
+    """
+    return KeysetPaginator(
+        Board.objects.all(),
+        page_size=settings.BOARDS_PAGE_SIZE,
+        ordering=LISTING_ORDER,
+    )
+
+
+def boards_context(
+    page: Page, show_input: bool, message: Optional[str]
+) -> dict:
+    """Builds the template context of the boards page.
+
+    Args:
+        page (Page): The page of boards to display.
+        show_input (bool): Whether to show the input field.
+        message (str): The message to display on the page.
+
+    Returns:
+        dict: The context dictionary for the template.
+    """
+    return {
+        "show_input": show_input,
+        "message": message,
+        "boards": page.items,
+        "page": page,
+    }
+
+
 class CreateBoardView(View):
     """Handles board-related operations."""
 
     template_name = "boards.html"
 
     def get_context_data(
-        self, show_input: bool = False, message: Optional[str] = None
+        self,
+        show_input: bool = False,
+        message: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
     ) -> dict:
         """
         Constructs the context for rendering the template.
 
+        Only a single page of boards is loaded, in the users' order.
+
         Args:
             show_input (bool): Whether to show the input field.
             message (str): The message to display on the page.
+            after (str): Cursor of the page preceding the one to display.
+            before (str): Cursor of the page following the one to display.
 
         Returns:
             dict: The context dictionary for the template.
         """
-        boards = Board.objects.all()
-        return {"show_input": show_input, "message": message, "boards": boards}
+        page = listing_paginator().get_page(after=after, before=before)
+        return boards_context(page, show_input, message)
 
     def get(self, request: HttpRequest) -> HttpResponse:
         """
         Handles GET requests to render the board creation page.
 
+        The ETag of the listing digests the listing version kept in the
+        cache, so an unchanged page is answered with a 304 without any
+        query, before any board is loaded or rendered.
+        After a failed creation the page is rendered with the form open and
+        the error, without validators, so no cached copy can hide it.
+
         Args:
             request (HttpRequest): The HTTP request object.
 
@@ -62,22 +260,48 @@ class CreateBoardView(View):
             HttpResponse: A response rendering the 'boards.html' template
                           with default context.
         """
-        return render(request, self.template_name, self.get_context_data())
+        message = pending_message(request)
+        if message is not None:
+            context = self.get_context_data(show_input=True, message=message)
+            return render(request, self.template_name, context)
+
+        # No Last-Modified: deletions leave the latest update time as it
+        # was, so only the ETag, renewed by every write, sees every change.
+        return conditional_response(
+            request,
+            etag=listing_etag(listing_version(), request.get_full_path()),
+            last_modified=None,
+            render=lambda: render(
+                request,
+                self.template_name,
+                self.get_context_data(
+                    after=request.GET.get("after"),
+                    before=request.GET.get("before"),
+                ),
+            ),
+        )
 
     def post(self, request: HttpRequest) -> HttpResponse:
         """
         Handles POST requests to create a new board.
 
+        Requests sent by the header form script get only the header form
+        back, so toggling the form or reporting an error never loads the
+        listing; the full page remains the fallback without JavaScript.
+
         Args:
             request (HttpRequest): The HTTP request object containing
                                    POST data.
 
         Returns:
-            HttpResponse: A response rendering the 'boards.html' template
-                          or redirecting to a newly created board's page.
+            HttpResponse: A response rendering the header form or the
+                          'boards.html' template, or redirecting to a newly
+                          created board's page or back to the listing.
         """
         if "show_input" in request.POST:
             # Show the form
+            if wants_fragment(request):
+                return header_form_response(request, show_input=True)
             context = self.get_context_data(show_input=True)
             return render(request, self.template_name, context)
 
@@ -86,21 +310,11 @@ class CreateBoardView(View):
             board_title = request.POST.get("board_title", "").strip()
             if board_title:
                 # Creating a Board object and redirecting it to the board page
-                board, created = Board.objects.get_or_create(title=board_title)
-                if created:
-                    return redirect(
-                        reverse(
-                            "board_detail", kwargs={"board_title": board.title}
-                        )
-                    )
-                # If the board already exists, we display a message
-                message = f"A board named '{board_title}' already exists!"
-            else:
-                message = "The name of the board cannot be empty!"
-
-            # We return the page with the error message
-            context = self.get_context_data(show_input=True, message=message)
-            return render(request, self.template_name, context)
+                board = create_board(board_title)
+                if board is not None:
+                    return creation_succeeded(request, board)
+
+            return creation_failed(request, board_title)
 
         return render(request, self.template_name, self.get_context_data())
 
@@ -114,6 +328,12 @@ class BoardDetailView(View):
         """
         Handles GET requests to display a specific board.
 
+        The board is looked up case-insensitively by its normalized title.
+        Rendered pages are cached, so a hit touches neither the database
+        nor the template engine; a miss loads the board with its lists and
+        cards in three queries. Clients holding a current copy get a 304
+        response, on a cache miss before the page is rendered.
+
         Args:
             request (HttpRequest): The HTTP request object.
             board_title (str): The title of the board to display.
@@ -121,5 +341,112 @@ class BoardDetailView(View):
         Returns:
             HttpResponse: A response rendering the 'board_detail.html' template.
         """
-        board = get_object_or_404(Board, title=board_title)
-        return render(request, self.template_name, {"board": board})
+        normalized_title = normalize_title(board_title)
+        page = get_board_page(normalized_title)
+        if page is not None:
+            return conditional_response(
+                request,
+                etag=page.etag,
+                last_modified=page.last_modified,
+                render=lambda: self.page_response(request, page),
+            )
+
+        board = get_object_or_404(
+            board_detail_queryset(), normalized_title=normalized_title
+        )
+        return conditional_response(
+            request,
+            etag=board_etag(board),
+            last_modified=board_last_modified(board),
+            render=lambda: self.page_response(
+                request, self.render_page(request, board)
+            ),
+        )
+
+    def render_page(self, request: HttpRequest, board: Board) -> CachedPage:
+        """
+        Renders the page of a board and stores it in the cache.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            board (Board): The board to render.
+
+        Returns:
+            CachedPage: The freshly rendered page.
+        """
+        context = {"board": board, "csrf_token": CSRF_PLACEHOLDER}
+        body = render_to_string(self.template_name, context, request)
+        return set_board_page(board, body)
+
+    @staticmethod
+    def page_response(request: HttpRequest, page: CachedPage) -> HttpResponse:
+        """
+        Builds the response for a rendered page.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            page (CachedPage): The rendered page.
+
+        Returns:
+            HttpResponse: The page with the visitor's CSRF token filled in.
+        """
+        return HttpResponse(
+            page.body.replace(CSRF_PLACEHOLDER, get_token(request))
+        )
+
+
+class MoveBoardView(View):
+    """Handles dragging a board to a new place in the boards listing."""
+
+    http_method_names = ["post"]
+
+    def post(self, request: HttpRequest, board_title: str) -> HttpResponse:
+        """
+        Handles POST requests moving a board.
+
+        The form names the board to follow in `after`, or, for a board
+        dropped at the top of a page, the board to precede in `before`.
+        Without either the board moves to the top of the listing.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            board_title (str): The title of the board to move.
+
+        Returns:
+            HttpResponse: An empty 204 response, or a 400 error when the
+                          board would be placed next to itself.
+        """
+        board = get_object_or_404(
+            Board, normalized_title=normalize_title(board_title)
+        )
+        anchors = {}
+        for side in ("after", "before"):
+            title = request.POST.get(side, "").strip()
+            if title:
+                anchors[side] = get_object_or_404(
+                    Board, normalized_title=normalize_title(title)
+                )
+        if any(anchor.pk == board.pk for anchor in anchors.values()):
+            return HttpResponseBadRequest("A board cannot move next to itself.")
+        move_board(board, **anchors)
+        return HttpResponse(status=204)
+
+
+class SearchBoardsView(View):
+    """Handles searching boards by title."""
+
+    template_name = "search.html"
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """
+        Handles GET requests listing the boards matching `q`.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            HttpResponse: A response rendering the 'search.html' template.
+        """
+        query = request.GET.get("q", "").strip()
+        context = {"query": query, "boards": search_boards(query)}
+        return render(request, self.template_name, context)
@@ -11,6 +11,9 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from trello.templating import warm_templates
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "trello.settings")
 
 application = get_wsgi_application()
+warm_templates()